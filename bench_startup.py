@@ -0,0 +1,82 @@
+"""
+启动时间测试：python bench_startup.py [次数]
+每次在新进程中创建主窗口，记录 (从进程内开始计时，不含解释器自身的启动时间):
+    import:       导入 main.py (界面模块) 的时间
+    first_paint:  主窗口第一次绘制的时间 (time-to-first-paint)
+    interactive:  Function 创建完成、按钮槽函数已连接的时间 (time-to-interactive)
+    warm:         后台预加载 (torch、sklearn、pyttsx3 等) 完成的时间，没有后台预加载时为空
+没有显示器时使用 QT_QPA_PLATFORM=offscreen 运行
+"""
+import json
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+
+
+def child():
+    t0 = time.perf_counter()
+    result = {}
+
+    # 与直接运行 main.py 时的导入过程一致 (modules.ui_functions 会 from main import *)
+    main = runpy.run_path("main.py", run_name="__bench__")
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+    result["import"] = time.perf_counter() - t0
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and "first_paint" not in result:
+                result["first_paint"] = time.perf_counter() - t0
+            return False
+
+    app = QApplication(sys.argv)
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    window = main["MainWindow"]()
+
+    def poll():
+        now = time.perf_counter() - t0
+        if "interactive" not in result and window.func is not None:
+            result["interactive"] = now
+        # 没有 warmup_thread 属性说明没有后台预加载；属性为 None 表示还没开始
+        has_warmup = hasattr(window, "warmup_thread")
+        warmup = getattr(window, "warmup_thread", None)
+        if warmup is not None and not warmup.is_alive() and "warm" not in result:
+            result["warm"] = now
+        done = "interactive" in result and "first_paint" in result and (not has_warmup or "warm" in result)
+        if done or now > 120:
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(poll)
+    timer.start(5)
+    app.exec()
+    window.close()
+    print(json.dumps(result))
+
+
+def main(runs):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, __file__, "--child"], env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    for key in ("import", "first_paint", "interactive", "warm"):
+        values = [r[key] for r in results if key in r]
+        if values:
+            print(f"{key:12s} 中位数 {statistics.median(values) * 1000:8.0f} ms  (最小 {min(values) * 1000:.0f} ms, 最大 {max(values) * 1000:.0f} ms)")
+        else:
+            print(f"{key:12s} -")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,24 @@
+"""
+编译界面资源：python build_resources.py
+把 resources.qrc 编译为二进制资源文件 modules/resources.rcc，程序运行时由 modules/resources_rc.py 注册，
+修改了 images/ 下的图标或 resources.qrc 后需要重新运行
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        sys.exit("没有找到 pyside6-rcc，请先安装 PySide6")
+    output = os.path.join(ROOT, "modules", "resources.rcc")
+    subprocess.run([rcc, "--binary", os.path.join(ROOT, "resources.qrc"), "-o", output], cwd=ROOT, check=True)
+    print(f"已生成 {output} ({os.path.getsize(output) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+生成界面代码：python build_ui.py
+用 pyside6-uic 把 main.ui 编译为 modules/ui_main.py，再把 stackedWidget 中除 EAGER_PAGES 以外的页面
+拆分成按需构建的方法：
+    setup_<页面名>()        创建页面控件 (原 setupUi 中该页面的代码)
+    retranslate_<页面名>()  设置页面文字 (原 retranslateUi 中该页面的代码)
+    setupPage(页面名)       第一次切换到页面时调用，已经构建过时直接返回页面
+没有打开过的页面 (例如控件演示页) 不会创建任何控件；修改 main.ui 后需要重新运行
+"""
+import ast
+import builtins
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+EAGER_PAGES = ("home",)  # 启动时就需要显示的页面
+INDENT = " " * 8
+
+
+def _names(node):
+    """语句中 (赋值的局部变量, 读取的局部变量, 访问的 self 属性)"""
+    stored, loaded, attrs = set(), set(), set()
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name):
+            (stored if isinstance(n.ctx, ast.Store) else loaded).add(n.id)
+        elif isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name) and n.value.id == "self":
+            attrs.add(n.attr)
+    return stored, loaded, attrs
+
+
+def _receiver(node):
+    """语句修改的局部变量：x = ... 或 x.method(...)"""
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+        func = node.value.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            return func.value.id
+    return None
+
+
+def split_pages(source):
+    lines = source.splitlines()
+    tree = ast.parse(source)
+    cls = next(n for n in tree.body if isinstance(n, ast.ClassDef))
+    setup = next(f for f in cls.body if isinstance(f, ast.FunctionDef) and f.name == "setupUi")
+    retranslate = next(f for f in cls.body if isinstance(f, ast.FunctionDef) and f.name == "retranslateUi")
+
+    def text(node):
+        return "\n".join(lines[node.lineno - 1:node.end_lineno])
+
+    # 找出 stackedWidget 的各个页面在 setupUi 中的代码范围
+    body = setup.body
+    pages, start = {}, {}
+    for i, node in enumerate(body):
+        code = text(node).strip()
+        m = re.fullmatch(r"self\.(\w+) = QWidget\(\)", code)
+        if m:
+            start[m.group(1)] = i
+        m = re.fullmatch(r"self\.stackedWidget\.addWidget\(self\.(\w+)\)", code)
+        if m and m.group(1) in start and m.group(1) not in EAGER_PAGES:
+            pages[m.group(1)] = (start[m.group(1)], i)
+    in_page = {i: name for name, (a, b) in pages.items() for i in range(a, b + 1)}
+
+    owner = {}  # self 属性 -> 创建它的页面
+    for i, node in enumerate(body):
+        if i in in_page:
+            for attr in _names(node)[2]:
+                if isinstance(node, ast.Assign) and any(
+                        isinstance(t, ast.Attribute) and t.attr == attr for t in node.targets):
+                    owner.setdefault(attr, in_page[i])
+
+    ignore = set(dir(builtins)) | {"self", "MainWindow"}
+
+    def prelude(name):
+        """页面用到、但在页面外定义的局部变量 (字体、画刷、尺寸策略等)，复制它们的定义语句"""
+        a, b = pages[name]
+        stored, loaded = set(), set()
+        for node in body[a:b + 1]:
+            s, l, _ = _names(node)
+            stored |= s
+            loaded |= l
+        needed = {n for n in loaded - stored if n not in ignore and not n[0].isupper()}
+        chosen = set()
+        while True:
+            before = len(chosen)
+            for i, node in enumerate(body[:a]):
+                if _receiver(node) in needed and not _names(node)[2]:
+                    chosen.add(i)
+                    needed |= {n for n in _names(node)[1] if n not in ignore and not n[0].isupper()}
+            if len(chosen) == before:
+                break
+        return [text(body[i]) for i in sorted(chosen)]
+
+    # 按页面拆分 retranslateUi：不访问 self 属性的语句跟随定义它所用局部变量的语句
+    retranslate_parts = {name: [] for name in pages}
+    common, local_owner = [], {}
+    for node in retranslate.body:
+        stored, loaded, attrs = _names(node)
+        page = next((owner[a] for a in attrs if a in owner), None)
+        if page is None and not attrs:
+            page = next((local_owner[n] for n in loaded if n in local_owner), None)
+        for n in stored:
+            local_owner[n] = page
+        (retranslate_parts[page] if page else common).append(text(node))
+
+    # 页面专用的自定义控件 (非 PySide6 的导入) 在构建页面时才导入
+    custom_imports = [n for n in tree.body if isinstance(n, ast.ImportFrom)
+                      and n.module and not n.module.startswith("PySide6") and n.level == 0]
+
+    out = []
+    page_imports = {name: [] for name in pages}
+    for node in custom_imports:
+        used = {alias.asname or alias.name for alias in node.names}
+        users = {name for name, (a, b) in pages.items()
+                 if any(used & _names(n)[1] for n in body[a:b + 1])}
+        outside = any(used & _names(n)[1] for i, n in enumerate(body) if i not in in_page)
+        if users and not outside:
+            for name in users:
+                page_imports[name].append(text(node).strip())
+
+    moved_imports = {line for imports in page_imports.values() for line in imports}
+    head = lines[:cls.lineno - 1]
+    head = [line for line in head if line.strip() not in moved_imports]
+    out.extend(head)
+    out.append(lines[cls.lineno - 1])
+    out.append("    # 按需构建的页面 (由 build_ui.py 从 setupUi 中拆分)，第一次切换到页面时调用 setupPage 构建")
+    out.append(f"    LAZY_PAGES = {tuple(pages)!r}")
+    out.append("")
+
+    # setupUi：去掉按需构建的页面
+    out.append(lines[setup.lineno - 1])
+    for i, node in enumerate(body):
+        if i not in in_page:
+            out.append(text(node))
+    out.append("    # setupUi")
+    out.append("")
+    out.append("    def setupPage(self, name):")
+    out.append(f'{INDENT}"""构建页面 (已经构建过时直接返回)，返回页面控件"""')
+    out.append(f"{INDENT}page = getattr(self, name, None)")
+    out.append(f"{INDENT}if page is None:")
+    out.append(f'{INDENT}    getattr(self, f"setup_{{name}}")()')
+    out.append(f'{INDENT}    getattr(self, f"retranslate_{{name}}")()')
+    out.append(f"{INDENT}    page = getattr(self, name)")
+    out.append(f"{INDENT}return page")
+    out.append("")
+
+    for name, (a, b) in pages.items():
+        out.append(f"    def setup_{name}(self):")
+        for line in page_imports[name]:
+            out.append(INDENT + line)
+        out.extend(prelude(name))
+        for node in body[a:b + 1]:
+            out.append(text(node))
+        out.append("")
+
+    out.append(lines[retranslate.lineno - 1])
+    out.extend(common)
+    out.append(f"{INDENT}for name in self.LAZY_PAGES:")
+    out.append(f"{INDENT}    if getattr(self, name, None) is not None:")
+    out.append(f'{INDENT}        getattr(self, f"retranslate_{{name}}")()')
+    out.append("    # retranslateUi")
+    out.append("")
+
+    for name in pages:
+        out.append(f"    def retranslate_{name}(self):")
+        out.extend(retranslate_parts[name] or [f"{INDENT}pass"])
+        out.append("")
+
+    return "\n".join(out).rstrip() + "\n"
+
+
+def main():
+    uic = shutil.which("pyside6-uic")
+    if uic is None:
+        sys.exit("没有找到 pyside6-uic，请先安装 PySide6")
+    source = subprocess.run([uic, os.path.join(ROOT, "main.ui")], cwd=ROOT, check=True,
+                            capture_output=True, text=True, encoding="utf-8").stdout
+    source = source.replace("\nimport resources_rc\n", "\nfrom . import resources_rc\n")
+    output = os.path.join(ROOT, "modules", "ui_main.py")
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(split_pages(source))
+    print(f"已生成 {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,10 +63,6 @@ class MainWindow(QMainWindow):
         # ///////////////////////////////////////////////////////////////
         UIFunctions.uiDefinitions(self)
 
-        # QTableWidget PARAMETERS
-        # ///////////////////////////////////////////////////////////////
-        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
         # BUTTONS CLICK
         # ///////////////////////////////////////////////////////////////
 
@@ -88,23 +84,38 @@ class MainWindow(QMainWindow):
             UIFunctions.toggleRightBox(self, True)
         widgets.settingsTopBtn.clicked.connect(openCloseRightBox)
 
+        # PAGES
+        # 除首页外的页面在第一次切换到时才创建 (Ui_MainWindow.setupPage)，
+        # 页面创建后再执行对应的初始化 (设置表格、连接按钮槽函数)
+        # ///////////////////////////////////////////////////////////////
+        self.pages = {
+            "btn_home": "home",
+            "btn_widgets": "widgets",
+            "btn_page1": "page1",
+            "btn_page2": "page2",
+            "btn_page3": "page3",
+        }
+        self.pageSetups = {
+            "widgets": self.setupWidgetsPage,
+            "page1": self.setupPage1,
+            "page2": self.setupPage2,
+            "page3": self.setupPage3,
+        }
+
         # SHOW APP
         # ///////////////////////////////////////////////////////////////
         self.show()
 
         # SET CUSTOM THEME
         # ///////////////////////////////////////////////////////////////
-        useCustomTheme = False
+        self.useCustomTheme = False
         themeFile = "themes\py_dracula_light.qss"
 
         # SET THEME AND HACKS
-        if useCustomTheme:
+        if self.useCustomTheme:
             # LOAD AND APPLY STYLE
             UIFunctions.theme(self, themeFile, True)
 
-            # SET HACKS
-            AppFunctions.setThemeHack(self)
-
         # SET HOME PAGE AND SELECT MENU
         # ///////////////////////////////////////////////////////////////
         widgets.stackedWidget.setCurrentWidget(widgets.home)
@@ -116,16 +127,40 @@ class MainWindow(QMainWindow):
         from src import Function
         self.func = Function(self.ui)
 
+        # 训练、推理、语音播报用到的库在界面显示后由后台线程预加载
+        from src.devices import warm_up
+        self.warmup_thread = None
+        QTimer.singleShot(0, lambda: setattr(self, "warmup_thread", warm_up()))
+
+    # PAGES
+    # 页面第一次创建后的初始化
+    # ///////////////////////////////////////////////////////////////
+    def showPage(self, name):
+        built = getattr(widgets, name, None) is not None
+        page = widgets.setupPage(name)
+        if not built and name in self.pageSetups:
+            self.pageSetups[name]()
+        widgets.stackedWidget.setCurrentWidget(page)
+
+    def setupWidgetsPage(self):
+        # QTableWidget PARAMETERS
+        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # SET HACKS
+        if self.useCustomTheme:
+            AppFunctions.setThemeHack(self)
+
+    def setupPage1(self):
         # init page1 slots
         self.ui.btn_connect_ble.clicked.connect(self.func.connect_ble)
 
+    def setupPage2(self):
         # init page2 slots
         self.ui.btn_get_message.clicked.connect(self.func.get_message)
 
+    def setupPage3(self):
         # init page3 slots
         self.ui.btn_start_exp.clicked.connect(self.func.start_experiment)
         self.ui.btn_test_model.clicked.connect(self.func.test_model)
-        
 
     # BUTTONS CLICK
     # Post here your functions for clicked buttons
@@ -135,31 +170,9 @@ class MainWindow(QMainWindow):
         btn = self.sender()
         btnName = btn.objectName()
 
-        # SHOW HOME PAGE
-        if btnName == "btn_home":
-            widgets.stackedWidget.setCurrentWidget(widgets.home)
-            UIFunctions.resetStyle(self, btnName)
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
-
-        # SHOW WIDGETS PAGE
-        if btnName == "btn_widgets":
-            widgets.stackedWidget.setCurrentWidget(widgets.widgets)
-            UIFunctions.resetStyle(self, btnName)
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
-
-        # SHOW NEW PAGE
-        if btnName == "btn_page1":
-            widgets.stackedWidget.setCurrentWidget(widgets.page1) # SET PAGE
-            UIFunctions.resetStyle(self, btnName) # RESET ANOTHERS BUTTONS SELECTED
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
-
-        if btnName == "btn_page2":
-            widgets.stackedWidget.setCurrentWidget(widgets.page2) # SET PAGE
-            UIFunctions.resetStyle(self, btnName) # RESET ANOTHERS BUTTONS SELECTED
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
-
-        if btnName == "btn_page3":
-            widgets.stackedWidget.setCurrentWidget(widgets.page3) # SET PAGE
+        # SHOW PAGE
+        if btnName in self.pages:
+            self.showPage(self.pages[btnName]) # SET PAGE
             UIFunctions.resetStyle(self, btnName) # RESET ANOTHERS BUTTONS SELECTED
             btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
 
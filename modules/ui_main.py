@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'main.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.9.3
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -24,10 +24,12 @@ from PySide6.QtWidgets import (QAbstractItemView, QAbstractScrollArea, QApplicat
     QSpinBox, QStackedWidget, QTableWidget, QTableWidgetItem,
     QTextEdit, QVBoxLayout, QWidget)
 
-from pyqtgraph import PlotWidget
 from . import resources_rc
 
 class Ui_MainWindow(object):
+    # 按需构建的页面 (由 build_ui.py 从 setupUi 中拆分)，第一次切换到页面时调用 setupPage 构建
+    LAZY_PAGES = ('page2', 'page3', 'page4', 'widgets', 'page1')
+
     def setupUi(self, MainWindow):
         if not MainWindow.objectName():
             MainWindow.setObjectName(u"MainWindow")
@@ -622,9 +624,7 @@ class Ui_MainWindow(object):
         font3.setItalic(False)
         self.titleLeftDescription.setFont(font3)
         self.titleLeftDescription.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignTop)
-
         self.verticalLayout_3.addWidget(self.topLogoInfo)
-
         self.leftMenuFrame = QFrame(self.leftMenuBg)
         self.leftMenuFrame.setObjectName(u"leftMenuFrame")
         self.leftMenuFrame.setFrameShape(QFrame.Shape.NoFrame)
@@ -654,12 +654,8 @@ class Ui_MainWindow(object):
         self.toggleButton.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.toggleButton.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.toggleButton.setStyleSheet(u"background-image: url(:/icons/images/icons/icon_menu.png);")
-
         self.verticalLayout_4.addWidget(self.toggleButton)
-
-
         self.verticalMenuLayout.addWidget(self.toggleBox)
-
         self.topMenu = QFrame(self.leftMenuFrame)
         self.topMenu.setObjectName(u"topMenu")
         self.topMenu.setFrameShape(QFrame.Shape.NoFrame)
@@ -677,9 +673,7 @@ class Ui_MainWindow(object):
         self.btn_home.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_home.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_home.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-home.png);")
-
         self.verticalLayout_8.addWidget(self.btn_home)
-
         self.btn_widgets = QPushButton(self.topMenu)
         self.btn_widgets.setObjectName(u"btn_widgets")
         sizePolicy.setHeightForWidth(self.btn_widgets.sizePolicy().hasHeightForWidth())
@@ -689,9 +683,7 @@ class Ui_MainWindow(object):
         self.btn_widgets.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_widgets.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_widgets.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-gamepad.png);")
-
         self.verticalLayout_8.addWidget(self.btn_widgets)
-
         self.btn_page1 = QPushButton(self.topMenu)
         self.btn_page1.setObjectName(u"btn_page1")
         sizePolicy.setHeightForWidth(self.btn_page1.sizePolicy().hasHeightForWidth())
@@ -701,9 +693,7 @@ class Ui_MainWindow(object):
         self.btn_page1.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_page1.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_page1.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-file.png);")
-
         self.verticalLayout_8.addWidget(self.btn_page1)
-
         self.btn_page2 = QPushButton(self.topMenu)
         self.btn_page2.setObjectName(u"btn_page2")
         sizePolicy.setHeightForWidth(self.btn_page2.sizePolicy().hasHeightForWidth())
@@ -713,9 +703,7 @@ class Ui_MainWindow(object):
         self.btn_page2.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_page2.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_page2.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-x.png);")
-
         self.verticalLayout_8.addWidget(self.btn_page2)
-
         self.btn_page3 = QPushButton(self.topMenu)
         self.btn_page3.setObjectName(u"btn_page3")
         sizePolicy.setHeightForWidth(self.btn_page3.sizePolicy().hasHeightForWidth())
@@ -725,12 +713,8 @@ class Ui_MainWindow(object):
         self.btn_page3.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_page3.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_page3.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-alarm.png);")
-
         self.verticalLayout_8.addWidget(self.btn_page3)
-
-
         self.verticalMenuLayout.addWidget(self.topMenu, 0, Qt.AlignmentFlag.AlignTop)
-
         self.bottomMenu = QFrame(self.leftMenuFrame)
         self.bottomMenu.setObjectName(u"bottomMenu")
         self.bottomMenu.setFrameShape(QFrame.Shape.NoFrame)
@@ -748,18 +732,10 @@ class Ui_MainWindow(object):
         self.toggleLeftBox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.toggleLeftBox.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.toggleLeftBox.setStyleSheet(u"background-image: url(:/icons/images/icons/icon_settings.png);")
-
         self.verticalLayout_9.addWidget(self.toggleLeftBox)
-
-
         self.verticalMenuLayout.addWidget(self.bottomMenu, 0, Qt.AlignmentFlag.AlignBottom)
-
-
         self.verticalLayout_3.addWidget(self.leftMenuFrame)
-
-
         self.appLayout.addWidget(self.leftMenuBg)
-
         self.extraLeftBox = QFrame(self.bgApp)
         self.extraLeftBox.setObjectName(u"extraLeftBox")
         self.extraLeftBox.setMinimumSize(QSize(0, 0))
@@ -791,15 +767,11 @@ class Ui_MainWindow(object):
         self.extraIcon.setMaximumSize(QSize(20, 20))
         self.extraIcon.setFrameShape(QFrame.Shape.NoFrame)
         self.extraIcon.setFrameShadow(QFrame.Shadow.Raised)
-
         self.extraTopLayout.addWidget(self.extraIcon, 0, 0, 1, 1)
-
         self.extraLabel = QLabel(self.extraTopBg)
         self.extraLabel.setObjectName(u"extraLabel")
         self.extraLabel.setMinimumSize(QSize(150, 0))
-
         self.extraTopLayout.addWidget(self.extraLabel, 0, 1, 1, 1)
-
         self.extraCloseColumnBtn = QPushButton(self.extraTopBg)
         self.extraCloseColumnBtn.setObjectName(u"extraCloseColumnBtn")
         self.extraCloseColumnBtn.setMinimumSize(QSize(28, 28))
@@ -809,15 +781,9 @@ class Ui_MainWindow(object):
         icon.addFile(u":/icons/images/icons/icon_close.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.extraCloseColumnBtn.setIcon(icon)
         self.extraCloseColumnBtn.setIconSize(QSize(20, 20))
-
         self.extraTopLayout.addWidget(self.extraCloseColumnBtn, 0, 2, 1, 1)
-
-
         self.verticalLayout_5.addLayout(self.extraTopLayout)
-
-
         self.extraColumLayout.addWidget(self.extraTopBg)
-
         self.extraContent = QFrame(self.extraLeftBox)
         self.extraContent.setObjectName(u"extraContent")
         self.extraContent.setFrameShape(QFrame.Shape.NoFrame)
@@ -843,9 +809,7 @@ class Ui_MainWindow(object):
         self.btn_share.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_share.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_share.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-share-boxed.png);")
-
         self.verticalLayout_11.addWidget(self.btn_share)
-
         self.btn_adjustments = QPushButton(self.extraTopMenu)
         self.btn_adjustments.setObjectName(u"btn_adjustments")
         sizePolicy.setHeightForWidth(self.btn_adjustments.sizePolicy().hasHeightForWidth())
@@ -855,9 +819,7 @@ class Ui_MainWindow(object):
         self.btn_adjustments.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_adjustments.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_adjustments.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-equalizer.png);")
-
         self.verticalLayout_11.addWidget(self.btn_adjustments)
-
         self.btn_more = QPushButton(self.extraTopMenu)
         self.btn_more.setObjectName(u"btn_more")
         sizePolicy.setHeightForWidth(self.btn_more.sizePolicy().hasHeightForWidth())
@@ -867,12 +829,8 @@ class Ui_MainWindow(object):
         self.btn_more.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.btn_more.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.btn_more.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-layers.png);")
-
         self.verticalLayout_11.addWidget(self.btn_more)
-
-
         self.verticalLayout_12.addWidget(self.extraTopMenu, 0, Qt.AlignmentFlag.AlignTop)
-
         self.extraCenter = QFrame(self.extraContent)
         self.extraCenter.setObjectName(u"extraCenter")
         self.extraCenter.setFrameShape(QFrame.Shape.NoFrame)
@@ -885,25 +843,15 @@ class Ui_MainWindow(object):
         self.textEdit.setStyleSheet(u"background: transparent;")
         self.textEdit.setFrameShape(QFrame.Shape.NoFrame)
         self.textEdit.setReadOnly(True)
-
         self.verticalLayout_10.addWidget(self.textEdit)
-
-
         self.verticalLayout_12.addWidget(self.extraCenter)
-
         self.extraBottom = QFrame(self.extraContent)
         self.extraBottom.setObjectName(u"extraBottom")
         self.extraBottom.setFrameShape(QFrame.Shape.NoFrame)
         self.extraBottom.setFrameShadow(QFrame.Shadow.Raised)
-
         self.verticalLayout_12.addWidget(self.extraBottom)
-
-
         self.extraColumLayout.addWidget(self.extraContent)
-
-
         self.appLayout.addWidget(self.extraLeftBox)
-
         self.contentBox = QFrame(self.bgApp)
         self.contentBox.setObjectName(u"contentBox")
         self.contentBox.setFrameShape(QFrame.Shape.NoFrame)
@@ -953,12 +901,8 @@ class Ui_MainWindow(object):
 "\n"
 "")
         self.titleRightInfo.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignVCenter)
-
         self.horizontalLayout_3.addWidget(self.titleRightInfo)
-
-
         self.horizontalLayout.addWidget(self.leftBox)
-
         self.rightButtons = QFrame(self.contentTopBg)
         self.rightButtons.setObjectName(u"rightButtons")
         self.rightButtons.setMinimumSize(QSize(0, 28))
@@ -977,9 +921,7 @@ class Ui_MainWindow(object):
         icon1.addFile(u":/icons/images/icons/icon_settings.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.settingsTopBtn.setIcon(icon1)
         self.settingsTopBtn.setIconSize(QSize(20, 20))
-
         self.horizontalLayout_2.addWidget(self.settingsTopBtn)
-
         self.minimizeAppBtn = QPushButton(self.rightButtons)
         self.minimizeAppBtn.setObjectName(u"minimizeAppBtn")
         self.minimizeAppBtn.setMinimumSize(QSize(28, 28))
@@ -989,9 +931,7 @@ class Ui_MainWindow(object):
         icon2.addFile(u":/icons/images/icons/icon_minimize.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.minimizeAppBtn.setIcon(icon2)
         self.minimizeAppBtn.setIconSize(QSize(20, 20))
-
         self.horizontalLayout_2.addWidget(self.minimizeAppBtn)
-
         self.maximizeRestoreAppBtn = QPushButton(self.rightButtons)
         self.maximizeRestoreAppBtn.setObjectName(u"maximizeRestoreAppBtn")
         self.maximizeRestoreAppBtn.setMinimumSize(QSize(28, 28))
@@ -1008,9 +948,7 @@ class Ui_MainWindow(object):
         icon3.addFile(u":/icons/images/icons/icon_maximize.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.maximizeRestoreAppBtn.setIcon(icon3)
         self.maximizeRestoreAppBtn.setIconSize(QSize(20, 20))
-
         self.horizontalLayout_2.addWidget(self.maximizeRestoreAppBtn)
-
         self.closeAppBtn = QPushButton(self.rightButtons)
         self.closeAppBtn.setObjectName(u"closeAppBtn")
         self.closeAppBtn.setMinimumSize(QSize(28, 28))
@@ -1018,15 +956,9 @@ class Ui_MainWindow(object):
         self.closeAppBtn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.closeAppBtn.setIcon(icon)
         self.closeAppBtn.setIconSize(QSize(20, 20))
-
         self.horizontalLayout_2.addWidget(self.closeAppBtn)
-
-
         self.horizontalLayout.addWidget(self.rightButtons, 0, Qt.AlignmentFlag.AlignRight)
-
-
         self.verticalLayout_2.addWidget(self.contentTopBg)
-
         self.contentBottom = QFrame(self.contentBox)
         self.contentBottom.setObjectName(u"contentBottom")
         self.contentBottom.setFrameShape(QFrame.Shape.NoFrame)
@@ -1062,6 +994,129 @@ class Ui_MainWindow(object):
 "background-position: center;\n"
 "background-repeat: no-repeat;")
         self.stackedWidget.addWidget(self.home)
+        self.verticalLayout_15.addWidget(self.stackedWidget)
+        self.horizontalLayout_4.addWidget(self.pagesContainer)
+        self.extraRightBox = QFrame(self.content)
+        self.extraRightBox.setObjectName(u"extraRightBox")
+        self.extraRightBox.setMinimumSize(QSize(0, 0))
+        self.extraRightBox.setMaximumSize(QSize(0, 16777215))
+        self.extraRightBox.setFrameShape(QFrame.Shape.NoFrame)
+        self.extraRightBox.setFrameShadow(QFrame.Shadow.Raised)
+        self.verticalLayout_7 = QVBoxLayout(self.extraRightBox)
+        self.verticalLayout_7.setSpacing(0)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.themeSettingsTopDetail = QFrame(self.extraRightBox)
+        self.themeSettingsTopDetail.setObjectName(u"themeSettingsTopDetail")
+        self.themeSettingsTopDetail.setMaximumSize(QSize(16777215, 3))
+        self.themeSettingsTopDetail.setFrameShape(QFrame.Shape.NoFrame)
+        self.themeSettingsTopDetail.setFrameShadow(QFrame.Shadow.Raised)
+        self.verticalLayout_7.addWidget(self.themeSettingsTopDetail)
+        self.contentSettings = QFrame(self.extraRightBox)
+        self.contentSettings.setObjectName(u"contentSettings")
+        self.contentSettings.setFrameShape(QFrame.Shape.NoFrame)
+        self.contentSettings.setFrameShadow(QFrame.Shadow.Raised)
+        self.verticalLayout_13 = QVBoxLayout(self.contentSettings)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.topMenus = QFrame(self.contentSettings)
+        self.topMenus.setObjectName(u"topMenus")
+        self.topMenus.setFrameShape(QFrame.Shape.NoFrame)
+        self.topMenus.setFrameShadow(QFrame.Shadow.Raised)
+        self.verticalLayout_14 = QVBoxLayout(self.topMenus)
+        self.verticalLayout_14.setSpacing(0)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.btn_message = QPushButton(self.topMenus)
+        self.btn_message.setObjectName(u"btn_message")
+        sizePolicy.setHeightForWidth(self.btn_message.sizePolicy().hasHeightForWidth())
+        self.btn_message.setSizePolicy(sizePolicy)
+        self.btn_message.setMinimumSize(QSize(0, 45))
+        self.btn_message.setFont(font1)
+        self.btn_message.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.btn_message.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
+        self.btn_message.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-envelope-open.png);")
+        self.verticalLayout_14.addWidget(self.btn_message)
+        self.btn_print = QPushButton(self.topMenus)
+        self.btn_print.setObjectName(u"btn_print")
+        sizePolicy.setHeightForWidth(self.btn_print.sizePolicy().hasHeightForWidth())
+        self.btn_print.setSizePolicy(sizePolicy)
+        self.btn_print.setMinimumSize(QSize(0, 45))
+        self.btn_print.setFont(font1)
+        self.btn_print.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.btn_print.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
+        self.btn_print.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-print.png);")
+        self.verticalLayout_14.addWidget(self.btn_print)
+        self.btn_logout = QPushButton(self.topMenus)
+        self.btn_logout.setObjectName(u"btn_logout")
+        sizePolicy.setHeightForWidth(self.btn_logout.sizePolicy().hasHeightForWidth())
+        self.btn_logout.setSizePolicy(sizePolicy)
+        self.btn_logout.setMinimumSize(QSize(0, 45))
+        self.btn_logout.setFont(font1)
+        self.btn_logout.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.btn_logout.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
+        self.btn_logout.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-account-logout.png);")
+        self.verticalLayout_14.addWidget(self.btn_logout)
+        self.verticalLayout_13.addWidget(self.topMenus, 0, Qt.AlignmentFlag.AlignTop)
+        self.verticalLayout_7.addWidget(self.contentSettings)
+        self.horizontalLayout_4.addWidget(self.extraRightBox)
+        self.verticalLayout_6.addWidget(self.content)
+        self.bottomBar = QFrame(self.contentBottom)
+        self.bottomBar.setObjectName(u"bottomBar")
+        self.bottomBar.setMinimumSize(QSize(0, 22))
+        self.bottomBar.setMaximumSize(QSize(16777215, 22))
+        self.bottomBar.setFrameShape(QFrame.Shape.NoFrame)
+        self.bottomBar.setFrameShadow(QFrame.Shadow.Raised)
+        self.horizontalLayout_5 = QHBoxLayout(self.bottomBar)
+        self.horizontalLayout_5.setSpacing(0)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.creditsLabel = QLabel(self.bottomBar)
+        self.creditsLabel.setObjectName(u"creditsLabel")
+        self.creditsLabel.setMaximumSize(QSize(16777215, 16))
+        font9 = QFont()
+        font9.setFamilies([u"Segoe UI"])
+        font9.setBold(False)
+        font9.setItalic(False)
+        self.creditsLabel.setFont(font9)
+        self.creditsLabel.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignVCenter)
+        self.horizontalLayout_5.addWidget(self.creditsLabel)
+        self.version = QLabel(self.bottomBar)
+        self.version.setObjectName(u"version")
+        self.version.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+        self.horizontalLayout_5.addWidget(self.version)
+        self.frame_size_grip = QFrame(self.bottomBar)
+        self.frame_size_grip.setObjectName(u"frame_size_grip")
+        self.frame_size_grip.setMinimumSize(QSize(20, 0))
+        self.frame_size_grip.setMaximumSize(QSize(20, 16777215))
+        self.frame_size_grip.setFrameShape(QFrame.Shape.NoFrame)
+        self.frame_size_grip.setFrameShadow(QFrame.Shadow.Raised)
+        self.horizontalLayout_5.addWidget(self.frame_size_grip)
+        self.verticalLayout_6.addWidget(self.bottomBar)
+        self.verticalLayout_2.addWidget(self.contentBottom)
+        self.appLayout.addWidget(self.contentBox)
+        self.appMargins.addWidget(self.bgApp)
+        MainWindow.setCentralWidget(self.styleSheet)
+        self.retranslateUi(MainWindow)
+        self.stackedWidget.setCurrentIndex(2)
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def setupPage(self, name):
+        """构建页面 (已经构建过时直接返回)，返回页面控件"""
+        page = getattr(self, name, None)
+        if page is None:
+            getattr(self, f"setup_{name}")()
+            getattr(self, f"retranslate_{name}")()
+            page = getattr(self, name)
+        return page
+
+    def setup_page2(self):
+        from pyqtgraph import PlotWidget
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
         self.page2 = QWidget()
         self.page2.setObjectName(u"page2")
         self.horizontalLayout_14 = QHBoxLayout(self.page2)
@@ -1074,9 +1129,7 @@ class Ui_MainWindow(object):
         self.verticalLayout_22.setSpacing(12)
         self.verticalLayout_22.setObjectName(u"verticalLayout_22")
         self.verticalSpacer_9 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
-
         self.verticalLayout_22.addItem(self.verticalSpacer_9)
-
         self.label_2 = QLabel(self.page2_left_part)
         self.label_2.setObjectName(u"label_2")
         sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
@@ -1085,53 +1138,37 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
         self.label_2.setSizePolicy(sizePolicy3)
         self.label_2.setMinimumSize(QSize(0, 50))
-
         self.verticalLayout_22.addWidget(self.label_2, 0, Qt.AlignmentFlag.AlignHCenter)
-
         self.horizontalLayout_10 = QHBoxLayout()
         self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
         self.horizontalLayout_10.setContentsMargins(10, -1, -1, -1)
         self.label_5 = QLabel(self.page2_left_part)
         self.label_5.setObjectName(u"label_5")
-
         self.horizontalLayout_10.addWidget(self.label_5)
-
         self.btn_lowcut_set = QDoubleSpinBox(self.page2_left_part)
         self.btn_lowcut_set.setObjectName(u"btn_lowcut_set")
         self.btn_lowcut_set.setMinimumSize(QSize(0, 30))
         self.btn_lowcut_set.setValue(0.500000000000000)
-
         self.horizontalLayout_10.addWidget(self.btn_lowcut_set)
-
         self.horizontalLayout_10.setStretch(0, 1)
         self.horizontalLayout_10.setStretch(1, 2)
-
         self.verticalLayout_22.addLayout(self.horizontalLayout_10)
-
         self.horizontalLayout_13 = QHBoxLayout()
         self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
         self.horizontalLayout_13.setContentsMargins(10, -1, -1, -1)
         self.label_6 = QLabel(self.page2_left_part)
         self.label_6.setObjectName(u"label_6")
-
         self.horizontalLayout_13.addWidget(self.label_6)
-
         self.btn_highcut_set = QDoubleSpinBox(self.page2_left_part)
         self.btn_highcut_set.setObjectName(u"btn_highcut_set")
         self.btn_highcut_set.setMinimumSize(QSize(32, 30))
         self.btn_highcut_set.setValue(40.000000000000000)
-
         self.horizontalLayout_13.addWidget(self.btn_highcut_set)
-
         self.horizontalLayout_13.setStretch(0, 1)
         self.horizontalLayout_13.setStretch(1, 2)
-
         self.verticalLayout_22.addLayout(self.horizontalLayout_13)
-
         self.verticalSpacer_8 = QSpacerItem(20, 160, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_22.addItem(self.verticalSpacer_8)
-
         self.horizontalLayout_17 = QHBoxLayout()
         self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
         self.btn_get_message = QPushButton(self.page2_left_part)
@@ -1142,16 +1179,10 @@ class Ui_MainWindow(object):
         sizePolicy4.setHeightForWidth(self.btn_get_message.sizePolicy().hasHeightForWidth())
         self.btn_get_message.setSizePolicy(sizePolicy4)
         self.btn_get_message.setMinimumSize(QSize(160, 40))
-
         self.horizontalLayout_17.addWidget(self.btn_get_message)
-
-
         self.verticalLayout_22.addLayout(self.horizontalLayout_17)
-
         self.verticalSpacer_7 = QSpacerItem(20, 50, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
-
         self.verticalLayout_22.addItem(self.verticalSpacer_7)
-
         self.verticalLayout_22.setStretch(0, 2)
         self.verticalLayout_22.setStretch(1, 3)
         self.verticalLayout_22.setStretch(2, 3)
@@ -1159,13 +1190,9 @@ class Ui_MainWindow(object):
         self.verticalLayout_22.setStretch(4, 5)
         self.verticalLayout_22.setStretch(5, 3)
         self.verticalLayout_22.setStretch(6, 2)
-
         self.horizontalLayout_14.addWidget(self.page2_left_part)
-
         self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_14.addItem(self.horizontalSpacer_2)
-
         self.verticalLayout_21 = QVBoxLayout()
         self.verticalLayout_21.setObjectName(u"verticalLayout_21")
         self.horizontalFrame = QFrame(self.page2)
@@ -1186,12 +1213,8 @@ class Ui_MainWindow(object):
         font6.setItalic(False)
         font6.setUnderline(False)
         self.left_plot_window.setFont(font6)
-
         self.horizontalLayout_15.addWidget(self.left_plot_window)
-
-
         self.verticalLayout_21.addWidget(self.horizontalFrame)
-
         self.horizontalFrame_2 = QFrame(self.page2)
         self.horizontalFrame_2.setObjectName(u"horizontalFrame_2")
         self.horizontalFrame_2.setFrameShape(QFrame.Shape.StyledPanel)
@@ -1202,20 +1225,19 @@ class Ui_MainWindow(object):
         self.right_plot_window.setObjectName(u"right_plot_window")
         sizePolicy2.setHeightForWidth(self.right_plot_window.sizePolicy().hasHeightForWidth())
         self.right_plot_window.setSizePolicy(sizePolicy2)
-
         self.horizontalLayout_16.addWidget(self.right_plot_window)
-
-
         self.verticalLayout_21.addWidget(self.horizontalFrame_2)
-
         self.verticalLayout_21.setStretch(0, 1)
         self.verticalLayout_21.setStretch(1, 1)
-
         self.horizontalLayout_14.addLayout(self.verticalLayout_21)
-
         self.horizontalLayout_14.setStretch(0, 3)
         self.horizontalLayout_14.setStretch(2, 8)
         self.stackedWidget.addWidget(self.page2)
+
+    def setup_page3(self):
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
         self.page3 = QWidget()
         self.page3.setObjectName(u"page3")
         self.horizontalLayout_22 = QHBoxLayout(self.page3)
@@ -1232,9 +1254,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
         self.label_10 = QLabel(self.page3_left_bar)
         self.label_10.setObjectName(u"label_10")
-
         self.horizontalLayout_18.addWidget(self.label_10)
-
         self.close_eyes_prob = QProgressBar(self.page3_left_bar)
         self.close_eyes_prob.setObjectName(u"close_eyes_prob")
         sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
@@ -1246,69 +1266,47 @@ class Ui_MainWindow(object):
         self.close_eyes_prob.setMaximumSize(QSize(16777215, 16777215))
         self.close_eyes_prob.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.close_eyes_prob.setValue(0)
-
         self.horizontalLayout_18.addWidget(self.close_eyes_prob)
-
-
         self.verticalLayout_24.addLayout(self.horizontalLayout_18)
-
         self.horizontalLayout_19 = QHBoxLayout()
         self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
         self.label_7 = QLabel(self.page3_left_bar)
         self.label_7.setObjectName(u"label_7")
-
         self.horizontalLayout_19.addWidget(self.label_7)
-
         self.grit_teeth_prob = QProgressBar(self.page3_left_bar)
         self.grit_teeth_prob.setObjectName(u"grit_teeth_prob")
         sizePolicy5.setHeightForWidth(self.grit_teeth_prob.sizePolicy().hasHeightForWidth())
         self.grit_teeth_prob.setSizePolicy(sizePolicy5)
         self.grit_teeth_prob.setMinimumSize(QSize(255, 0))
         self.grit_teeth_prob.setValue(0)
-
         self.horizontalLayout_19.addWidget(self.grit_teeth_prob)
-
-
         self.verticalLayout_24.addLayout(self.horizontalLayout_19)
-
         self.horizontalLayout_20 = QHBoxLayout()
         self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
         self.label_8 = QLabel(self.page3_left_bar)
         self.label_8.setObjectName(u"label_8")
-
         self.horizontalLayout_20.addWidget(self.label_8)
-
         self.look_left_prob = QProgressBar(self.page3_left_bar)
         self.look_left_prob.setObjectName(u"look_left_prob")
         sizePolicy5.setHeightForWidth(self.look_left_prob.sizePolicy().hasHeightForWidth())
         self.look_left_prob.setSizePolicy(sizePolicy5)
         self.look_left_prob.setMinimumSize(QSize(255, 0))
         self.look_left_prob.setValue(0)
-
         self.horizontalLayout_20.addWidget(self.look_left_prob)
-
-
         self.verticalLayout_24.addLayout(self.horizontalLayout_20)
-
         self.horizontalLayout_21 = QHBoxLayout()
         self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
         self.label_9 = QLabel(self.page3_left_bar)
         self.label_9.setObjectName(u"label_9")
-
         self.horizontalLayout_21.addWidget(self.label_9)
-
         self.look_right_prob = QProgressBar(self.page3_left_bar)
         self.look_right_prob.setObjectName(u"look_right_prob")
         sizePolicy5.setHeightForWidth(self.look_right_prob.sizePolicy().hasHeightForWidth())
         self.look_right_prob.setSizePolicy(sizePolicy5)
         self.look_right_prob.setMinimumSize(QSize(255, 0))
         self.look_right_prob.setValue(0)
-
         self.horizontalLayout_21.addWidget(self.look_right_prob)
-
-
         self.verticalLayout_24.addLayout(self.horizontalLayout_21)
-
         self.btn_test_model = QPushButton(self.page3_left_bar)
         self.btn_test_model.setObjectName(u"btn_test_model")
         sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
@@ -1317,21 +1315,15 @@ class Ui_MainWindow(object):
         sizePolicy6.setHeightForWidth(self.btn_test_model.sizePolicy().hasHeightForWidth())
         self.btn_test_model.setSizePolicy(sizePolicy6)
         self.btn_test_model.setMinimumSize(QSize(165, 0))
-
         self.verticalLayout_24.addWidget(self.btn_test_model, 0, Qt.AlignmentFlag.AlignHCenter)
-
         self.verticalLayout_24.setStretch(0, 3)
         self.verticalLayout_24.setStretch(1, 3)
         self.verticalLayout_24.setStretch(2, 3)
         self.verticalLayout_24.setStretch(3, 3)
         self.verticalLayout_24.setStretch(4, 1)
-
         self.horizontalLayout_22.addWidget(self.page3_left_bar)
-
         self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_22.addItem(self.horizontalSpacer_3)
-
         self.page3_right_bar = QFrame(self.page3)
         self.page3_right_bar.setObjectName(u"page3_right_bar")
         self.page3_right_bar.setFrameShape(QFrame.Shape.StyledPanel)
@@ -1356,16 +1348,12 @@ class Ui_MainWindow(object):
         self.label_exp_window.setFrameShape(QFrame.Shape.StyledPanel)
         self.label_exp_window.setFrameShadow(QFrame.Shadow.Raised)
         self.label_exp_window.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
         self.verticalLayout_25.addWidget(self.label_exp_window)
-
         self.horizontalLayout_23 = QHBoxLayout()
         self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
         self.horizontalLayout_23.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
         self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_23.addItem(self.horizontalSpacer_4)
-
         self.label_11 = QLabel(self.page3_right_bar)
         self.label_11.setObjectName(u"label_11")
         sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
@@ -1373,58 +1361,57 @@ class Ui_MainWindow(object):
         sizePolicy7.setVerticalStretch(0)
         sizePolicy7.setHeightForWidth(self.label_11.sizePolicy().hasHeightForWidth())
         self.label_11.setSizePolicy(sizePolicy7)
-
         self.horizontalLayout_23.addWidget(self.label_11)
-
         self.btn_exp_cnt = QSpinBox(self.page3_right_bar)
         self.btn_exp_cnt.setObjectName(u"btn_exp_cnt")
         sizePolicy5.setHeightForWidth(self.btn_exp_cnt.sizePolicy().hasHeightForWidth())
         self.btn_exp_cnt.setSizePolicy(sizePolicy5)
         self.btn_exp_cnt.setMaximumSize(QSize(140, 16777215))
         self.btn_exp_cnt.setValue(10)
-
         self.horizontalLayout_23.addWidget(self.btn_exp_cnt)
-
         self.horizontalSpacer_5 = QSpacerItem(30, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_23.addItem(self.horizontalSpacer_5)
-
         self.btn_start_exp = QPushButton(self.page3_right_bar)
         self.btn_start_exp.setObjectName(u"btn_start_exp")
         sizePolicy5.setHeightForWidth(self.btn_start_exp.sizePolicy().hasHeightForWidth())
         self.btn_start_exp.setSizePolicy(sizePolicy5)
         self.btn_start_exp.setMinimumSize(QSize(165, 0))
         self.btn_start_exp.setMaximumSize(QSize(190, 16777215))
-
         self.horizontalLayout_23.addWidget(self.btn_start_exp)
-
         self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_23.addItem(self.horizontalSpacer_6)
-
         self.horizontalLayout_23.setStretch(1, 1)
         self.horizontalLayout_23.setStretch(2, 1)
         self.horizontalLayout_23.setStretch(4, 3)
-
         self.verticalLayout_25.addLayout(self.horizontalLayout_23)
-
         self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_25.addItem(self.verticalSpacer_6)
-
         self.verticalLayout_25.setStretch(0, 8)
         self.verticalLayout_25.setStretch(1, 1)
         self.verticalLayout_25.setStretch(2, 1)
-
         self.horizontalLayout_22.addWidget(self.page3_right_bar)
-
         self.stackedWidget.addWidget(self.page3)
+
+    def setup_page4(self):
         self.page4 = QWidget()
         self.page4.setObjectName(u"page4")
         self.label_4 = QLabel(self.page4)
         self.label_4.setObjectName(u"label_4")
         self.label_4.setGeometry(QRect(150, 160, 54, 16))
         self.stackedWidget.addWidget(self.page4)
+
+    def setup_widgets(self):
+        font1 = QFont()
+        font1.setFamilies([u"Segoe UI"])
+        font1.setPointSize(14)
+        font1.setBold(False)
+        font1.setItalic(False)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
         self.widgets = QWidget()
         self.widgets.setObjectName(u"widgets")
         self.widgets.setStyleSheet(u"b")
@@ -1461,12 +1448,8 @@ class Ui_MainWindow(object):
         self.labelBoxBlenderInstalation.setObjectName(u"labelBoxBlenderInstalation")
         self.labelBoxBlenderInstalation.setFont(font1)
         self.labelBoxBlenderInstalation.setStyleSheet(u"")
-
         self.verticalLayout_18.addWidget(self.labelBoxBlenderInstalation)
-
-
         self.verticalLayout_17.addWidget(self.frame_title_wid_1)
-
         self.frame_content_wid_1 = QFrame(self.frame_div_content_1)
         self.frame_content_wid_1.setObjectName(u"frame_content_wid_1")
         self.frame_content_wid_1.setFrameShape(QFrame.Shape.NoFrame)
@@ -1480,9 +1463,7 @@ class Ui_MainWindow(object):
         self.lineEdit.setObjectName(u"lineEdit")
         self.lineEdit.setMinimumSize(QSize(0, 30))
         self.lineEdit.setStyleSheet(u"background-color: rgb(33, 37, 43);")
-
         self.gridLayout.addWidget(self.lineEdit, 0, 0, 1, 1)
-
         self.pushButton = QPushButton(self.frame_content_wid_1)
         self.pushButton.setObjectName(u"pushButton")
         self.pushButton.setMinimumSize(QSize(150, 30))
@@ -1492,29 +1473,17 @@ class Ui_MainWindow(object):
         icon4 = QIcon()
         icon4.addFile(u":/icons/images/icons/cil-folder-open.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.pushButton.setIcon(icon4)
-
         self.gridLayout.addWidget(self.pushButton, 0, 1, 1, 1)
-
         self.labelVersion_3 = QLabel(self.frame_content_wid_1)
         self.labelVersion_3.setObjectName(u"labelVersion_3")
         self.labelVersion_3.setStyleSheet(u"color: rgb(113, 126, 149);")
         self.labelVersion_3.setLineWidth(1)
         self.labelVersion_3.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignVCenter)
-
         self.gridLayout.addWidget(self.labelVersion_3, 1, 0, 1, 2)
-
-
         self.horizontalLayout_9.addLayout(self.gridLayout)
-
-
         self.verticalLayout_17.addWidget(self.frame_content_wid_1)
-
-
         self.verticalLayout_16.addWidget(self.frame_div_content_1)
-
-
         self.verticalLayout.addWidget(self.row_1)
-
         self.row_2 = QFrame(self.widgets)
         self.row_2.setObjectName(u"row_2")
         self.row_2.setMinimumSize(QSize(0, 150))
@@ -1528,30 +1497,22 @@ class Ui_MainWindow(object):
         self.checkBox.setObjectName(u"checkBox")
         self.checkBox.setAutoFillBackground(False)
         self.checkBox.setStyleSheet(u"")
-
         self.gridLayout_2.addWidget(self.checkBox, 0, 0, 1, 1)
-
         self.radioButton = QRadioButton(self.row_2)
         self.radioButton.setObjectName(u"radioButton")
         self.radioButton.setStyleSheet(u"")
-
         self.gridLayout_2.addWidget(self.radioButton, 0, 1, 1, 1)
-
         self.verticalSlider = QSlider(self.row_2)
         self.verticalSlider.setObjectName(u"verticalSlider")
         self.verticalSlider.setStyleSheet(u"")
         self.verticalSlider.setOrientation(Qt.Orientation.Vertical)
-
         self.gridLayout_2.addWidget(self.verticalSlider, 0, 2, 3, 1)
-
         self.verticalScrollBar = QScrollBar(self.row_2)
         self.verticalScrollBar.setObjectName(u"verticalScrollBar")
         self.verticalScrollBar.setStyleSheet(u" QScrollBar:vertical { background: rgb(52, 59, 72); }\n"
 " QScrollBar:horizontal { background: rgb(52, 59, 72); }")
         self.verticalScrollBar.setOrientation(Qt.Orientation.Vertical)
-
         self.gridLayout_2.addWidget(self.verticalScrollBar, 0, 4, 3, 1)
-
         self.scrollArea = QScrollArea(self.row_2)
         self.scrollArea.setObjectName(u"scrollArea")
         self.scrollArea.setStyleSheet(u" QScrollBar:vertical {\n"
@@ -1580,13 +1541,9 @@ class Ui_MainWindow(object):
         self.plainTextEdit.setObjectName(u"plainTextEdit")
         self.plainTextEdit.setMinimumSize(QSize(200, 200))
         self.plainTextEdit.setStyleSheet(u"background-color: rgb(33, 37, 43);")
-
         self.horizontalLayout_11.addWidget(self.plainTextEdit)
-
         self.scrollArea.setWidget(self.scrollAreaWidgetContents)
-
         self.gridLayout_2.addWidget(self.scrollArea, 0, 5, 3, 1)
-
         self.comboBox = QComboBox(self.row_2)
         self.comboBox.addItem("")
         self.comboBox.addItem("")
@@ -1597,9 +1554,7 @@ class Ui_MainWindow(object):
         self.comboBox.setStyleSheet(u"background-color: rgb(33, 37, 43);")
         self.comboBox.setIconSize(QSize(16, 16))
         self.comboBox.setFrame(True)
-
         self.gridLayout_2.addWidget(self.comboBox, 1, 0, 1, 2)
-
         self.horizontalScrollBar = QScrollBar(self.row_2)
         self.horizontalScrollBar.setObjectName(u"horizontalScrollBar")
         sizePolicy.setHeightForWidth(self.horizontalScrollBar.sizePolicy().hasHeightForWidth())
@@ -1607,9 +1562,7 @@ class Ui_MainWindow(object):
         self.horizontalScrollBar.setStyleSheet(u" QScrollBar:vertical { background: rgb(52, 59, 72); }\n"
 " QScrollBar:horizontal { background: rgb(52, 59, 72); }")
         self.horizontalScrollBar.setOrientation(Qt.Orientation.Horizontal)
-
         self.gridLayout_2.addWidget(self.horizontalScrollBar, 1, 3, 1, 1)
-
         self.commandLinkButton = QCommandLinkButton(self.row_2)
         self.commandLinkButton.setObjectName(u"commandLinkButton")
         self.commandLinkButton.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
@@ -1617,22 +1570,14 @@ class Ui_MainWindow(object):
         icon5 = QIcon()
         icon5.addFile(u":/icons/images/icons/cil-link.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
         self.commandLinkButton.setIcon(icon5)
-
         self.gridLayout_2.addWidget(self.commandLinkButton, 1, 6, 1, 1)
-
         self.horizontalSlider = QSlider(self.row_2)
         self.horizontalSlider.setObjectName(u"horizontalSlider")
         self.horizontalSlider.setStyleSheet(u"")
         self.horizontalSlider.setOrientation(Qt.Orientation.Horizontal)
-
         self.gridLayout_2.addWidget(self.horizontalSlider, 2, 0, 1, 2)
-
-
         self.verticalLayout_19.addLayout(self.gridLayout_2)
-
-
         self.verticalLayout.addWidget(self.row_2)
-
         self.row_3 = QFrame(self.widgets)
         self.row_3.setObjectName(u"row_3")
         self.row_3.setMinimumSize(QSize(0, 150))
@@ -1658,7 +1603,7 @@ class Ui_MainWindow(object):
         font8 = QFont()
         font8.setFamilies([u"Segoe UI"])
         __qtablewidgetitem4 = QTableWidgetItem()
-        __qtablewidgetitem4.setFont(font8);
+        __qtablewidgetitem4.setFont(font8)
         self.tableWidget.setVerticalHeaderItem(0, __qtablewidgetitem4)
         __qtablewidgetitem5 = QTableWidgetItem()
         self.tableWidget.setVerticalHeaderItem(1, __qtablewidgetitem5)
@@ -1716,9 +1661,7 @@ class Ui_MainWindow(object):
         palette.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.Window, brush1)
         brush3 = QBrush(QColor(221, 221, 221, 128))
         brush3.setStyle(Qt.BrushStyle.SolidPattern)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.WindowText, brush)
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Button, brush1)
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Text, brush)
@@ -1727,9 +1670,7 @@ class Ui_MainWindow(object):
         brush4.setStyle(Qt.BrushStyle.NoBrush)
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Base, brush4)
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Window, brush1)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, brush)
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, brush1)
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, brush)
@@ -1738,9 +1679,7 @@ class Ui_MainWindow(object):
         brush5.setStyle(Qt.BrushStyle.NoBrush)
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base, brush5)
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Window, brush1)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         self.tableWidget.setPalette(palette)
         self.tableWidget.setFrameShape(QFrame.Shape.NoFrame)
         self.tableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
@@ -1759,13 +1698,33 @@ class Ui_MainWindow(object):
         self.tableWidget.verticalHeader().setCascadingSectionResizes(False)
         self.tableWidget.verticalHeader().setHighlightSections(False)
         self.tableWidget.verticalHeader().setStretchLastSection(True)
-
         self.horizontalLayout_12.addWidget(self.tableWidget)
-
-
         self.verticalLayout.addWidget(self.row_3)
-
         self.stackedWidget.addWidget(self.widgets)
+
+    def setup_page1(self):
+        font1 = QFont()
+        font1.setFamilies([u"Segoe UI"])
+        font1.setPointSize(14)
+        font1.setBold(False)
+        font1.setItalic(False)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        font8 = QFont()
+        font8.setFamilies([u"Segoe UI"])
+        brush = QBrush(QColor(221, 221, 221, 255))
+        brush.setStyle(Qt.BrushStyle.SolidPattern)
+        brush1 = QBrush(QColor(0, 0, 0, 0))
+        brush1.setStyle(Qt.BrushStyle.SolidPattern)
+        brush3 = QBrush(QColor(221, 221, 221, 128))
+        brush3.setStyle(Qt.BrushStyle.SolidPattern)
         self.page1 = QWidget()
         self.page1.setObjectName(u"page1")
         sizePolicy4.setHeightForWidth(self.page1.sizePolicy().hasHeightForWidth())
@@ -1785,9 +1744,7 @@ class Ui_MainWindow(object):
         self.verticalLayout_20.setSizeConstraint(QLayout.SizeConstraint.SetMinimumSize)
         self.verticalLayout_20.setContentsMargins(30, 1, 30, -1)
         self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_20.addItem(self.verticalSpacer)
-
         self.label = QLabel(self.l_connect_ble)
         self.label.setObjectName(u"label")
         sizePolicy8 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
@@ -1795,9 +1752,7 @@ class Ui_MainWindow(object):
         sizePolicy8.setVerticalStretch(0)
         sizePolicy8.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
         self.label.setSizePolicy(sizePolicy8)
-
         self.verticalLayout_20.addWidget(self.label, 0, Qt.AlignmentFlag.AlignHCenter)
-
         self.horizontalLayout_8 = QHBoxLayout()
         self.horizontalLayout_8.setSpacing(0)
         self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
@@ -1816,16 +1771,10 @@ class Ui_MainWindow(object):
         self.btn_select_ble.setStyleSheet(u"background-color: rgb(33, 37, 43);")
         self.btn_select_ble.setIconSize(QSize(16, 16))
         self.btn_select_ble.setFrame(True)
-
         self.horizontalLayout_8.addWidget(self.btn_select_ble)
-
-
         self.verticalLayout_20.addLayout(self.horizontalLayout_8)
-
         self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_20.addItem(self.verticalSpacer_2)
-
         self.horizontalLayout_7 = QHBoxLayout()
         self.horizontalLayout_7.setSpacing(10)
         self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
@@ -1835,29 +1784,19 @@ class Ui_MainWindow(object):
         self.btn_connect_ble.setSizePolicy(sizePolicy4)
         self.btn_connect_ble.setMinimumSize(QSize(160, 35))
         self.btn_connect_ble.setMaximumSize(QSize(160, 35))
-
         self.horizontalLayout_7.addWidget(self.btn_connect_ble)
-
-
         self.verticalLayout_20.addLayout(self.horizontalLayout_7)
-
         self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_20.addItem(self.verticalSpacer_3)
-
         self.verticalLayout_20.setStretch(0, 6)
         self.verticalLayout_20.setStretch(1, 2)
         self.verticalLayout_20.setStretch(2, 3)
         self.verticalLayout_20.setStretch(3, 10)
         self.verticalLayout_20.setStretch(4, 3)
         self.verticalLayout_20.setStretch(5, 6)
-
         self.horizontalLayout_6.addWidget(self.l_connect_ble)
-
         self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
         self.horizontalLayout_6.addItem(self.horizontalSpacer)
-
         self.verticalFrame = QFrame(self.page1)
         self.verticalFrame.setObjectName(u"verticalFrame")
         self.verticalFrame.setFrameShape(QFrame.Shape.StyledPanel)
@@ -1866,9 +1805,7 @@ class Ui_MainWindow(object):
         self.verticalLayout_23.setObjectName(u"verticalLayout_23")
         self.verticalLayout_23.setContentsMargins(1, -1, -1, -1)
         self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_23.addItem(self.verticalSpacer_4)
-
         self.table_ble_stats = QTableWidget(self.verticalFrame)
         if (self.table_ble_stats.columnCount() < 2):
             self.table_ble_stats.setColumnCount(2)
@@ -1879,7 +1816,7 @@ class Ui_MainWindow(object):
         if (self.table_ble_stats.rowCount() < 12):
             self.table_ble_stats.setRowCount(12)
         __qtablewidgetitem26 = QTableWidgetItem()
-        __qtablewidgetitem26.setFont(font8);
+        __qtablewidgetitem26.setFont(font8)
         self.table_ble_stats.setVerticalHeaderItem(0, __qtablewidgetitem26)
         __qtablewidgetitem27 = QTableWidgetItem()
         self.table_ble_stats.setVerticalHeaderItem(1, __qtablewidgetitem27)
@@ -1941,9 +1878,7 @@ class Ui_MainWindow(object):
         brush6.setStyle(Qt.BrushStyle.NoBrush)
         palette1.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.Base, brush6)
         palette1.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.Window, brush1)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette1.setBrush(QPalette.ColorGroup.Active, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.WindowText, brush)
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Button, brush1)
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Text, brush)
@@ -1952,9 +1887,7 @@ class Ui_MainWindow(object):
         brush7.setStyle(Qt.BrushStyle.NoBrush)
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Base, brush7)
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Window, brush1)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette1.setBrush(QPalette.ColorGroup.Inactive, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, brush)
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, brush1)
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, brush)
@@ -1963,9 +1896,7 @@ class Ui_MainWindow(object):
         brush8.setStyle(Qt.BrushStyle.NoBrush)
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base, brush8)
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Window, brush1)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
         palette1.setBrush(QPalette.ColorGroup.Disabled, QPalette.ColorRole.PlaceholderText, brush3)
-#endif
         self.table_ble_stats.setPalette(palette1)
         self.table_ble_stats.setFrameShape(QFrame.Shape.NoFrame)
         self.table_ble_stats.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
@@ -1984,169 +1915,17 @@ class Ui_MainWindow(object):
         self.table_ble_stats.verticalHeader().setCascadingSectionResizes(False)
         self.table_ble_stats.verticalHeader().setHighlightSections(False)
         self.table_ble_stats.verticalHeader().setStretchLastSection(True)
-
         self.verticalLayout_23.addWidget(self.table_ble_stats)
-
         self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
         self.verticalLayout_23.addItem(self.verticalSpacer_5)
-
         self.verticalLayout_23.setStretch(0, 1)
         self.verticalLayout_23.setStretch(1, 10)
         self.verticalLayout_23.setStretch(2, 1)
-
         self.horizontalLayout_6.addWidget(self.verticalFrame)
-
         self.horizontalLayout_6.setStretch(0, 3)
         self.horizontalLayout_6.setStretch(2, 8)
         self.stackedWidget.addWidget(self.page1)
 
-        self.verticalLayout_15.addWidget(self.stackedWidget)
-
-
-        self.horizontalLayout_4.addWidget(self.pagesContainer)
-
-        self.extraRightBox = QFrame(self.content)
-        self.extraRightBox.setObjectName(u"extraRightBox")
-        self.extraRightBox.setMinimumSize(QSize(0, 0))
-        self.extraRightBox.setMaximumSize(QSize(0, 16777215))
-        self.extraRightBox.setFrameShape(QFrame.Shape.NoFrame)
-        self.extraRightBox.setFrameShadow(QFrame.Shadow.Raised)
-        self.verticalLayout_7 = QVBoxLayout(self.extraRightBox)
-        self.verticalLayout_7.setSpacing(0)
-        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
-        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
-        self.themeSettingsTopDetail = QFrame(self.extraRightBox)
-        self.themeSettingsTopDetail.setObjectName(u"themeSettingsTopDetail")
-        self.themeSettingsTopDetail.setMaximumSize(QSize(16777215, 3))
-        self.themeSettingsTopDetail.setFrameShape(QFrame.Shape.NoFrame)
-        self.themeSettingsTopDetail.setFrameShadow(QFrame.Shadow.Raised)
-
-        self.verticalLayout_7.addWidget(self.themeSettingsTopDetail)
-
-        self.contentSettings = QFrame(self.extraRightBox)
-        self.contentSettings.setObjectName(u"contentSettings")
-        self.contentSettings.setFrameShape(QFrame.Shape.NoFrame)
-        self.contentSettings.setFrameShadow(QFrame.Shadow.Raised)
-        self.verticalLayout_13 = QVBoxLayout(self.contentSettings)
-        self.verticalLayout_13.setSpacing(0)
-        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
-        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
-        self.topMenus = QFrame(self.contentSettings)
-        self.topMenus.setObjectName(u"topMenus")
-        self.topMenus.setFrameShape(QFrame.Shape.NoFrame)
-        self.topMenus.setFrameShadow(QFrame.Shadow.Raised)
-        self.verticalLayout_14 = QVBoxLayout(self.topMenus)
-        self.verticalLayout_14.setSpacing(0)
-        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
-        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
-        self.btn_message = QPushButton(self.topMenus)
-        self.btn_message.setObjectName(u"btn_message")
-        sizePolicy.setHeightForWidth(self.btn_message.sizePolicy().hasHeightForWidth())
-        self.btn_message.setSizePolicy(sizePolicy)
-        self.btn_message.setMinimumSize(QSize(0, 45))
-        self.btn_message.setFont(font1)
-        self.btn_message.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_message.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
-        self.btn_message.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-envelope-open.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_message)
-
-        self.btn_print = QPushButton(self.topMenus)
-        self.btn_print.setObjectName(u"btn_print")
-        sizePolicy.setHeightForWidth(self.btn_print.sizePolicy().hasHeightForWidth())
-        self.btn_print.setSizePolicy(sizePolicy)
-        self.btn_print.setMinimumSize(QSize(0, 45))
-        self.btn_print.setFont(font1)
-        self.btn_print.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_print.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
-        self.btn_print.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-print.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_print)
-
-        self.btn_logout = QPushButton(self.topMenus)
-        self.btn_logout.setObjectName(u"btn_logout")
-        sizePolicy.setHeightForWidth(self.btn_logout.sizePolicy().hasHeightForWidth())
-        self.btn_logout.setSizePolicy(sizePolicy)
-        self.btn_logout.setMinimumSize(QSize(0, 45))
-        self.btn_logout.setFont(font1)
-        self.btn_logout.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_logout.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
-        self.btn_logout.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-account-logout.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_logout)
-
-
-        self.verticalLayout_13.addWidget(self.topMenus, 0, Qt.AlignmentFlag.AlignTop)
-
-
-        self.verticalLayout_7.addWidget(self.contentSettings)
-
-
-        self.horizontalLayout_4.addWidget(self.extraRightBox)
-
-
-        self.verticalLayout_6.addWidget(self.content)
-
-        self.bottomBar = QFrame(self.contentBottom)
-        self.bottomBar.setObjectName(u"bottomBar")
-        self.bottomBar.setMinimumSize(QSize(0, 22))
-        self.bottomBar.setMaximumSize(QSize(16777215, 22))
-        self.bottomBar.setFrameShape(QFrame.Shape.NoFrame)
-        self.bottomBar.setFrameShadow(QFrame.Shadow.Raised)
-        self.horizontalLayout_5 = QHBoxLayout(self.bottomBar)
-        self.horizontalLayout_5.setSpacing(0)
-        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
-        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
-        self.creditsLabel = QLabel(self.bottomBar)
-        self.creditsLabel.setObjectName(u"creditsLabel")
-        self.creditsLabel.setMaximumSize(QSize(16777215, 16))
-        font9 = QFont()
-        font9.setFamilies([u"Segoe UI"])
-        font9.setBold(False)
-        font9.setItalic(False)
-        self.creditsLabel.setFont(font9)
-        self.creditsLabel.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignVCenter)
-
-        self.horizontalLayout_5.addWidget(self.creditsLabel)
-
-        self.version = QLabel(self.bottomBar)
-        self.version.setObjectName(u"version")
-        self.version.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
-
-        self.horizontalLayout_5.addWidget(self.version)
-
-        self.frame_size_grip = QFrame(self.bottomBar)
-        self.frame_size_grip.setObjectName(u"frame_size_grip")
-        self.frame_size_grip.setMinimumSize(QSize(20, 0))
-        self.frame_size_grip.setMaximumSize(QSize(20, 16777215))
-        self.frame_size_grip.setFrameShape(QFrame.Shape.NoFrame)
-        self.frame_size_grip.setFrameShadow(QFrame.Shadow.Raised)
-
-        self.horizontalLayout_5.addWidget(self.frame_size_grip)
-
-
-        self.verticalLayout_6.addWidget(self.bottomBar)
-
-
-        self.verticalLayout_2.addWidget(self.contentBottom)
-
-
-        self.appLayout.addWidget(self.contentBox)
-
-
-        self.appMargins.addWidget(self.bgApp)
-
-        MainWindow.setCentralWidget(self.styleSheet)
-
-        self.retranslateUi(MainWindow)
-
-        self.stackedWidget.setCurrentIndex(2)
-
-
-        QMetaObject.connectSlotsByName(MainWindow)
-    # setupUi
-
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
         self.titleLeftApp.setText(QCoreApplication.translate("MainWindow", u"PyDracula", None))
@@ -2159,9 +1938,7 @@ class Ui_MainWindow(object):
         self.btn_page3.setText(QCoreApplication.translate("MainWindow", u"Exit", None))
         self.toggleLeftBox.setText(QCoreApplication.translate("MainWindow", u"Left Box", None))
         self.extraLabel.setText(QCoreApplication.translate("MainWindow", u"Left Box", None))
-#if QT_CONFIG(tooltip)
         self.extraCloseColumnBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Close left box", None))
-#endif // QT_CONFIG(tooltip)
         self.extraCloseColumnBtn.setText("")
         self.btn_share.setText(QCoreApplication.translate("MainWindow", u"Share", None))
         self.btn_adjustments.setText(QCoreApplication.translate("MainWindow", u"Adjustments", None))
@@ -2184,26 +1961,31 @@ class Ui_MainWindow(object):
                         " margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:12pt; font-weight:600; color:#ff79c6;\">Convert QRC</span></p>\n"
 "<p align=\"center\" style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#ffffff;\">pyside6-rcc resources.qrc -o resources_rc.py</span></p></body></html>", None))
         self.titleRightInfo.setText(QCoreApplication.translate("MainWindow", u"PyDracula APP - Theme with colors based on Dracula for Python.", None))
-#if QT_CONFIG(tooltip)
         self.settingsTopBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Settings", None))
-#endif // QT_CONFIG(tooltip)
         self.settingsTopBtn.setText("")
-#if QT_CONFIG(tooltip)
         self.minimizeAppBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Minimize", None))
-#endif // QT_CONFIG(tooltip)
         self.minimizeAppBtn.setText("")
-#if QT_CONFIG(tooltip)
         self.maximizeRestoreAppBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Maximize", None))
-#endif // QT_CONFIG(tooltip)
         self.maximizeRestoreAppBtn.setText("")
-#if QT_CONFIG(tooltip)
         self.closeAppBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Close", None))
-#endif // QT_CONFIG(tooltip)
         self.closeAppBtn.setText("")
+        self.btn_message.setText(QCoreApplication.translate("MainWindow", u"Message", None))
+        self.btn_print.setText(QCoreApplication.translate("MainWindow", u"Print", None))
+        self.btn_logout.setText(QCoreApplication.translate("MainWindow", u"Logout", None))
+        self.creditsLabel.setText(QCoreApplication.translate("MainWindow", u"By: Wanderson M. Pimenta", None))
+        self.version.setText(QCoreApplication.translate("MainWindow", u"v1.0.3", None))
+        for name in self.LAZY_PAGES:
+            if getattr(self, name, None) is not None:
+                getattr(self, f"retranslate_{name}")()
+    # retranslateUi
+
+    def retranslate_page2(self):
         self.label_2.setText(QCoreApplication.translate("MainWindow", u"\u8bbe\u7f6e\u6ee4\u6ce2", None))
         self.label_5.setText(QCoreApplication.translate("MainWindow", u"\u9ad8\u901a\u622a\u6b62Hz", None))
         self.label_6.setText(QCoreApplication.translate("MainWindow", u"\u4f4e\u901a\u622a\u6b62Hz", None))
         self.btn_get_message.setText(QCoreApplication.translate("MainWindow", u"\u5f00\u59cb\u91c7\u96c6", None))
+
+    def retranslate_page3(self):
         self.label_10.setText(QCoreApplication.translate("MainWindow", u"\u95ed\u773c", None))
         self.label_7.setText(QCoreApplication.translate("MainWindow", u"\u54ac\u7259", None))
         self.label_8.setText(QCoreApplication.translate("MainWindow", u"\u5de6\u770b", None))
@@ -2212,7 +1994,11 @@ class Ui_MainWindow(object):
         self.label_exp_window.setText(QCoreApplication.translate("MainWindow", u"\u4f11\u606f", None))
         self.label_11.setText(QCoreApplication.translate("MainWindow", u"\u5b9e\u9a8c\u8f6e\u6b21", None))
         self.btn_start_exp.setText(QCoreApplication.translate("MainWindow", u"\u5f00\u59cb\u5b9e\u9a8c", None))
+
+    def retranslate_page4(self):
         self.label_4.setText(QCoreApplication.translate("MainWindow", u"page4", None))
+
+    def retranslate_widgets(self):
         self.labelBoxBlenderInstalation.setText(QCoreApplication.translate("MainWindow", u"FILE BOX", None))
         self.lineEdit.setText("")
         self.lineEdit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Type here", None))
@@ -2223,131 +2009,120 @@ class Ui_MainWindow(object):
         self.comboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"Test 1", None))
         self.comboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"Test 2", None))
         self.comboBox.setItemText(2, QCoreApplication.translate("MainWindow", u"Test 3", None))
-
         self.commandLinkButton.setText(QCoreApplication.translate("MainWindow", u"Link Button", None))
         self.commandLinkButton.setDescription(QCoreApplication.translate("MainWindow", u"Link description", None))
         ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"0", None));
+        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"0", None))
         ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"1", None));
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"1", None))
         ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"2", None));
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"2", None))
         ___qtablewidgetitem3 = self.tableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"3", None));
+        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"3", None))
         ___qtablewidgetitem4 = self.tableWidget.verticalHeaderItem(0)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem5 = self.tableWidget.verticalHeaderItem(1)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem6 = self.tableWidget.verticalHeaderItem(2)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem7 = self.tableWidget.verticalHeaderItem(3)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem8 = self.tableWidget.verticalHeaderItem(4)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem9 = self.tableWidget.verticalHeaderItem(5)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem10 = self.tableWidget.verticalHeaderItem(6)
-        ___qtablewidgetitem10.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem10.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem11 = self.tableWidget.verticalHeaderItem(7)
-        ___qtablewidgetitem11.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem11.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem12 = self.tableWidget.verticalHeaderItem(8)
-        ___qtablewidgetitem12.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem12.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem13 = self.tableWidget.verticalHeaderItem(9)
-        ___qtablewidgetitem13.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem13.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem14 = self.tableWidget.verticalHeaderItem(10)
-        ___qtablewidgetitem14.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem14.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem15 = self.tableWidget.verticalHeaderItem(11)
-        ___qtablewidgetitem15.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem15.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem16 = self.tableWidget.verticalHeaderItem(12)
-        ___qtablewidgetitem16.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem16.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem17 = self.tableWidget.verticalHeaderItem(13)
-        ___qtablewidgetitem17.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem17.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem18 = self.tableWidget.verticalHeaderItem(14)
-        ___qtablewidgetitem18.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem18.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem19 = self.tableWidget.verticalHeaderItem(15)
-        ___qtablewidgetitem19.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
-
+        ___qtablewidgetitem19.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         __sortingEnabled = self.tableWidget.isSortingEnabled()
         self.tableWidget.setSortingEnabled(False)
         ___qtablewidgetitem20 = self.tableWidget.item(0, 0)
-        ___qtablewidgetitem20.setText(QCoreApplication.translate("MainWindow", u"Test", None));
+        ___qtablewidgetitem20.setText(QCoreApplication.translate("MainWindow", u"Test", None))
         ___qtablewidgetitem21 = self.tableWidget.item(0, 1)
-        ___qtablewidgetitem21.setText(QCoreApplication.translate("MainWindow", u"Text", None));
+        ___qtablewidgetitem21.setText(QCoreApplication.translate("MainWindow", u"Text", None))
         ___qtablewidgetitem22 = self.tableWidget.item(0, 2)
-        ___qtablewidgetitem22.setText(QCoreApplication.translate("MainWindow", u"Cell", None));
+        ___qtablewidgetitem22.setText(QCoreApplication.translate("MainWindow", u"Cell", None))
         ___qtablewidgetitem23 = self.tableWidget.item(0, 3)
-        ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"Line", None));
+        ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"Line", None))
         self.tableWidget.setSortingEnabled(__sortingEnabled)
 
+    def retranslate_page1(self):
         self.label.setText(QCoreApplication.translate("MainWindow", u"\u53ef\u8fde\u63a5\u8bbe\u5907", None))
         self.btn_select_ble.setItemText(0, QCoreApplication.translate("MainWindow", u"Naoyun Pods BLE-3426", None))
         self.btn_select_ble.setItemText(1, QCoreApplication.translate("MainWindow", u"Naoyun Pods BLE-3392", None))
         self.btn_select_ble.setItemText(2, QCoreApplication.translate("MainWindow", u"Naoyun Pods BLE-3393", None))
-
         self.btn_connect_ble.setText(QCoreApplication.translate("MainWindow", u"\u8fde\u63a5\u8033\u673a", None))
         ___qtablewidgetitem24 = self.table_ble_stats.horizontalHeaderItem(0)
-        ___qtablewidgetitem24.setText(QCoreApplication.translate("MainWindow", u"0", None));
+        ___qtablewidgetitem24.setText(QCoreApplication.translate("MainWindow", u"0", None))
         ___qtablewidgetitem25 = self.table_ble_stats.horizontalHeaderItem(1)
-        ___qtablewidgetitem25.setText(QCoreApplication.translate("MainWindow", u"1", None));
+        ___qtablewidgetitem25.setText(QCoreApplication.translate("MainWindow", u"1", None))
         ___qtablewidgetitem26 = self.table_ble_stats.verticalHeaderItem(0)
-        ___qtablewidgetitem26.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem26.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem27 = self.table_ble_stats.verticalHeaderItem(1)
-        ___qtablewidgetitem27.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem27.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem28 = self.table_ble_stats.verticalHeaderItem(2)
-        ___qtablewidgetitem28.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem28.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem29 = self.table_ble_stats.verticalHeaderItem(3)
-        ___qtablewidgetitem29.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem29.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem30 = self.table_ble_stats.verticalHeaderItem(4)
-        ___qtablewidgetitem30.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem30.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem31 = self.table_ble_stats.verticalHeaderItem(5)
-        ___qtablewidgetitem31.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem31.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem32 = self.table_ble_stats.verticalHeaderItem(6)
-        ___qtablewidgetitem32.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem32.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem33 = self.table_ble_stats.verticalHeaderItem(7)
-        ___qtablewidgetitem33.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem33.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem34 = self.table_ble_stats.verticalHeaderItem(8)
-        ___qtablewidgetitem34.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem34.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem35 = self.table_ble_stats.verticalHeaderItem(9)
-        ___qtablewidgetitem35.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem35.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem36 = self.table_ble_stats.verticalHeaderItem(10)
-        ___qtablewidgetitem36.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
+        ___qtablewidgetitem36.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         ___qtablewidgetitem37 = self.table_ble_stats.verticalHeaderItem(11)
-        ___qtablewidgetitem37.setText(QCoreApplication.translate("MainWindow", u"New Row", None));
-
+        ___qtablewidgetitem37.setText(QCoreApplication.translate("MainWindow", u"New Row", None))
         __sortingEnabled1 = self.table_ble_stats.isSortingEnabled()
         self.table_ble_stats.setSortingEnabled(False)
         ___qtablewidgetitem38 = self.table_ble_stats.item(0, 0)
-        ___qtablewidgetitem38.setText(QCoreApplication.translate("MainWindow", u"   \u5c5e\u6027", None));
+        ___qtablewidgetitem38.setText(QCoreApplication.translate("MainWindow", u"   \u5c5e\u6027", None))
         ___qtablewidgetitem39 = self.table_ble_stats.item(0, 1)
-        ___qtablewidgetitem39.setText(QCoreApplication.translate("MainWindow", u"   \u72b6\u6001", None));
+        ___qtablewidgetitem39.setText(QCoreApplication.translate("MainWindow", u"   \u72b6\u6001", None))
         ___qtablewidgetitem40 = self.table_ble_stats.item(1, 0)
-        ___qtablewidgetitem40.setText(QCoreApplication.translate("MainWindow", u"\u8033\u7c7b\u578b", None));
+        ___qtablewidgetitem40.setText(QCoreApplication.translate("MainWindow", u"\u8033\u7c7b\u578b", None))
         ___qtablewidgetitem41 = self.table_ble_stats.item(2, 0)
-        ___qtablewidgetitem41.setText(QCoreApplication.translate("MainWindow", u"\u5de6\u8033\u4f69\u6234", None));
+        ___qtablewidgetitem41.setText(QCoreApplication.translate("MainWindow", u"\u5de6\u8033\u4f69\u6234", None))
         ___qtablewidgetitem42 = self.table_ble_stats.item(3, 0)
-        ___qtablewidgetitem42.setText(QCoreApplication.translate("MainWindow", u"\u53f3\u8033\u4f69\u6234", None));
+        ___qtablewidgetitem42.setText(QCoreApplication.translate("MainWindow", u"\u53f3\u8033\u4f69\u6234", None))
         ___qtablewidgetitem43 = self.table_ble_stats.item(4, 0)
-        ___qtablewidgetitem43.setText(QCoreApplication.translate("MainWindow", u"\u5de6\u8033\u7535\u91cf", None));
+        ___qtablewidgetitem43.setText(QCoreApplication.translate("MainWindow", u"\u5de6\u8033\u7535\u91cf", None))
         ___qtablewidgetitem44 = self.table_ble_stats.item(5, 0)
-        ___qtablewidgetitem44.setText(QCoreApplication.translate("MainWindow", u"\u53f3\u8033\u7535\u91cf", None));
+        ___qtablewidgetitem44.setText(QCoreApplication.translate("MainWindow", u"\u53f3\u8033\u7535\u91cf", None))
         ___qtablewidgetitem45 = self.table_ble_stats.item(6, 0)
-        ___qtablewidgetitem45.setText(QCoreApplication.translate("MainWindow", u"\u786c\u4ef6\u7248\u672c\u53f7", None));
+        ___qtablewidgetitem45.setText(QCoreApplication.translate("MainWindow", u"\u786c\u4ef6\u7248\u672c\u53f7", None))
         ___qtablewidgetitem46 = self.table_ble_stats.item(7, 0)
-        ___qtablewidgetitem46.setText(QCoreApplication.translate("MainWindow", u"\u8f6f\u4ef6\u7248\u672c\u53f7", None));
+        ___qtablewidgetitem46.setText(QCoreApplication.translate("MainWindow", u"\u8f6f\u4ef6\u7248\u672c\u53f7", None))
         ___qtablewidgetitem47 = self.table_ble_stats.item(8, 0)
-        ___qtablewidgetitem47.setText(QCoreApplication.translate("MainWindow", u"\u5927\u5c0f\u7aef", None));
+        ___qtablewidgetitem47.setText(QCoreApplication.translate("MainWindow", u"\u5927\u5c0f\u7aef", None))
         ___qtablewidgetitem48 = self.table_ble_stats.item(9, 0)
-        ___qtablewidgetitem48.setText(QCoreApplication.translate("MainWindow", u"\u964d\u566a\u5f00\u5173", None));
+        ___qtablewidgetitem48.setText(QCoreApplication.translate("MainWindow", u"\u964d\u566a\u5f00\u5173", None))
         ___qtablewidgetitem49 = self.table_ble_stats.item(10, 0)
-        ___qtablewidgetitem49.setText(QCoreApplication.translate("MainWindow", u"\u89e6\u63a7\u5f00\u5173", None));
+        ___qtablewidgetitem49.setText(QCoreApplication.translate("MainWindow", u"\u89e6\u63a7\u5f00\u5173", None))
         ___qtablewidgetitem50 = self.table_ble_stats.item(11, 0)
-        ___qtablewidgetitem50.setText(QCoreApplication.translate("MainWindow", u"\u81ea\u52a8\u64ad\u653e\u505c\u6b62\u529f\u80fd", None));
+        ___qtablewidgetitem50.setText(QCoreApplication.translate("MainWindow", u"\u81ea\u52a8\u64ad\u653e\u505c\u6b62\u529f\u80fd", None))
         self.table_ble_stats.setSortingEnabled(__sortingEnabled1)
-
-        self.btn_message.setText(QCoreApplication.translate("MainWindow", u"Message", None))
-        self.btn_print.setText(QCoreApplication.translate("MainWindow", u"Print", None))
-        self.btn_logout.setText(QCoreApplication.translate("MainWindow", u"Logout", None))
-        self.creditsLabel.setText(QCoreApplication.translate("MainWindow", u"By: Wanderson M. Pimenta", None))
-        self.version.setText(QCoreApplication.translate("MainWindow", u"v1.0.3", None))
-    # retranslateUi
-
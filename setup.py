@@ -3,7 +3,10 @@ import os
 from cx_Freeze import setup, Executable
 
 # ADD FILES
-files = ['icon.ico','themes/']
+files = ['icon.ico','themes/',('modules/resources.rcc','modules/resources.rcc')]
+
+# src.devices 的子模块通过 importlib 按需加载，静态分析找不到，需要整包打包
+packages = ['src']
 
 # TARGET
 target = Executable(
@@ -18,7 +21,7 @@ setup(
     version = "1.0",
     description = "Modern GUI for Python applications",
     author = "Wanderson M. Pimenta",
-    options = {'build_exe' : {'include_files' : files}},
+    options = {'build_exe' : {'include_files' : files, 'packages' : packages}},
     executables = [target]
     
 )
@@ -1,8 +1,68 @@
-from .ble.get_message import BluetoothDevice, BleConnectThread, BleGetMessageThread
-from .plot.eegPloter import EEGPlotter
-from .exp.exp import ExperimentThread
-from .exp.tts import TextToSpeechThread
-from .exp.save_data import SaveExpDataThread
-from .exp.train_model import SaveModelThread
-from .exp.models import EEGNet
-from .exp.test_model import TestModelThread
\ No newline at end of file
+# 设备包的导出按需加载 (PEP 562)：第一次访问某个名称时才导入它所在的模块，
+# 只连接设备、查看信号时不会导入 torch、sklearn、matplotlib 等训练和推理依赖
+import importlib
+import threading
+
+_EXPORTS = {
+    ".ble.get_message": ("BluetoothDevice", "BleConnectThread", "BleGetMessageThread"),
+    ".ble.loop": ("BleController", "get_ble_loop"),
+    ".ble.scanner": ("BleScanner", "device_scanner"),
+    ".ble.session_manager": ("SessionManager", "HeadsetSession"),
+    ".plot.eegPloter": ("EEGPlotter",),
+    ".exp.exp": ("ExperimentThread",),
+    ".exp.tts": ("TextToSpeechThread",),
+    ".exp.save_data": ("SaveExpDataThread",),
+    ".exp.recorder": ("StreamRecorder", "read_recording"),
+    ".exp.session_file": ("SessionFile", "write_session", "convert_legacy", "convert_recording"),
+    ".exp.catalog": ("SessionCatalog", "load_session"),
+    ".exp.train_model": ("SaveModelThread",),
+    ".exp.models": ("EEGNet",),
+    ".exp.test_model": ("TestModelThread",),
+    ".stream.sample_store": ("SampleStore",),
+    ".stream.filters": ("StreamingBandPass", "FilterBank", "design_sos", "zero_phase_band_pass"),
+    ".stream.sequence": ("PacketSequenceTracker", "interpolate_nan"),
+    ".stream.alignment": ("EarAligner",),
+    ".stream.shared_bus": ("SharedSampleBus", "SharedSampleReader"),
+    ".stream.server": ("StreamServer", "encode_frame", "decode_frame"),
+}
+_LOCATIONS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOCATIONS) + ["warm_up"]
+
+# 界面显示后在后台预先导入的重量级模块 (实时绘图、滤波器设计、训练、推理、语音播报)
+WARM_UP_MODULES = (
+    ".plot.eegPloter",
+    "scipy.signal",
+    ".exp.models",
+    ".exp.test_model",
+    ".exp.train_model",
+    ".exp.tts",
+    "pyttsx3",
+)
+
+
+def __getattr__(name):
+    module = _LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # 之后的访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return __all__
+
+
+def warm_up(modules=WARM_UP_MODULES) -> threading.Thread:
+    """在后台线程中导入重量级模块，第一次训练/推理/播报时不用再等待导入"""
+    def run():
+        for module in modules:
+            try:
+                importlib.import_module(module, __name__)
+            except ImportError as e:
+                print(f"预加载 {module} 失败: {e}")
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
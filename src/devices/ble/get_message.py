@@ -3,89 +3,305 @@ from bleak import BleakClient, BleakScanner
 import struct
 from typing import Union
 import time
+import numpy as np
 from PySide6.QtCore import QObject, QThread, Signal
 
 from . import tools
-
-# 全局通知处理器实例
-notification_handler = tools.NotificationHandler()
+from .loop import get_ble_loop
+from .scanner import device_scanner
+from .stats import LinkStatistics
+from ..stream.alignment import EarClock
+from ..stream.sequence import PacketSequenceTracker
+
+
+class PacketCoalescer:
+    """
+    数据包合并器：
+        按耳累积解析后的数据包，攒够 max_packets 个包或距第一个包超过 max_delay_ms 时合并发出一次，
+        减少跨线程信号的次数。BLE 通知往往在同一个连接间隔内成批到达，max_delay_ms 只需覆盖一次突发，
+        默认 50 ms，不会给绘图、在线识别和各个 sink 带来明显的延迟。合并结果格式:
+        {
+            "ear_side": ear_side,
+            "samples": np.ndarray,  # 所有包的样本首尾相接
+            "sample_count": 样本总数,
+            "packet_count": np.ndarray(uint8),  # 每个包的累加值
+            "lead_off": np.ndarray(uint8),  # 每个包的导联脱落位
+            "packets": 包数,
+            "gap_packets": 这批数据中补齐的丢失包数,
+            "gap_events": 这批数据中发生丢包的次数 (一批可能包含多段丢包),
+            "outage_packets": 断线重连期间补齐的包数 (不计入 gap_packets),
+            "packet_samples": np.ndarray,  # 每个包(含补齐样本)的样本数
+            "arrival_time": np.ndarray,  # 每个包的到达时间 (time.perf_counter)
+        }
+    max_packets=1 时每个包单独发出
+    """
+
+    def __init__(self, emit, max_packets=5, max_delay_ms=50):
+        self.emit = emit
+        self.max_packets = max(1, int(max_packets))
+        self.max_delay = max_delay_ms / 1000
+        self.pending = {"left": [], "right": []}
+        self.timers = {"left": None, "right": None}
+
+    def add(self, packet):
+        """加入一个 parse_eeg_data 的解析结果，需在事件循环线程中调用"""
+        side = packet["ear_side"]
+        pending = self.pending[side]
+        pending.append(packet)
+
+        if len(pending) >= self.max_packets:
+            self.flush(side)
+        elif len(pending) == 1 and self.max_delay > 0:
+            # 批次的第一个包：到期后即使没攒够也要发出，保证延迟有上限
+            loop = asyncio.get_running_loop()
+            self.timers[side] = loop.call_later(self.max_delay, self.flush, side)
+
+    def flush(self, side=None):
+        """立即发出累积的数据，side 为 None 时两耳都发出"""
+        for ear in ([side] if side else list(self.pending)):
+            timer = self.timers[ear]
+            if timer is not None:
+                timer.cancel()
+                self.timers[ear] = None
+
+            packets = self.pending[ear]
+            if not packets:
+                continue
+            self.pending[ear] = []
+            self.emit(self._merge(ear, packets))
+
+    @staticmethod
+    def _merge(side, packets):
+        samples = np.concatenate([p["samples"] for p in packets])
+        return {
+            "ear_side": side,
+            "samples": samples,
+            "sample_count": len(samples),
+            "packet_count": np.array([p["packet_count"] for p in packets], dtype=np.uint8),
+            "lead_off": np.array([p["lead_off"] for p in packets], dtype=np.uint8),
+            "packets": len(packets),
+            "gap_packets": sum(p.get("gap_packets", 0) for p in packets),
+            "gap_events": sum(1 for p in packets if p.get("gap_packets")),
+            "outage_packets": sum(p.get("outage_packets", 0) for p in packets),
+            "packet_samples": np.array([p["sample_count"] for p in packets]),
+            "arrival_time": np.array([p.get("arrival_time", np.nan) for p in packets]),
+        }
 
 
 class BluetoothDevice(QObject):
     data_received_signal = Signal(dict)
     device_info_signal = Signal(dict)
+    stats_signal = Signal(dict)  # 每 stats_interval 秒发出一次 LinkStatistics.snapshot()
+    state_signal = Signal(str)  # 连接状态变化，取值见 STATES
+    link_gap_signal = Signal(dict)  # 断线重连成功后发出本次中断的信息
+
+    STATES = ("disconnected", "connecting", "connected", "streaming", "reconnecting")
 
-    def __init__(self, device_name):
+    def __init__(self, device_name, coalesce_packets=5, coalesce_ms=50, gap_policy="linear", sample_rate=500):
+        '''
+        coalesce_packets / coalesce_ms: 每耳最多累积多少个包、多少毫秒后合并发出一次 data_received_signal
+        gap_policy: 丢包补齐策略 ("nan", "linear", "zero")，见 PacketSequenceTracker，断线期间的数据也按它补齐
+        sample_rate: 标称采样率，用于估计断线期间丢失的样本数
+        '''
         super().__init__()
         self.device_name = device_name
         self.client = None
-
-        self.left_packet_count = 0
-        self.right_packet_count = 0
-
-    async def connect(self) -> str:
+        self.notification_handler = tools.NotificationHandler()  # 每个设备单独保存设备信息(含字节序)
+        self.coalescer = PacketCoalescer(self._publish,
+                                         max_packets=coalesce_packets, max_delay_ms=coalesce_ms)
+        self.sinks = []  # 在 BLE 事件循环线程中直接接收每批数据的回调 (共享内存总线、流式服务等)
+
+        self.stats = LinkStatistics()
+        self.sequence = {side: PacketSequenceTracker(policy=gap_policy) for side in ("left", "right")}
+        # 每耳已发出的样本数 (含补齐) 与到达时间的时钟模型，重连后据此补齐断线期间的样本，
+        # 保证样本索引始终与时间对应
+        self.sample_index = {side: 0 for side in ("left", "right")}
+        self.clocks = {side: EarClock(sample_rate) for side in ("left", "right")}
+        self._resumed = set()  # 重连后还没有收到第一个包的耳朵
+        self.stats_interval = 1.0  # 统计周期(秒)
+        self._loop = None
+        self._stop_event = None
+        self._device_info_event = None
+
+        # 断线重连
+        self.state = "disconnected"
+        self.address = None  # 最近一次成功连接的地址
+        self.reconnect_initial_delay = 0.5  # 第一次重连前等待(秒)，之后每次翻倍
+        self.reconnect_max_delay = 10.0  # 两次重连之间最长等待(秒)
+        self.reconnect_max_attempts = None  # 最多重连次数，None 表示直到 stop() 为止
+        self._link_lost = None
+        self._closing = False  # 主动断开时不触发重连
+
+    def add_sink(self, sink):
+        """
+        添加数据接收回调 sink(data)，data 与 data_received_signal 的格式相同
+        sink 在 BLE 事件循环线程中同步调用，必须很快返回，不能阻塞
+        """
+        if sink not in self.sinks:
+            self.sinks = self.sinks + [sink]  # 整体替换，事件循环线程遍历时不受影响
+
+    def remove_sink(self, sink):
+        self.sinks = [s for s in self.sinks if s != sink]
+
+    def _publish(self, data):
+        """合并后的一批数据：先交给各个 sink，再发出 data_received_signal"""
+        for sink in self.sinks:
+            try:
+                sink(data)
+            except Exception as e:
+                print(f"数据回调 {sink} 出错: {e}")
+        self.data_received_signal.emit(data)
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.state_signal.emit(state)
+
+    async def connect(self, scan_timeout=10.0) -> str:
         '''
         根据设备名称连接设备，连接成功返回 ok， 否则返回失败原因
-        需要注意的是，连接成功的话，设备信息会通过 notification_handler.handle_notification 处理
+        设备地址有缓存时直接按地址连接，缓存地址连接失败再扫描；扫描时一看到目标设备就停止
+        需要注意的是，连接成功的话，设备信息会通过 self.notification_handler 处理
         现在是会打印出设备信息
-        TODO : 在ui中显示设备信息
         '''
-        print("正在扫描设备...")
-        devices = await BleakScanner.discover()
-        target = next((d for d in devices if d.name == self.device_name), None)
+        self._set_state("connecting")
+        record = device_scanner.cached(self.device_name)
+        if record:
+            print(f"使用缓存地址连接: {record['address']}")
+            if await self._connect_address(record["address"]) == "ok":
+                return "ok"
+            device_scanner.forget(self.device_name)
 
-        if not target:
+        print("正在扫描设备...")
+        record = await device_scanner.find(self.device_name, timeout=scan_timeout)
+        if not record:
             print(f"未找到设备: {self.device_name}")
+            self._set_state("disconnected")
             return f"未找到设备: {self.device_name}"
-        
-        print(f"找到设备: {target.name}, 地址: {target.address}")
 
+        print(f"找到设备: {self.device_name}, 地址: {record['address']}, RSSI: {record['rssi']}")
+        return await self._connect_address(record["address"])
+
+    async def _connect_address(self, address, info_timeout=1.0) -> str:
         try:
-            self.client = BleakClient(target.address)
+            self._closing = False
+            self.client = BleakClient(address, disconnected_callback=self._handle_disconnect)
             await self.client.connect()
+            self.address = address
 
             # 启用通知
+            self._device_info_event = asyncio.Event()
             await self.client.start_notify(tools.CMD_NOTIFY_UUID, self._handle_cmd)
             print("已启用命令通知")
             # 初始化 - 发送获取设备信息命令
             print("发送获取设备信息命令...")
             await self.client.write_gatt_char(tools.CMD_WRITE_UUID, tools.GET_INFO_CMD)
-            # 等待命令响应
-            await asyncio.sleep(1.0)
-
+            # 等待命令响应，收到设备信息即可返回
+            if info_timeout:
+                try:
+                    await asyncio.wait_for(self._device_info_event.wait(), info_timeout)
+                except asyncio.TimeoutError:
+                    print("等待设备信息超时")
+
+            if self.state != "reconnecting":
+                self._set_state("connected")
             return "ok"
         
         except Exception as e:
             self.client = None
             print(f"连接失败: {str(e)}")
+            if self.state != "reconnecting":
+                self._set_state("disconnected")
             return f"连接失败: {str(e)}"
-        
+
+    def _handle_disconnect(self, client):
+        """BleakClient 的断开回调 (在事件循环线程中调用)"""
+        if client is not self.client or self._closing:
+            return
+        print("设备连接已断开")
+        if self._link_lost is not None:
+            self._link_lost.set()
+        else:
+            self._set_state("disconnected")
+
+    @staticmethod
+    async def scan(timeout=5.0):
+        """扫描周围的设备，返回 [(名称, 地址), ...]，结果同时写入设备缓存"""
+        names = await device_scanner.discover(timeout=timeout)
+        return [(name, device_scanner.devices[name]["address"]) for name in names]
+
+    async def disconnect(self):
+        """断开连接，正在接收数据时先停止数据流"""
+        self._closing = True
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self.client and self.client.is_connected:
+            await self.client.disconnect()
+            print("已断开连接")
+        self._set_state("disconnected")
+
+    async def write_command(self, command: bytes, uuid=tools.CMD_WRITE_UUID):
+        """向设备写入命令"""
+        await self.client.write_gatt_char(uuid, command)
 
     async def _handle_cmd(self, sender, data):
         """处理通知数据"""
         sender_uuid = str(sender)
 
         if tools.CMD_NOTIFY_UUID in sender_uuid:
-            res = notification_handler.handle_command_notification(data)
+            res = self.notification_handler.handle_command_notification(data)
         elif tools.DATA_LEFT_NOTIFY_UUID in sender_uuid:
-            return notification_handler.handle_data_notification(data, "left")
+            return self.notification_handler.handle_data_notification(data, "left")
         elif tools.DATA_RIGHT_NOTIFY_UUID in sender_uuid:
-            return notification_handler.handle_data_notification(data, "right")
+            return self.notification_handler.handle_data_notification(data, "right")
         else:
             return print(f"CMD HANDLER收到未知特征通知: {data.hex(' ')}")
             
         
         if res and res['type'] == "device_info":
             self.device_info_signal.emit(res)
+            if self._device_info_event is not None:
+                self._device_info_event.set()
             
 
 
     async def get_messages(self):
+        """
+        开启数据通知并持续接收，直到 stop() 被调用
+        接收期间连接断开会自动重连 (指数退避)，重连后重新开启数据流
+        """
         if self.client and not self.client.is_connected:
             await self.client.connect()
 
         print("still connect!")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._link_lost = asyncio.Event()
+
+        await self._start_stream()
 
+        # 数据由通知回调驱动，这里只等待停止或断线事件，统计结果由单独的任务定期发出
+        reporter = asyncio.create_task(self._report_stats())
+        try:
+            while not self._stop_event.is_set():
+                await self._wait_any(self._stop_event, self._link_lost)
+                if self._stop_event.is_set():
+                    break
+                if not await self._reconnect():
+                    break
+        finally:
+            reporter.cancel()
+            self.coalescer.flush()
+            self._link_lost = None
+            if self.client and self.client.is_connected:
+                await self.client.stop_notify(tools.DATA_LEFT_NOTIFY_UUID)
+                await self.client.stop_notify(tools.DATA_RIGHT_NOTIFY_UUID)
+                self._set_state("connected")
+            else:
+                self._set_state("disconnected")
+            print("已停止接收数据")
+
+    async def _start_stream(self):
         await self.client.start_notify(tools.DATA_LEFT_NOTIFY_UUID, self._handle_data)
         print("已启用左耳数据通知")
 
@@ -95,29 +311,87 @@ class BluetoothDevice(QObject):
         # 发送打开数据命令
         print("发送打开数据命令，开始接收耳道信号...")
         await self.client.write_gatt_char(tools.CMD_WRITE_UUID, tools.OPEN_DATA_CMD)
+        self._set_state("streaming")
 
-        # 等待命令响应
-        await asyncio.sleep(0.5)
+    @staticmethod
+    async def _wait_any(*events, timeout=None):
+        """等待任意一个事件被设置或超时"""
+        waiters = [asyncio.create_task(event.wait()) for event in events]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _reconnect(self) -> bool:
+        """
+        断线后按指数退避重连并恢复数据流，成功返回 True，
+        被 stop() 打断或超过最大重连次数返回 False
+        """
+        gap_start = time.perf_counter()
+        self.coalescer.flush()  # 断线前已收到的数据先发出
+        self._set_state("reconnecting")
+
+        # 重连后包序号重新开始，不与断线前的数据衔接；断线期间的样本在每耳第一个包到达时补齐。
+        # 在恢复数据流之前重置，重连过程中到达的包已经按新的起点处理
+        for tracker in self.sequence.values():
+            tracker.reset()
+        self.stats.reset_sequence()
+        self._resumed = {side for side, clock in self.clocks.items() if clock.points}
+
+        delay = self.reconnect_initial_delay
+        attempts = 0
+        while not self._stop_event.is_set():
+            if self.reconnect_max_attempts is not None and attempts >= self.reconnect_max_attempts:
+                print(f"重连 {attempts} 次均失败，停止接收数据")
+                return False
+            attempts += 1
+            print(f"第 {attempts} 次尝试重连...")
+            # 之前的尝试中连上又断开时 _link_lost 会被再次设置，每次连接前清除，
+            # 只有本次连接之后的断开才会让 get_messages 再次重连
+            self._link_lost.clear()
+            # 重连时不必等待设备信息，设备信息到达后仍会通过 device_info_signal 发出
+            if await self._connect_address(self.address, info_timeout=0) == "ok":
+                try:
+                    await self._start_stream()
+                except Exception as e:
+                    print(f"恢复数据流失败: {e}")
+                    # 下次尝试会新建 BleakClient，先断开这个已连接的客户端，避免它继续发送通知
+                    # (先从 self.client 移除，断开回调不会再触发重连)
+                    client, self.client = self.client, None
+                    try:
+                        await client.disconnect()
+                    except Exception:
+                        pass
+                else:
+                    break
+            await self._wait_any(self._stop_event, timeout=delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+        else:
+            return False
 
-        # 接收信号
-        last_time = time.time()
+        gap_end = time.perf_counter()
+        gap = {"start": gap_start, "end": gap_end, "duration": gap_end - gap_start, "attempts": attempts}
+        print(f"重连成功，数据中断 {gap['duration']:.2f} 秒")
+        self.link_gap_signal.emit(gap)
+        return True
 
-        while True:
-            await asyncio.sleep(0.02)  # 减少CPU占用，并且保持连接状态
+    def stop(self):
+        """停止 get_messages，可以在任意线程调用"""
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 
-            # 每秒更新时间
-            current_time = time.time()
-            if current_time - last_time >= 1:  # 每秒钟
-                last_time = current_time
-                # 每秒发射数据包数量
-                print(f"左耳耳机每秒接收的数据包数量: {self.left_packet_count}")  # 输出到控制台
-                print(f"右耳耳机每秒接收的数据包数量: {self.right_packet_count}")  # 输出到控制台
-                # 重置包计数
-                self.left_packet_count = 0
-                self.right_packet_count = 0
+    def get_stats(self):
+        """最近一次统计周期的结果，尚未统计时返回 None"""
+        return self.stats.last_snapshot
 
+    async def _report_stats(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.stats_signal.emit(self.stats.snapshot())
 
     async def _handle_data(self, characteristic, data: bytearray):
+        arrival = time.perf_counter()
         # 确定左右耳/信息数据
         characteristic = str(characteristic)
         if tools.DATA_LEFT_NOTIFY_UUID in characteristic:
@@ -128,17 +402,40 @@ class BluetoothDevice(QObject):
             print(f"DATA HANDLER收到未知特征通知: {data.hex(' ')}")
             return
         
-        # 解析数据
-        parse_result = tools.DataParser.parse_eeg_data(data, side)
-        if parse_result:
-            if side == "left":
-                self.left_packet_count += 1
-            else:
-                self.right_packet_count += 1
-            self.data_received_signal.emit(parse_result)
+        # 检查数据包，失败原因计入统计
+        error = tools.DataParser.check_eeg_packet(data, side)
+        if error is not None:
+            self.stats.record_error(side, error)
+            return
+
+        # 解析数据 (字节序以设备信息上报为准，未收到设备信息时按小端处理)
+        device_info = self.notification_handler.device_info
+        endian = device_info["endian"] if device_info else 0
+        parse_result = tools.DataParser.parse_eeg_data(data, side, endian=endian, verify=False)
+        parse_result["arrival_time"] = arrival
+
+        # 按包序号补齐丢失的样本，重复包直接丢弃
+        sample_count = parse_result["sample_count"]
+        outage = self._outage_packets(side, sample_count, arrival) if side in self._resumed else 0
+        parse_result = self.sequence[side].process(parse_result, outage=outage)
+        if parse_result is None:
+            return
+        self._resumed.discard(side)
+        self.stats.record_packet(side, sample_count, dropped=parse_result["gap_packets"], arrival=arrival)
+        self.sample_index[side] += parse_result["sample_count"]
+        self.clocks[side].observe(self.sample_index[side], arrival)
+        self.coalescer.add(parse_result)
+
+    def _outage_packets(self, side, sample_count, arrival):
+        """重连后第一个包：按断线前的时钟估计这个包结束时的样本索引，差值即断线期间丢失的包数"""
+        expected = float(self.clocks[side].index_at(arrival))
+        samples_per_packet = self.sequence[side].samples_per_packet
+        missing = (expected - self.sample_index[side] - sample_count) / samples_per_packet
+        return max(0, int(round(missing)))
 
 
 class BleConnectThread(QThread):
+    """在共享BLE事件循环上连接设备，等待结果后通过 finished 信号返回"""
     finished = Signal(str)
 
     def __init__(self, ble_device):
@@ -146,19 +443,18 @@ class BleConnectThread(QThread):
         self.ble_device = ble_device
 
     def run(self):
-        import asyncio
-        res = asyncio.run(self.ble_device.connect())
+        res = get_ble_loop().run_sync(self.ble_device.connect())
         self.finished.emit(res)
 
 
 class BleGetMessageThread(QThread):
+    """在共享BLE事件循环上接收数据，直到 ble_device.stop() 被调用"""
     def __init__(self, ble_device):
         super().__init__()
         self.ble_device = ble_device
 
     def run(self):
-        import asyncio
-        asyncio.run(self.ble_device.get_messages())
+        get_ble_loop().run_sync(self.ble_device.get_messages())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from . import tools
+
+
+class BleEventLoopThread(threading.Thread):
+    """
+    BLE事件循环线程：
+        整个程序只运行一个长期存在的 asyncio 事件循环，所有 BLE 操作都提交到这里执行，
+        BleakClient 始终绑定在同一个事件循环上，不会因为跨事件循环而需要重连
+    """
+
+    def __init__(self):
+        super().__init__(name="ble-event-loop", daemon=True)
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        self.loop.run_forever()
+
+    def start(self):
+        super().start()
+        self._started.wait()
+
+    def submit(self, coro):
+        """提交协程，返回 concurrent.futures.Future，可在任意线程调用"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro, timeout=None):
+        """提交协程并阻塞等待结果（不要在事件循环线程中调用）"""
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_ble_loop() -> BleEventLoopThread:
+    """获取全局共享的BLE事件循环线程，第一次调用时启动"""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = BleEventLoopThread()
+            _shared_loop.start()
+        return _shared_loop
+
+
+class BleController(QObject):
+    """
+    BLE命令接口：
+        把扫描、连接、开始/停止数据流、断开、写命令提交到共享事件循环执行，
+        每个方法立即返回 concurrent.futures.Future，完成后再通过 command_finished 信号通知界面线程
+    """
+    command_finished = Signal(str, object)  # 命令名, 结果 (出错时为异常对象)
+
+    def __init__(self, device, ble_loop=None):
+        super().__init__()
+        self.device = device
+        self.ble_loop = ble_loop or get_ble_loop()
+        self.stream_future = None
+
+    def _submit(self, name, coro):
+        future = self.ble_loop.submit(coro)
+
+        def done(f):
+            if f.cancelled():
+                return
+            error = f.exception()
+            self.command_finished.emit(name, error if error is not None else f.result())
+
+        future.add_done_callback(done)
+        return future
+
+    def scan(self, timeout=5.0):
+        return self._submit("scan", self.device.scan(timeout))
+
+    def connect(self):
+        return self._submit("connect", self.device.connect())
+
+    def start_stream(self):
+        """开始接收数据，返回的 Future 在数据流停止后完成"""
+        self.stream_future = self._submit("stream", self.device.get_messages())
+        return self.stream_future
+
+    def stop_stream(self):
+        self.device.stop()
+        return self.stream_future
+
+    def disconnect(self):
+        return self._submit("disconnect", self.device.disconnect())
+
+    def write_command(self, command, uuid=tools.CMD_WRITE_UUID):
+        return self._submit("write", self.device.write_command(command, uuid))
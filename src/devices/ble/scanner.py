@@ -0,0 +1,98 @@
+import asyncio
+import json
+import os
+import time
+
+from bleak import BleakScanner
+
+
+class BleScanner:
+    """
+    BLE扫描服务：
+        扫描时通过检测回调记录看到的每个设备 (名称 -> 地址、RSSI、最后看到的时间)，
+        查找指定设备时一看到目标名称就停止扫描，不必等完整个扫描超时；
+        重连时可以直接使用缓存的地址，跳过扫描
+    """
+
+    def __init__(self, cache_path=None):
+        self.devices = {}  # 名称 -> {"address": 地址, "rssi": 信号强度, "last_seen": 时间戳}
+        self.cache_path = cache_path
+        if cache_path:
+            self.load(cache_path)
+
+    def _record(self, device, advertisement_data):
+        name = device.name or advertisement_data.local_name
+        if not name:
+            return None
+        self.devices[name] = {
+            "address": device.address,
+            "rssi": advertisement_data.rssi,
+            "last_seen": time.time(),
+        }
+        return name
+
+    def cached(self, name, max_age=None):
+        """缓存中的设备记录，不存在或超过 max_age 秒未看到时返回 None"""
+        record = self.devices.get(name)
+        if record is None:
+            return None
+        if max_age is not None and time.time() - record["last_seen"] > max_age:
+            return None
+        return record
+
+    async def find(self, name, timeout=10.0):
+        """扫描直到看到名称为 name 的设备，返回设备记录，超时返回 None"""
+        found = asyncio.Event()
+
+        def detection_callback(device, advertisement_data):
+            if self._record(device, advertisement_data) == name:
+                found.set()
+
+        async with BleakScanner(detection_callback=detection_callback):
+            try:
+                await asyncio.wait_for(found.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        self.save()
+        return self.devices[name]
+
+    async def discover(self, timeout=5.0):
+        """完整扫描 timeout 秒，返回本次看到的设备名称列表"""
+        seen = set()
+
+        def detection_callback(device, advertisement_data):
+            name = self._record(device, advertisement_data)
+            if name:
+                seen.add(name)
+
+        async with BleakScanner(detection_callback=detection_callback):
+            await asyncio.sleep(timeout)
+        self.save()
+        return sorted(seen)
+
+    def forget(self, name):
+        """删除缓存的设备 (例如缓存地址连接失败时)"""
+        self.devices.pop(name, None)
+        self.save()
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.devices.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"读取设备缓存失败: {e}")
+
+    def save(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.devices, f, ensure_ascii=False, indent=4)
+        except OSError as e:
+            print(f"保存设备缓存失败: {e}")
+
+
+# 全局扫描服务，所有 BluetoothDevice 共享同一份设备缓存
+device_scanner = BleScanner()
@@ -0,0 +1,134 @@
+from PySide6.QtCore import QObject, Qt, Signal
+
+from .get_message import BluetoothDevice
+from .loop import BleController, get_ble_loop
+from ..stream.sample_store import SampleStore
+
+
+class HeadsetSession(QObject):
+    """
+    单个耳机的会话：
+        持有 BluetoothDevice 和它的 BleController，可选地保存两耳数据 (环形缓冲)
+        并驱动一对绘图器，最近一次链路统计保存在 stats 中
+    """
+    stats_signal = Signal(str, dict)  # 设备名, LinkStatistics.snapshot()
+
+    def __init__(self, device_name, ble_loop, sample_rate=500, buffer_seconds=600, store_data=True,
+                 left_plotter=None, right_plotter=None, **device_kwargs):
+        super().__init__()
+        self.device_name = device_name
+        self.device = BluetoothDevice(device_name, **device_kwargs)
+        self.controller = BleController(self.device, ble_loop)
+        self.stats = None
+
+        self.stores = None
+        if store_data:
+            capacity = buffer_seconds * sample_rate
+            self.stores = {side: SampleStore(capacity, ring=True) for side in ("left", "right")}
+        self.plotters = {"left": left_plotter, "right": right_plotter}
+
+        self.device.data_received_signal.connect(self._handle_data_received)
+        # 绘图器在 BLE 线程中写缓冲区，界面线程按定时器重绘
+        self.device.data_received_signal.connect(self._feed_plotters, Qt.DirectConnection)
+        self.device.stats_signal.connect(self._handle_stats_signal)
+
+    def _handle_data_received(self, data):
+        side = data["ear_side"]
+        if self.stores is not None:
+            self.stores[side].append(data["samples"])
+
+    def _feed_plotters(self, data):
+        plotter = self.plotters[data["ear_side"]]
+        if plotter is not None:
+            plotter.ingest(data["samples"])
+
+    def _handle_stats_signal(self, stats):
+        self.stats = stats
+        self.stats_signal.emit(self.device_name, stats)
+
+
+class SessionManager(QObject):
+    """
+    多耳机会话管理：
+        所有设备共享同一个 BLE 事件循环线程，每个设备有独立的数据缓冲、统计和绘图器；
+        aggregate_stats() 汇总所有设备的吞吐量和丢包率，用来判断一台主机能同时稳定接收多少个耳机
+    """
+    aggregate_stats_signal = Signal(dict)  # 任一设备的统计更新时发出 aggregate_stats()
+
+    def __init__(self, ble_loop=None, sample_rate=500, buffer_seconds=600, max_drop_ratio=0.01):
+        super().__init__()
+        self.ble_loop = ble_loop or get_ble_loop()
+        self.sample_rate = sample_rate
+        self.buffer_seconds = buffer_seconds
+        self.max_drop_ratio = max_drop_ratio  # 丢包率超过该值的设备视为接收不稳定
+        self.sessions = {}  # 设备名 -> HeadsetSession
+
+    def add(self, device_name, **kwargs) -> HeadsetSession:
+        """添加一个设备，已存在时返回原有会话；kwargs 传给 HeadsetSession (及 BluetoothDevice)"""
+        if device_name in self.sessions:
+            return self.sessions[device_name]
+        kwargs.setdefault("sample_rate", self.sample_rate)
+        kwargs.setdefault("buffer_seconds", self.buffer_seconds)
+        session = HeadsetSession(device_name, self.ble_loop, **kwargs)
+        session.stats_signal.connect(self._handle_stats_signal)
+        self.sessions[device_name] = session
+        return session
+
+    def remove(self, device_name):
+        """断开并移除一个设备，返回断开操作的 Future"""
+        session = self.sessions.pop(device_name, None)
+        if session is None:
+            return None
+        return session.controller.disconnect()
+
+    def connect_all(self):
+        """并行连接所有设备，返回 {设备名: Future}"""
+        return {name: session.controller.connect() for name, session in self.sessions.items()}
+
+    def start_all(self):
+        return {name: session.controller.start_stream() for name, session in self.sessions.items()}
+
+    def stop_all(self):
+        return {name: session.controller.stop_stream() for name, session in self.sessions.items()}
+
+    def disconnect_all(self):
+        return {name: session.controller.disconnect() for name, session in self.sessions.items()}
+
+    def aggregate_stats(self):
+        """
+        汇总各设备最近一次统计:
+        {
+            "devices": {设备名: {"packets_per_s", "samples_per_s", "dropped_packets", "drop_ratio", "healthy"}},
+            "packets_per_s", "samples_per_s", "dropped_packets": 所有设备合计,
+            "streaming": 有统计结果的设备数, "healthy": 丢包率未超限的设备数,
+            "sustainable": 所有设备丢包率都未超限,
+        }
+        """
+        result = {"devices": {}, "packets_per_s": 0.0, "samples_per_s": 0.0, "dropped_packets": 0,
+                  "streaming": 0, "healthy": 0}
+        for name, session in self.sessions.items():
+            stats = session.stats
+            if stats is None:
+                continue
+            ears = (stats["left"], stats["right"])
+            packets = sum(ear["packets"] for ear in ears)
+            dropped = sum(ear["dropped_packets"] for ear in ears)
+            drop_ratio = dropped / (packets + dropped) if packets + dropped else 0.0
+            device = {
+                "packets_per_s": sum(ear["packets_per_s"] for ear in ears),
+                "samples_per_s": sum(ear["samples_per_s"] for ear in ears),
+                "dropped_packets": dropped,
+                "drop_ratio": drop_ratio,
+                "healthy": drop_ratio <= self.max_drop_ratio,
+            }
+            result["devices"][name] = device
+            result["packets_per_s"] += device["packets_per_s"]
+            result["samples_per_s"] += device["samples_per_s"]
+            result["dropped_packets"] += dropped
+            result["streaming"] += 1
+            result["healthy"] += device["healthy"]
+        result["sustainable"] = result["healthy"] == result["streaming"]
+        return result
+
+    def _handle_stats_signal(self, device_name, stats):
+        self.aggregate_stats_signal.emit(self.aggregate_stats())
@@ -0,0 +1,102 @@
+import bisect
+import threading
+import time
+
+
+class LinkStatistics:
+    """
+    链路统计：
+        在BLE事件循环线程中记录每只耳朵的收包情况，snapshot() 汇总一个统计周期的结果，
+        包括包率、样本率、CRC失败数、耳标志不匹配数、丢包数(由 PacketSequenceTracker 给出)和到达间隔直方图
+    """
+
+    # 到达间隔直方图的桶上界(毫秒)，最后一个桶统计超过最大上界的间隔
+    JITTER_BINS_MS = (20, 50, 80, 95, 105, 120, 150, 200, 500, 1000)
+    ERROR_REASONS = ("format", "crc", "ear_flag")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.totals = {side: self._new_counters() for side in ("left", "right")}
+        self._window = {side: self._new_counters() for side in ("left", "right")}
+        self._window_start = self.started
+        self._last_arrival = {"left": None, "right": None}
+        self.last_snapshot = None
+
+    def _new_counters(self):
+        counters = {
+            "packets": 0,
+            "samples": 0,
+            "dropped_packets": 0,
+            "jitter_hist": [0] * (len(self.JITTER_BINS_MS) + 1),
+            "interval_sum": 0.0,
+            "interval_sq_sum": 0.0,
+            "intervals": 0,
+        }
+        counters.update({f"{reason}_errors": 0 for reason in self.ERROR_REASONS})
+        return counters
+
+    def record_packet(self, side, sample_count, dropped=0, arrival=None):
+        """记录一个解析成功的数据包，dropped 为它之前丢失的包数"""
+        arrival = time.perf_counter() if arrival is None else arrival
+        with self._lock:
+            last_arrival = self._last_arrival[side]
+            self._last_arrival[side] = arrival
+
+            for counters in (self.totals[side], self._window[side]):
+                counters["packets"] += 1
+                counters["samples"] += sample_count
+                counters["dropped_packets"] += dropped
+                if last_arrival is not None:
+                    interval = (arrival - last_arrival) * 1000
+                    counters["jitter_hist"][bisect.bisect_left(self.JITTER_BINS_MS, interval)] += 1
+                    counters["interval_sum"] += interval
+                    counters["interval_sq_sum"] += interval * interval
+                    counters["intervals"] += 1
+
+    def record_error(self, side, reason):
+        """记录一个被丢弃的数据包，reason 取 ERROR_REASONS 之一"""
+        with self._lock:
+            for counters in (self.totals[side], self._window[side]):
+                counters[f"{reason}_errors"] += 1
+
+    def reset_sequence(self, side=None):
+        """清除到达时间记录（例如重连后），下一个包不计入到达间隔"""
+        with self._lock:
+            for ear in ([side] if side else ["left", "right"]):
+                self._last_arrival[ear] = None
+
+    def snapshot(self, now=None):
+        """
+        汇总从上次 snapshot 到现在的统计结果并开始新的统计周期
+        返回 {"interval": 秒, "uptime": 秒, "left": {...}, "right": {...}}，每耳的 "totals" 为自启动以来的累计值
+        """
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            window, self._window = self._window, {side: self._new_counters() for side in ("left", "right")}
+            elapsed = max(now - self._window_start, 1e-9)
+            self._window_start = now
+
+            result = {"interval": elapsed, "uptime": now - self.started, "jitter_bins_ms": self.JITTER_BINS_MS}
+            for side in ("left", "right"):
+                result[side] = self._summarize(window[side], elapsed)
+                result[side]["totals"] = self._summarize(self.totals[side], now - self.started)
+            self.last_snapshot = result
+            return result
+
+    def _summarize(self, counters, elapsed):
+        intervals = counters["intervals"]
+        mean = counters["interval_sum"] / intervals if intervals else 0.0
+        variance = counters["interval_sq_sum"] / intervals - mean * mean if intervals else 0.0
+        summary = {
+            "packets": counters["packets"],
+            "samples": counters["samples"],
+            "packets_per_s": counters["packets"] / elapsed,
+            "samples_per_s": counters["samples"] / elapsed,
+            "dropped_packets": counters["dropped_packets"],
+            "interval_mean_ms": mean,
+            "interval_std_ms": max(variance, 0.0) ** 0.5,
+            "jitter_hist": list(counters["jitter_hist"]),
+        }
+        summary.update({f"{reason}_errors": counters[f"{reason}_errors"] for reason in self.ERROR_REASONS})
+        return summary
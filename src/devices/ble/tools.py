@@ -1,6 +1,7 @@
 import asyncio
 from bleak import BleakClient, BleakScanner
 import struct
+import numpy as np
 
 
 # 命令服务
@@ -21,6 +22,7 @@ OPEN_DATA_CMD = bytes.fromhex("AA 55 01 01 00 55 AA 2D")
 MAX_MILLI_VOLT = 5000  # 最大量程：±2500mV
 MAGNIFICATION = 1000.0 / 24  # 1000mV转uV，24倍放大系数
 FULL_RANGE_DATA = 16777215  # 2^24-1，24bit最大值
+SAMPLE_SCALE = MAX_MILLI_VOLT * MAGNIFICATION / FULL_RANGE_DATA  # 原始值到uV的换算系数
 
 
 class DataParser:
@@ -31,7 +33,15 @@ class DataParser:
 
     @staticmethod
     def crc8_maxim(data):
-        """CRC8校验"""
+        """CRC8校验（查表实现）"""
+        crc = 0
+        for byte in data:
+            crc = CRC8_MAXIM_TABLE[crc ^ byte]
+        return crc
+
+    @staticmethod
+    def crc8_maxim_bitwise(data):
+        """CRC8校验（逐位实现，用于生成查找表和对照测试）"""
         crc = 0
         for byte in data:
             crc ^= byte
@@ -42,6 +52,32 @@ class DataParser:
                     crc >>= 1
         return crc
 
+    @staticmethod
+    def verify_many(packets):
+        """
+        批量CRC校验：packets 为等长数据包列表或二维 uint8 数组 (包数, 包长)
+        每个包最后一字节为CRC，返回布尔数组，按列查表一次校验所有包
+        """
+        if isinstance(packets, np.ndarray):
+            array = np.asarray(packets, dtype=np.uint8)
+        else:
+            packets = list(packets)
+            if not packets:
+                return np.zeros(0, dtype=bool)
+            length = len(packets[0])
+            if any(len(p) != length for p in packets):
+                raise ValueError("verify_many 只支持等长数据包")
+            array = np.frombuffer(b"".join(bytes(p) for p in packets), dtype=np.uint8)
+            array = array.reshape(len(packets), length)
+
+        if array.ndim != 2 or array.shape[1] < 2:
+            raise ValueError(f"数据包数组形状应为 (包数, 包长)，实际为 {array.shape}")
+
+        crc = np.zeros(array.shape[0], dtype=np.uint8)
+        for column in range(array.shape[1] - 1):
+            crc = CRC8_MAXIM_TABLE_NP[crc ^ array[:, column]]
+        return crc == array[:, -1]
+
     @staticmethod
     def parse_device_info(data):
         """解析设备信息响应"""
@@ -74,27 +110,40 @@ class DataParser:
         return info
 
     @staticmethod
-    def parse_eeg_data(data, ear_side):
-        """解析EEG数据包"""
+    def check_eeg_packet(data, ear_side):
+        """检查EEG数据包格式、CRC和耳标志，合法返回 None，否则返回原因 ("format", "crc", "ear_flag")"""
         if len(data) < 10 or data[0:2] != b"\xAA\x55" or data[-3:-1] != b"\x55\xAA":
-            return None
+            return "format"
 
         # 检查CRC
         if DataParser.crc8_maxim(data[:-1]) != data[-1]:
             print(f"CRC校验失败")
-            return None
-
-        # 解析数据包头部
-        protocol_cmd = data[2]
-        ear_flag = data[3]  # 00左耳, 01右耳
-        data_length = data[4]
+            return "crc"
 
         # 验证耳标志与传入参数的一致性
+        ear_flag = data[3]  # 00左耳, 01右耳
         expected_flag = 0 if ear_side == "left" else 1
         if ear_flag != expected_flag:
             print(f"耳标志不匹配: 期望={expected_flag}, 实际={ear_flag}")
+            return "ear_flag"
+
+        return None
+
+    @staticmethod
+    def parse_eeg_data(data, ear_side, endian=0, dtype=np.float64, verify=True):
+        """
+        解析EEG数据包
+        endian: 样本字节序，取 parse_device_info 返回的 endian (0小端, 1大端)
+        verify: 是否先做 check_eeg_packet 检查，调用方已检查过时可传 False
+        返回的 samples 为一维 np.ndarray(dtype)
+        """
+        if verify and DataParser.check_eeg_packet(data, ear_side) is not None:
             return None
 
+        # 解析数据包头部
+        protocol_cmd = data[2]
+        data_length = data[4]
+
         # 提取有效载荷 (50组24bit数据)
         payload = data[5:5 + data_length]
 
@@ -103,6 +152,45 @@ class DataParser:
         packet_count = data[-4]  # 数据包累加值
 
         # 解析EEG样本
+        samples = DataParser.decode_samples(payload, endian=endian, dtype=dtype)
+
+        result = {
+            "ear_side": ear_side,
+            "protocol_cmd": protocol_cmd,
+            "data_length": data_length,
+            "lead_off": lead_off,
+            "packet_count": packet_count,
+            "samples": samples,
+            "sample_count": len(samples)
+        }
+
+        return result
+
+    @staticmethod
+    def decode_samples(payload, endian=0, dtype=np.float64):
+        """
+        向量化解码24bit有符号样本，返回uV为单位的 np.ndarray
+        把每3字节放进int32的高24位，再算术右移8位，一次完成拼接和符号扩展
+        """
+        count = len(payload) // 3
+        raw = np.frombuffer(payload, dtype=np.uint8, count=count * 3).reshape(count, 3)
+
+        words = np.zeros((count, 4), dtype=np.uint8)
+        if endian:
+            # 大端: 高字节在前，int32按大端解释
+            words[:, :3] = raw
+            values = words.view(">i4").reshape(count)
+        else:
+            # 小端: 低字节在前，最低字节留给移位
+            words[:, 1:] = raw
+            values = words.view("<i4").reshape(count)
+        values = values.astype(np.int32) >> 8
+
+        return values.astype(dtype) * np.dtype(dtype).type(SAMPLE_SCALE)
+
+    @staticmethod
+    def decode_samples_scalar(payload, endian=0):
+        """逐样本解码（参考实现，用于校验 decode_samples）"""
         samples = []
         for i in range(0, len(payload), 3):
             if i + 3 > len(payload):
@@ -111,28 +199,26 @@ class DataParser:
             # 提取3字节样本
             sample_bytes = payload[i:i + 3]
 
-            # 24bit转int (小端模式)
-            value = (sample_bytes[2] << 16) | (sample_bytes[1] << 8) | sample_bytes[0]
+            # 24bit转int
+            if endian:
+                value = (sample_bytes[0] << 16) | (sample_bytes[1] << 8) | sample_bytes[2]
+            else:
+                value = (sample_bytes[2] << 16) | (sample_bytes[1] << 8) | sample_bytes[0]
 
-            # 符号扩展
+            # 符号扩展 (Python整数无固定位宽，需减去2^24才能得到负数)
             if (value & (1 << 23)) > 0:
-                value = (0xff << 24) | value
+                value -= 1 << 24
 
             # 转换为uV
             uV_value = value * MAX_MILLI_VOLT * MAGNIFICATION / FULL_RANGE_DATA
             samples.append(uV_value)
 
-        result = {
-            "ear_side": ear_side,
-            "protocol_cmd": protocol_cmd,
-            "data_length": data_length,
-            "lead_off": lead_off,
-            "packet_count": packet_count,
-            "samples": samples,
-            "sample_count": len(samples)
-        }
+        return samples
 
-        return result
+
+# CRC8-Maxim 查找表：每个字节值经过8次移位后的结果
+CRC8_MAXIM_TABLE = tuple(DataParser.crc8_maxim_bitwise(bytes([i])) for i in range(256))
+CRC8_MAXIM_TABLE_NP = np.array(CRC8_MAXIM_TABLE, dtype=np.uint8)
 
 
 class NotificationHandler:
@@ -206,4 +292,42 @@ class NotificationHandler:
         print(f"降噪设置: {info['noise_cancel']}")
         print(f"触控开关: {info['touch_control']}")
         print(f"自动播放停止: {info['auto_stop']}")
-        print("================\n")
\ No newline at end of file
+        print("================\n")
+
+
+if __name__ == "__main__":
+    # 向量化解码与逐样本解码的一致性校验
+    rng = np.random.default_rng(0)
+    for endian in (0, 1):
+        payload = rng.integers(0, 256, size=150, dtype=np.uint8).tobytes()
+        fast = DataParser.decode_samples(payload, endian=endian)
+        slow = np.array(DataParser.decode_samples_scalar(payload, endian=endian))
+        assert fast.shape == slow.shape
+        assert np.allclose(fast, slow, rtol=1e-12, atol=0), f"endian={endian} 解码不一致"
+        fast32 = DataParser.decode_samples(payload, endian=endian, dtype=np.float32)
+        assert fast32.dtype == np.float32 and np.allclose(fast32, slow, rtol=1e-6)
+    # 边界值: 0, 最大正数, -1, 最小负数
+    edge = bytes([0x00, 0x00, 0x00, 0xFF, 0xFF, 0x7F, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x80])
+    assert np.allclose(DataParser.decode_samples(edge), DataParser.decode_samples_scalar(edge))
+    print("decode_samples 与逐样本解码结果一致")
+
+    # CRC8 查表实现与逐位实现对照，并做微基准测试
+    import timeit
+
+    packets = rng.integers(0, 256, size=(2000, 160), dtype=np.uint8)
+    packets[:, -1] = [DataParser.crc8_maxim_bitwise(p[:-1].tobytes()) for p in packets]
+    packets[::7, -1] ^= 0x5A  # 人为制造部分校验失败的包
+    packet_list = [p.tobytes() for p in packets]
+
+    expected = np.array([DataParser.crc8_maxim_bitwise(p[:-1]) == p[-1] for p in packet_list])
+    assert all(DataParser.crc8_maxim(p[:-1]) == DataParser.crc8_maxim_bitwise(p[:-1]) for p in packet_list)
+    assert np.array_equal(DataParser.verify_many(packets), expected)
+    assert np.array_equal(DataParser.verify_many(packet_list), expected)
+
+    number = 3
+    bitwise = timeit.timeit(lambda: [DataParser.crc8_maxim_bitwise(p[:-1]) for p in packet_list], number=number)
+    table = timeit.timeit(lambda: [DataParser.crc8_maxim(p[:-1]) for p in packet_list], number=number)
+    bulk = timeit.timeit(lambda: DataParser.verify_many(packets), number=number)
+    per_packet = lambda total: total / number / len(packet_list) * 1e6
+    print(f"CRC8 ({len(packet_list)}个160字节包): 逐位 {per_packet(bitwise):.2f} us/包, "
+          f"查表 {per_packet(table):.2f} us/包, verify_many {per_packet(bulk):.3f} us/包")
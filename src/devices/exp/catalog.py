@@ -0,0 +1,261 @@
+import json
+import os
+import time
+
+import numpy as np
+
+from .recorder import read_recording
+from .session_file import SessionFile, SUFFIX
+
+INDEX_NAME = "catalog.json"
+INDEX_VERSION = 2  # 2: 修正 dict 形式 action_map 的会话摘要，旧索引需要重建
+# 同一次实验可能同时有多种文件，按优先级选择一个作为会话的主文件
+FORMAT_PRIORITY = {"eegs": 0, "npy": 1, "eegrec": 2}
+
+
+class SessionCatalog:
+    """
+    实验数据目录的会话索引：
+        第一次扫描时读取每个会话文件的实验信息，提取摘要 (时长、采样率、各动作次数、丢包统计等)
+        保存到目录下的 catalog.json；之后只重新读取新增或修改过 (mtime/大小变化) 的文件，
+        查询只访问内存中的摘要，不需要再打开任何会话文件
+
+    会话摘要:
+    {
+        "id": 会话编号 (文件名去掉后缀，例如 exp_2025_10_16_19_33_42),
+        "path": 主文件路径, "format": "eegs"/"npy"/"eegrec", "files": 同一会话的所有文件,
+        "subject": 被试, "device_name": 设备名,
+        "left_sample_rate"/"right_sample_rate", "left_length"/"right_length", "duration": 秒,
+        "action_counts": {动作名: 次数}, "n_trials": 标记总数,
+        "left_gap_packets"/"right_gap_packets", "left_gap_events"/"right_gap_events",
+        "link_gaps": 断线次数, "complete": 记录是否正常结束,
+    }
+    """
+
+    def __init__(self, root, index_path=None):
+        self.root = root
+        self.index_path = index_path or os.path.join(root, INDEX_NAME)
+        self.files = {}  # 文件名 -> {"mtime", "size", "summary"}
+        self.sessions = {}  # 会话编号 -> 会话摘要
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"读取会话索引失败: {e}")
+            return
+        if index.get("version") == INDEX_VERSION:
+            self.files = index["files"]
+            self._group()
+
+    def save(self):
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "updated": time.time(), "files": self.files},
+                      f, ensure_ascii=False, indent=1)
+
+    def refresh(self):
+        """增量扫描目录，返回 (新增/更新的文件数, 删除的文件数)"""
+        if not os.path.isdir(self.root):
+            return 0, 0
+        names = set(os.listdir(self.root))
+        seen = set()
+        updated = 0
+        for name in names:
+            fmt = self._format(name, names)
+            if fmt is None:
+                continue
+            seen.add(name)
+            stat = os.stat(os.path.join(self.root, name))
+            entry = self.files.get(name)
+            if entry is not None and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                continue
+            try:
+                summary = self._summarize(name, fmt)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"读取会话 {name} 失败: {e}")
+                summary = None
+            self.files[name] = {"mtime": stat.st_mtime, "size": stat.st_size, "summary": summary}
+            updated += 1
+
+        removed = [name for name in self.files if name not in seen]
+        for name in removed:
+            del self.files[name]
+        if updated or removed:
+            self._group()
+            self.save()
+        return updated, len(removed)
+
+    @staticmethod
+    def _format(name, names):
+        if name.endswith(SUFFIX):
+            return "eegs"
+        if name.endswith(".eegrec"):
+            return "eegrec"
+        if name.endswith(".json") and name[:-len(".json")] + "_left.npy" in names:
+            return "npy"
+        return None
+
+    def _summarize(self, name, fmt):
+        path = os.path.join(self.root, name)
+        stem = os.path.splitext(name)[0]
+        if fmt == "eegs":
+            with SessionFile(path) as session:
+                info = dict(session.info)
+                info.setdefault("mark", [list(m) for m in session.markers])
+                lengths = {side: session.length(side) for side in ("left", "right")}
+                complete = info.get("complete", True)
+        elif fmt == "eegrec":
+            recording = read_recording(path)
+            info = dict(recording["info"] or {}, header=recording["header"])
+            if not recording["complete"]:
+                info.setdefault("mark", [m["mark"] for m in recording["marks"]])
+            lengths = {side: len(recording[side]) for side in ("left", "right")}
+            complete = recording["complete"]
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            lengths = {side: info.get(f"{side}_data_length") for side in ("left", "right")}
+            complete = True
+
+        # npy+json 在实验结束时保存，文件名时间和记录文件不同，通过 recording 字段归到同一个会话
+        recording_path = info.get("recording")
+        session_id = os.path.splitext(os.path.basename(recording_path))[0] if recording_path else stem
+
+        header = info.get("header") or {}
+        action_map = info.get("action_map") or header.get("action_map") or {}
+        # Function 保存的 action_map 是 {动作名: 标签}，旧数据可能是按标签排列的动作名列表
+        if isinstance(action_map, dict):
+            label_names = {label: name for name, label in action_map.items()}
+        else:
+            label_names = dict(enumerate(action_map))
+        marks = info.get("mark") or []
+        counts = {}
+        for mark in marks:
+            label = mark[-1]
+            action = label_names.get(label, str(label))
+            counts[action] = counts.get(action, 0) + 1
+
+        summary = {
+            "id": session_id,
+            "format": fmt,
+            "subject": info.get("subject", header.get("subject")),
+            "device_name": info.get("device_name", header.get("device_name")),
+            "action_counts": counts,
+            "n_trials": len(marks),
+            "link_gaps": len(info.get("link_gaps") or []),
+            "complete": complete,
+        }
+        durations = []
+        for side in ("left", "right"):
+            rate = info.get(f"{side}_sample_rate", header.get("sample_rate"))
+            summary[f"{side}_sample_rate"] = rate
+            summary[f"{side}_length"] = lengths[side]
+            summary[f"{side}_gap_packets"] = info.get(f"{side}_gap_packets", 0)
+            summary[f"{side}_gap_events"] = info.get(f"{side}_gap_events", 0)
+            if rate and lengths[side] is not None:
+                durations.append(lengths[side] / rate)
+        summary["duration"] = max(durations, default=0.0)
+        return summary
+
+    def _group(self):
+        sessions = {}
+        for name, entry in sorted(self.files.items()):
+            summary = entry["summary"]
+            if summary is None:
+                continue
+            session = sessions.get(summary["id"])
+            if session is None:
+                sessions[summary["id"]] = session = {"files": []}
+            session["files"].append(name)
+            if "format" not in session or FORMAT_PRIORITY[summary["format"]] < FORMAT_PRIORITY[session["format"]]:
+                session.update(summary, path=os.path.join(self.root, name))
+        self.sessions = sessions
+
+    def query(self, subject=None, device_name=None, min_duration=None, min_trials=None, actions=None,
+              max_gap_packets=None, complete=None, where=None):
+        """
+        按条件筛选会话，返回按会话编号排序的摘要列表
+        actions: 必须包含的动作名列表; max_gap_packets: 两耳丢包数之和的上限; where: 额外的过滤函数 summary -> bool
+        """
+        result = []
+        for session_id in sorted(self.sessions):
+            s = self.sessions[session_id]
+            if subject is not None and s["subject"] != subject:
+                continue
+            if device_name is not None and s["device_name"] != device_name:
+                continue
+            if min_duration is not None and s["duration"] < min_duration:
+                continue
+            if min_trials is not None and s["n_trials"] < min_trials:
+                continue
+            if actions is not None and not all(s["action_counts"].get(a) for a in actions):
+                continue
+            if max_gap_packets is not None and s["left_gap_packets"] + s["right_gap_packets"] > max_gap_packets:
+                continue
+            if complete is not None and s["complete"] != complete:
+                continue
+            if where is not None and not where(s):
+                continue
+            result.append(s)
+        return result
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __iter__(self):
+        return iter(self.sessions[session_id] for session_id in sorted(self.sessions))
+
+    def __getitem__(self, session_id):
+        return self.sessions[session_id]
+
+
+def load_session(summary):
+    """
+    按会话摘要读取两耳数据和实验信息，返回 (left, right, exp_info)
+    (全部读入内存，只需要标记窗口时直接用 SessionFile.marked_windows)
+    """
+    path = summary["path"]
+    if summary["format"] == "eegs":
+        with SessionFile(path) as session:
+            return session.read("left").copy(), session.read("right").copy(), session.info
+    if summary["format"] == "eegrec":
+        recording = read_recording(path)
+        return recording["left"], recording["right"], recording["info"] or recording["header"]
+    stem = os.path.splitext(path)[0]
+    with open(path, 'r', encoding='utf-8') as f:
+        info = json.load(f)
+    return np.load(stem + "_left.npy"), np.load(stem + "_right.npy"), info
+
+
+if __name__ == "__main__":
+    # 自检：python -m src.devices.exp.catalog
+    # 生成一个带标记的 npy+json 会话，检查摘要和 query 的筛选结果
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as root:
+        action_map = {"闭眼": 0, "咬牙": 1, "左看": 2, "右看": 3}
+        info = {"action_map": action_map, "subject": "S01", "device_name": "test",
+                "left_data_length": 5000, "right_data_length": 5000,
+                "left_sample_rate": 500, "right_sample_rate": 500,
+                "mark": [(1000, 1000, 0), (2000, 2000, 1), (3000, 3000, 1)]}
+        stem = os.path.join(root, "exp_1")
+        with open(stem + ".json", 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False)
+        np.save(stem + "_left.npy", np.zeros(5000))
+        np.save(stem + "_right.npy", np.zeros(5000))
+
+        catalog = SessionCatalog(root)
+        assert catalog.refresh() == (1, 0)
+        sessions = catalog.query(min_trials=1, complete=True)
+        assert [s["id"] for s in sessions] == ["exp_1"], sessions
+        assert sessions[0]["action_counts"] == {"闭眼": 1, "咬牙": 2}, sessions[0]["action_counts"]
+        assert sessions[0]["duration"] == 10.0
+        assert catalog.query(subject="S01") and not catalog.query(subject="S02")
+        assert not catalog.query(min_trials=4)
+        # 索引重新加载后不需要再读取会话文件
+        assert SessionCatalog(root).query(actions=["咬牙"])[0]["n_trials"] == 3
+    print("SessionCatalog 自检通过")
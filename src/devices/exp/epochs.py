@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+from ..utils import band_pass_filter, get_abs_path
+
+EPOCH_CACHE_VERSION = 2  # 2: 离线滤波改为 sosfiltfilt
+
+
+class EpochCache:
+    """
+    试次窗口缓存：
+        每个缓存项是一个 .npz 文件 (X, y)，文件名为缓存键；读取命中时更新文件的修改时间，
+        写入后按修改时间从旧到新删除，直到总大小不超过 max_bytes (LRU)
+    """
+
+    def __init__(self, root, max_bytes=2 * 1024 ** 3):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.root, key + ".npz")
+
+    def get(self, key):
+        """命中时返回 (X, y)，否则返回 None"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                result = data["X"], data["y"]
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key, X, y):
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(key)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, X=X, y=y)
+        os.replace(tmp, path)  # 写完再改名，另一个进程不会读到写了一半的文件
+        self.evict()
+
+    def evict(self):
+        """删除最久未使用的缓存项直到总大小不超过 max_bytes，返回删除的数量"""
+        with self._lock:
+            try:
+                entries = [e for e in os.scandir(self.root) if e.name.endswith(".npz")]
+            except FileNotFoundError:
+                return 0
+            entries = sorted((e.stat().st_mtime, e.stat().st_size, e.path) for e in entries)
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self):
+        with self._lock:
+            if not os.path.isdir(self.root):
+                return
+            for e in os.scandir(self.root):
+                if e.name.endswith(".npz"):
+                    os.remove(e.path)
+
+
+_epoch_cache = None
+
+
+def get_epoch_cache() -> EpochCache:
+    """全局共享的试次窗口缓存 (exp_cache/epochs)"""
+    global _epoch_cache
+    if _epoch_cache is None:
+        _epoch_cache = EpochCache(get_abs_path("exp_cache/epochs"))
+    return _epoch_cache
+
+
+def epoch_key(data, markers, params):
+    """缓存键：原始数据内容 + 标记 + 预处理参数的 sha256"""
+    h = hashlib.sha256()
+    for values in data:
+        values = np.ascontiguousarray(values)
+        h.update(values.dtype.str.encode())
+        h.update(str(values.shape).encode())
+        h.update(memoryview(values).cast("B"))
+    h.update(json.dumps([list(map(int, m)) for m in markers]).encode())
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def extract_epochs(left_data, right_data, info, fmin=0.05, fmax=100, window_seconds=2,
+                   channels=("right", "right"), cache=None):
+    """
+    提取试次窗口：对需要的通道做带通滤波，按标记截取 window_seconds 秒的窗口
+    channels: 每个输出通道取哪只耳朵的数据 (默认两个通道都用右耳，与原训练流程一致)
+    cache: EpochCache，None 时使用全局缓存，False 时不使用缓存
+    返回 (X (试次数, 通道数, 窗口样本数) float32, y (试次数,) int64)
+    """
+    markers = info['mark']
+    rates = {"left": info['left_sample_rate'], "right": info['right_sample_rate']}
+    raw = {"left": left_data, "right": right_data}
+    sides = sorted(set(channels))
+
+    if cache is None:
+        cache = get_epoch_cache()
+    key = None
+    if cache:
+        params = {
+            "version": EPOCH_CACHE_VERSION,
+            "fmin": fmin, "fmax": fmax, "window_seconds": window_seconds,
+            "channels": list(channels), "rates": [rates[side] for side in sides],
+        }
+        key = epoch_key([raw[side] for side in sides], markers, params)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    filtered = {side: band_pass_filter(raw[side], axis=0, fs=rates[side], fmin=fmin, fmax=fmax) for side in sides}
+    windows = {side: int(window_seconds * rates[side]) for side in sides}
+    index = {"left": 0, "right": 1}  # 标记 (left_index, right_index, label)
+
+    X = np.stack([
+        np.stack([filtered[side][m[index[side]]:m[index[side]] + windows[side]] for side in channels])
+        for m in markers
+    ]).astype(np.float32)
+    y = np.array([m[2] for m in markers]).astype(np.int64)
+
+    if key is not None:
+        cache.put(key, X, y)
+    return X, y
@@ -5,7 +5,7 @@ import random
 
 class ExperimentThread(QThread):
     update_label_signal = Signal(str, int)
-    action_signal = Signal(str)
+    action_signal = Signal(str, float)  # 动作名称, 动作开始时刻 (time.perf_counter)
     exp_finished = Signal()
 
     def __init__(self, epochs=10, actions=None):
@@ -26,7 +26,7 @@ class ExperimentThread(QThread):
                 time.sleep(2)
                 # 执行阶段
                 self.update_label_signal.emit(f"执行: {actions[i]}", 1)
-                self.action_signal.emit(actions[i])
+                self.action_signal.emit(actions[i], time.perf_counter())
                 time.sleep(3)
                 # 休息阶段
                 self.update_label_signal.emit("休息", 2)
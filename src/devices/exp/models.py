@@ -1,11 +1,6 @@
 import numpy as np
 import torch
 from torch import nn
-from torch.utils.data import TensorDataset, DataLoader
-from sklearn.model_selection import train_test_split
-import torch.optim as optim
-import os
-from scipy.signal import butter, filtfilt
 
 
 
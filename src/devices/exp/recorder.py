@@ -0,0 +1,198 @@
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+
+# 文件格式：
+#   文件头: MAGIC + uint32 头部JSON长度 + 头部JSON
+#   之后是若干条记录: RECORD_MAGIC + uint8 记录类型 + uint32 数据长度 + 数据 + uint32 数据的crc32
+#   样本记录的数据: uint32 元信息JSON长度 + 元信息JSON + float32 样本
+# 记录只追加不修改，程序中途崩溃时最多丢失最后一个未写完的记录
+MAGIC = b"EEGREC01"
+RECORD_MAGIC = b"CHNK"
+RECORD_HEADER = struct.Struct("<4sBI")
+RECORD_SAMPLES = 1
+RECORD_MARKER = 2
+RECORD_INFO = 3
+
+
+class StreamRecorder(threading.Thread):
+    """
+    流式记录线程：
+        实验过程中把样本、每个包的信息和标记追加写入文件，每 flush_interval 秒落盘一次，
+        内存中只缓存一个写入周期的数据；finalize() 写入最终的 exp_info 后关闭文件，
+        指定 session_path 时再转换为列式会话文件 (见 session_file.py) 供离线分析使用；
+        全部写完后在记录线程中调用 on_finished(路径)，路径为会话文件 (转换失败时为记录文件)
+    """
+
+    def __init__(self, path, header=None, flush_interval=2.0, session_path=None, on_finished=None):
+        super().__init__(name="stream-recorder", daemon=True)
+        self.path = path
+        self.header = dict(header or {}, created=time.time())
+        self.flush_interval = flush_interval
+        self.session_path = session_path
+        self.on_finished = on_finished
+        self._pending = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._final_info = None
+        self.records_written = 0
+
+    def append_samples(self, data, start_index):
+        """
+        追加一批数据 (BluetoothDevice.data_received_signal 的结果)
+        start_index: 这批数据第一个样本在该耳数据中的绝对索引
+        """
+        meta = {
+            "ear": data["ear_side"],
+            "start": int(start_index),
+            "n": int(data["sample_count"]),
+        }
+        for key in ("packet_count", "lead_off", "packet_samples", "arrival_time"):
+            if key in data:
+                meta[key] = np.asarray(data[key]).tolist()
+        samples = np.asarray(data["samples"], dtype=np.float32).tobytes()
+        self._put(RECORD_SAMPLES, self._pack_samples(meta, samples))
+
+    def add_marker(self, mark, **extra):
+        """追加一个实验标记 (left_index, right_index, label)"""
+        self._put(RECORD_MARKER, json.dumps({"mark": list(mark), **extra}).encode("utf-8"))
+
+    def finalize(self, exp_info):
+        """写入最终的实验信息并结束记录，不等待写入完成"""
+        self._final_info = exp_info
+        self._stop_event.set()
+
+    def _put(self, record_type, payload):
+        with self._lock:
+            self._pending.append((record_type, payload))
+
+    @staticmethod
+    def _pack_samples(meta, samples):
+        meta = json.dumps(meta).encode("utf-8")
+        return struct.pack("<I", len(meta)) + meta + samples
+
+    def run(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "wb") as f:
+            header = json.dumps(self.header).encode("utf-8")
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+
+            while not self._stop_event.wait(self.flush_interval):
+                self._flush(f)
+
+            self._flush(f)
+            if self._final_info is not None:
+                self._write(f, RECORD_INFO, json.dumps(self._final_info, default=_to_json).encode("utf-8"))
+                self._sync(f)
+        print(f"实验数据已记录到 {self.path}, 共 {self.records_written} 条记录")
+
+        if self._final_info is None:
+            return
+        path = self.path
+        if self.session_path:
+            from .session_file import convert_recording
+            try:
+                convert_recording(self.path, self.session_path)
+                print(f"会话文件已保存到 {self.session_path}")
+                path = self.session_path
+            except Exception as e:
+                # 记录文件仍然完整，转换失败 (包括记录内容异常) 时改为交出记录文件，训练流程照常继续
+                print(f"会话文件转换失败: {e!r}")
+        if self.on_finished is not None:
+            self.on_finished(path)
+
+    def _flush(self, f):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        for record_type, payload in pending:
+            self._write(f, record_type, payload)
+        self._sync(f)
+
+    def _write(self, f, record_type, payload):
+        f.write(RECORD_HEADER.pack(RECORD_MAGIC, record_type, len(payload)))
+        f.write(payload)
+        f.write(struct.pack("<I", zlib.crc32(payload)))
+        self.records_written += 1
+
+    @staticmethod
+    def _sync(f):
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _to_json(value):
+    """json 无法直接序列化的 numpy 类型"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"无法序列化的类型: {type(value)}")
+
+
+def read_recording(path):
+    """
+    读取 StreamRecorder 写入的文件，遇到不完整或损坏的记录时停止 (用于恢复崩溃前的数据)
+    返回:
+    {
+        "header": 文件头,
+        "left"/"right": 样本 np.ndarray(float32)，按绝对索引排列，缺失的位置为 NaN,
+        "packets": {"left": [每批的元信息], "right": [...]},
+        "marks": [标记记录],
+        "info": 最终的 exp_info (未正常结束时为 None),
+        "complete": 是否读到了最终的 exp_info,
+    }
+    """
+    chunks = {"left": [], "right": []}
+    packets = {"left": [], "right": []}
+    marks = []
+    info = None
+
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} 不是实验记录文件")
+    pos = len(MAGIC)
+    (header_length,) = struct.unpack_from("<I", data, pos)
+    pos += 4
+    header = json.loads(data[pos:pos + header_length])
+    pos += header_length
+
+    while pos + RECORD_HEADER.size <= len(data):
+        magic, record_type, length = RECORD_HEADER.unpack_from(data, pos)
+        end = pos + RECORD_HEADER.size + length
+        if magic != RECORD_MAGIC or end + 4 > len(data):
+            break
+        payload = data[pos + RECORD_HEADER.size:end]
+        (crc,) = struct.unpack_from("<I", data, end)
+        if zlib.crc32(payload) != crc:
+            break
+        pos = end + 4
+
+        if record_type == RECORD_SAMPLES:
+            (meta_length,) = struct.unpack_from("<I", payload, 0)
+            meta = json.loads(payload[4:4 + meta_length])
+            chunks[meta["ear"]].append((meta["start"], np.frombuffer(payload[4 + meta_length:], dtype=np.float32)))
+            packets[meta["ear"]].append(meta)
+        elif record_type == RECORD_MARKER:
+            marks.append(json.loads(payload))
+        elif record_type == RECORD_INFO:
+            info = json.loads(payload)
+
+    result = {"header": header, "packets": packets, "marks": marks, "info": info, "complete": info is not None}
+    for side, side_chunks in chunks.items():
+        length = max((start + len(samples) for start, samples in side_chunks), default=0)
+        samples_all = np.full(length, np.nan, dtype=np.float32)
+        for start, samples in side_chunks:
+            samples_all[start:start + len(samples)] = samples
+        result[side] = samples_all
+    return result
@@ -0,0 +1,204 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from .recorder import read_recording, _to_json
+
+
+# 文件格式：
+#   MAGIC
+#   各列的数据块 (每块 chunk_size 个元素，可选 zlib 压缩，未压缩的块按8字节对齐)
+#   尾部索引JSON: 每列的 dtype、长度、块大小、压缩方式和每块的 (偏移, 字节数, 元素数)，以及标记、实验信息
+#   TRAILER: uint64 索引偏移 + uint32 索引长度 + END_MAGIC
+# 读取时只解析尾部索引并 mmap 整个文件，按需解压或直接映射需要的块
+MAGIC = b"EEGSESS1"
+END_MAGIC = b"EEGSEND1"
+TRAILER = struct.Struct("<QI8s")
+SUFFIX = ".eegs"
+
+# 每只耳朵的列：样本和每个包的信息
+EAR_COLUMNS = {
+    "samples": np.float32,
+    "arrival_time": np.float64,
+    "packet_count": np.uint8,
+    "lead_off": np.uint8,
+    "packet_samples": np.int32,
+}
+
+
+def write_session(path, columns, markers=None, info=None, chunk_size=65536, compression="zlib"):
+    """
+    写入会话文件
+    columns: {列名: 一维数组}，列名约定为 "left"、"right" 和 "left.arrival_time" 这类 "耳.字段"
+    markers: 标记列表 [(left_index, right_index, label), ...]
+    compression: "zlib" 或 None (不压缩时读取可以直接映射，不需要解压)
+    """
+    index = {"version": 1, "columns": {}, "markers": [list(m) for m in (markers or [])], "info": info or {}}
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        for name, values in columns.items():
+            values = np.ascontiguousarray(values)
+            column = {
+                "dtype": values.dtype.str,
+                "length": len(values),
+                "chunk_size": chunk_size,
+                "compression": compression,
+                "chunks": [],
+            }
+            for start in range(0, len(values), chunk_size):
+                raw = values[start:start + chunk_size].tobytes()
+                if compression == "zlib":
+                    raw = zlib.compress(raw, 6)
+                else:
+                    f.write(b"\0" * (-f.tell() % 8))
+                column["chunks"].append([f.tell(), len(raw), min(chunk_size, len(values) - start)])
+                f.write(raw)
+            index["columns"][name] = column
+
+        footer = json.dumps(index, default=_to_json).encode("utf-8")
+        offset = f.tell()
+        f.write(footer)
+        f.write(TRAILER.pack(offset, len(footer), END_MAGIC))
+
+
+class SessionFile:
+    """
+    会话文件读取器：
+        只读取尾部索引，数据通过 mmap 按块访问；读取一个窗口只会解压覆盖该窗口的块，
+        未压缩的列在窗口不跨块时直接返回映射内存上的视图
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} 不是会话文件")
+        offset, length, end_magic = TRAILER.unpack_from(self._mmap, len(self._mmap) - TRAILER.size)
+        if end_magic != END_MAGIC:
+            self.close()
+            raise ValueError(f"{path} 不完整")
+        index = json.loads(self._mmap[offset:offset + length])
+        self.columns = index["columns"]
+        self.markers = [tuple(m) for m in index["markers"]]
+        self.info = index["info"]
+        self._cache = {}  # 最近一次解压的块 (列名, 块号) -> 数组
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._cache.clear()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # 仍有数组引用映射内存时无法关闭，随数组一起释放
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self):
+        return self.length("left")
+
+    def length(self, column):
+        return self.columns[column]["length"]
+
+    def _chunk(self, name, i):
+        column = self.columns[name]
+        offset, nbytes, count = column["chunks"][i]
+        dtype = np.dtype(column["dtype"])
+        if column["compression"] is None:
+            return np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+
+        key = (name, i)
+        if key not in self._cache:
+            if len(self._cache) >= 8:
+                self._cache.pop(next(iter(self._cache)))
+            raw = zlib.decompress(self._mmap[offset:offset + nbytes])
+            self._cache[key] = np.frombuffer(raw, dtype=dtype)
+        return self._cache[key]
+
+    def read(self, name, start=0, stop=None):
+        """读取一列的 [start, stop)，只访问覆盖该区间的块"""
+        column = self.columns[name]
+        length = column["length"]
+        stop = length if stop is None else min(stop, length)
+        start = max(0, start)
+        if stop <= start:
+            return np.zeros(0, dtype=np.dtype(column["dtype"]))
+
+        chunk_size = column["chunk_size"]
+        first, last = start // chunk_size, (stop - 1) // chunk_size
+        parts = []
+        for i in range(first, last + 1):
+            chunk = self._chunk(name, i)
+            base = i * chunk_size
+            parts.append(chunk[max(start - base, 0):min(stop - base, len(chunk))])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def marked_windows(self, length, channels=("left", "right")):
+        """
+        按标记截取窗口，返回 (窗口 (n, len(channels), length), 标签 (n,))
+        标记 (left_index, right_index, label) 中第 i 个索引对应 channels 中第 i 个通道；超出数据末尾的标记会被跳过
+        """
+        windows, labels = [], []
+        for marker in self.markers:
+            starts, label = marker[:-1], marker[-1]
+            trial = [self.read(channel, start, start + length) for channel, start in zip(channels, starts)]
+            if any(len(t) < length for t in trial):
+                continue
+            windows.append(np.stack(trial))
+            labels.append(label)
+        if not windows:
+            return np.zeros((0, len(channels), length), dtype=np.float32), np.zeros(0, dtype=np.int64)
+        return np.stack(windows), np.array(labels, dtype=np.int64)
+
+
+def convert_legacy(json_path, path=None, **kwargs):
+    """把 exp_*.json + exp_*_left.npy + exp_*_right.npy 转换为会话文件，返回会话文件路径"""
+    stem = os.path.splitext(json_path)[0]
+    with open(json_path, "r", encoding="utf-8") as f:
+        info = json.load(f)
+    columns = {
+        "left": np.load(stem + "_left.npy").astype(np.float32),
+        "right": np.load(stem + "_right.npy").astype(np.float32),
+    }
+    path = path or stem + SUFFIX
+    write_session(path, columns, markers=info.get("mark"), info=info, **kwargs)
+    return path
+
+
+def convert_recording(recording, path=None, **kwargs):
+    """
+    把 StreamRecorder 的记录转换为会话文件 (包含每个包的到达时间、包序号和导联状态)
+    recording: 记录文件路径或 read_recording 的结果
+    """
+    if isinstance(recording, str):
+        path = path or os.path.splitext(recording)[0] + SUFFIX
+        recording = read_recording(recording)
+
+    # 设备信息、采样率等在记录的文件头中
+    info = dict(recording["info"] or {}, header=recording["header"], complete=recording["complete"])
+    markers = info.get("mark") or [m["mark"] for m in recording["marks"]]
+    columns = {}
+    for side in ("left", "right"):
+        columns[side] = recording[side]
+        batches = recording["packets"][side]
+        for field, dtype in EAR_COLUMNS.items():
+            if field == "samples":
+                continue
+            values = [v for batch in batches for v in batch.get(field, [])]
+            columns[f"{side}.{field}"] = np.array(values, dtype=dtype)
+    write_session(path, columns, markers=markers, info=info, **kwargs)
+    return path
@@ -1,10 +1,17 @@
 from PySide6.QtCore import QThread, Signal
+import queue
+import time
 import torch
 import numpy as np
 
 
 class TestModelThread(QThread):
-    model_result_signal = Signal(list)    
+    """
+    在线推理线程：
+        持有加载好的模型，从队列中取测试窗口做前向推理，结果通过 model_result_signal 发回界面线程
+        submit() 只负责入队，不会阻塞调用方；stop() 处理完队列中剩余的请求后结束线程
+    """
+    model_result_signal = Signal(list)
 
     def __init__(self, model=None, weight_path="../../../exp_models/EEGNet/weight.pth"):
         super().__init__()
@@ -17,25 +24,60 @@ class TestModelThread(QThread):
             raise FileNotFoundError("No existing model weights file found. Please train the model first.")
         except Exception as e:
             raise RuntimeError(f"Error loading model weights: {e}")
+        self.model.eval()
         self.test_count = 0
         self.right_count = 0
 
-    
+        self.requests = queue.Queue()  # 待推理的窗口 (提交时间, 左耳数据, 右耳数据, 标签)
+        self.latencies = []  # 每个请求从提交到得到结果的耗时(秒)
+        self.max_queue_depth = 0  # 运行期间队列的最大深度
+
+
     def accurate_rate(self):
         if self.test_count == 0:
             return 0.0
         return self.right_count / self.test_count
 
+    def queue_depth(self):
+        return self.requests.qsize()
+
+    def stats(self):
+        """推理统计: 请求数、当前/最大队列深度、平均和最大延迟(毫秒)"""
+        latencies = list(self.latencies)
+        return {
+            "requests": len(latencies),
+            "queue_depth": self.queue_depth(),
+            "max_queue_depth": self.max_queue_depth,
+            "mean_latency_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_latency_ms": 1000 * max(latencies) if latencies else 0.0,
+        }
 
-    def run(self, left_test_data=None, right_test_data=None, label=None):
-        # 模拟测试过程
+    def submit(self, left_test_data=None, right_test_data=None, label=None):
+        """提交一个测试窗口，数据会被复制，调用方可以继续修改原数组"""
+        self.requests.put((time.perf_counter(), np.array(left_test_data), np.array(right_test_data), label))
+        self.max_queue_depth = max(self.max_queue_depth, self.requests.qsize())
+
+    def stop(self):
+        """处理完已提交的请求后结束线程，并等待线程退出"""
+        self.requests.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            submitted, left_test_data, right_test_data, label = request
+            self._predict(left_test_data, right_test_data, label)
+            self.latencies.append(time.perf_counter() - submitted)
+        print(f"推理线程结束: {self.stats()}")
+
+    def _predict(self, left_test_data, right_test_data, label):
         print(f"第{self.test_count}次测试模型...")
-        # 这里可以添加实际的测试代码
-        left_test_data = np.array(left_test_data).reshape(1, 1, -1)
-        right_test_data = np.array(right_test_data).reshape(1, 1, -1)
+        left_test_data = left_test_data.reshape(1, 1, -1)
+        right_test_data = right_test_data.reshape(1, 1, -1)
         input_data = np.concatenate((right_test_data, right_test_data), axis=1)
         input_tensor = torch.tensor(input_data, dtype=torch.float32)
-        self.model.eval()
         with torch.no_grad():
             output = self.model(input_tensor)
             print(f"Raw model output: {output}")
@@ -45,4 +87,4 @@ class TestModelThread(QThread):
             print(f"模型预测结果: {predicted}, 实际标签: {label}")
             self.test_count += 1
             if predicted == label:
-                self.right_count += 1
\ No newline at end of file
+                self.right_count += 1
@@ -1,5 +1,4 @@
 import threading
-import pyttsx3
 
 
 GLOBAL_TTS_LOCK = threading.Lock()
@@ -17,6 +16,7 @@ class TextToSpeechThread(threading.Thread):
         self.text = text
         self.rate = rate
         self.volume = volume
+        import pyttsx3  # 第一次播报时才导入 (程序启动后会在后台预加载)
         self.tts_engine = pyttsx3.init()
 
     def run(self):
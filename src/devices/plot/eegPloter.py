@@ -1,20 +1,56 @@
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtCore
 import numpy as np
-from scipy import signal
 
 from collections import deque
 
+from ..stream.filters import FilterBank
+
+RENDER_MODES = ("envelope", "full", "immediate")
+
+
+def min_max_envelope(data, bins):
+    """
+    最大/最小值包络抽取：把 data 分成 bins 段，每段取最小值和最大值 (交替排列，共 2*bins 个点)，
+    按像素宽度抽取后画出的波形和逐点绘制看起来一样 (每个像素列覆盖该列所有样本的范围)
+    返回 (每段起点索引, 包络)
+    """
+    index = (np.arange(bins) * len(data)) // bins
+    envelope = np.empty(2 * bins, dtype=data.dtype)
+    envelope[0::2] = np.minimum.reduceat(data, index)
+    envelope[1::2] = np.maximum.reduceat(data, index)
+    return index, envelope
+
 
 class EEGPlotter:
+    """
+    固定时间窗口的扫描式绘图器，分为数据侧和绘制侧：
+        ingest 在接收数据的线程中滤波并写入缓冲区 (单生产者，不加锁，用序号判断缓冲区是否正在写)；
+        render 由界面线程的定时器以 refresh_fps 的频率调用，取缓冲区的最新快照绘制，
+        两帧之间到达的多批数据只绘制一次，数据成批到达时跳帧而不是排队重绘
+    render_mode:
+        "envelope": 按绘图区的像素宽度抽取最大/最小值包络后绘制，绘制点数与窗口长度无关
+        "full": 定时器重绘全部样本
+        "immediate": 每次收到数据立即重绘全部样本 (原来的方式，只能在界面线程中调用 ingest)
+    """
+
     def __init__(self, plot_widget:pg.PlotWidget, 
                  packets_per_second=10, samples_per_packet=50, window_duration=5,
-                 lowcut=0.01, highcut=100.0, side="left"):
+                 lowcut=0.01, highcut=100.0, side="left", render_mode="envelope", refresh_fps=30):
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"render_mode 必须是 {RENDER_MODES} 之一")
         self.plot_widget = plot_widget
         self.data_buffer = None
         self.time_buffer = None
         self.curve = None
         self.refresh_line = None
+        self.render_mode = render_mode
+        self.refresh_fps = refresh_fps
+        self._seq = 0  # 写入序号：写缓冲区前后各加1，奇数表示正在写
+        self._rendered_seq = 0  # 最近一次绘制的快照对应的写入序号
+        self._envelope_x = None  # 包络的时间轴缓存 (段数, 时间轴)
+        self.frames_rendered = 0
+        self.batches_ingested = 0
         
         # 设备参数
         self.packets_per_second = packets_per_second
@@ -33,6 +69,13 @@ class EEGPlotter:
         
         self.init_plot(side)
 
+        # 定时重绘 (需要在界面线程中创建)
+        self.render_timer = None
+        if self.render_mode != "immediate":
+            self.render_timer = QtCore.QTimer()
+            self.render_timer.timeout.connect(self.render)
+            self.render_timer.start(max(1, int(1000 / self.refresh_fps)))
+
     def init_plot(self, side):
         """初始化绘图窗口"""
         # 清空并设置绘图窗口
@@ -72,31 +115,36 @@ class EEGPlotter:
         
         print(f"EEG绘图初始化完成: 采样率{self.sample_rate}Hz, 缓冲区{self.buffer_size}样本")
     
-    def update_plot(self, voltage_data):
+    def ingest(self, voltage_data):
         """
-        处理plot_data信号的槽函数
-        voltage_data: 包含50个电压值的列表
+        数据侧：滤波并写入缓冲区，可以在接收数据的线程中调用 (同一时间只能有一个线程调用)
+        voltage_data: 若干个数据包的电压值 (列表或 np.ndarray)，长度为 samples_per_packet 的整数倍
         """
-        if len(voltage_data) != self.samples_per_packet:
-            print(f"警告: 期望{self.samples_per_packet}个数据点, 收到{len(voltage_data)}个")
+        if len(voltage_data) == 0 or len(voltage_data) % self.samples_per_packet != 0:
+            print(f"警告: 期望{self.samples_per_packet}的整数倍个数据点, 收到{len(voltage_data)}个")
             return
         
         # 带通滤波，并转换为numpy数组
         new_data = self.signal_processor.process_realtime(voltage_data)
 
-        # 计算新数据在缓冲区中的位置
+        # 计算新数据在缓冲区中的位置，超出缓冲区末尾的部分从头开始写
         start_idx = self.refresh_line_pos
-        end_idx = start_idx + self.samples_per_packet
-        
-        self.data_buffer[start_idx:end_idx] = new_data
+        if len(new_data) > self.buffer_size:
+            # 一次收到超过一屏的数据时只保留最后一屏
+            start_idx = (start_idx + len(new_data) - self.buffer_size) % self.buffer_size
+            new_data = new_data[-self.buffer_size:]
+        first = min(len(new_data), self.buffer_size - start_idx)
+        self._seq += 1
+        self.data_buffer[start_idx:start_idx + first] = new_data[:first]
+        self.data_buffer[:len(new_data) - first] = new_data[first:]
 
         # 更新刷新线位置
-        self.refresh_line_pos = end_idx % self.buffer_size
+        self.refresh_line_pos = (start_idx + len(new_data)) % self.buffer_size
+        self._seq += 1
+        self.batches_ingested += 1
 
-        self.refresh_line.setValue(self.refresh_line_pos / self.sample_rate)
-
-        # 更新曲线数据
-        self.curve.setData(self.time_buffer, self.data_buffer)
+        if self.render_mode == "immediate":
+            self.render()
         
         # 自动调整Y轴范围以适应数据
         # if len(self.data_buffer) > 0:
@@ -108,6 +156,54 @@ class EEGPlotter:
         #             np.max(self.data_buffer) + margin
         #         )
 
+    # 兼容原来的槽函数名
+    update_plot = ingest
+
+    def snapshot(self):
+        """
+        取缓冲区的一致快照 (数据副本, 刷新线位置, 写入序号)；
+        复制过程中缓冲区被改写时重试，连续几次都在写入时返回 None
+        """
+        for _ in range(3):
+            seq = self._seq
+            if seq % 2:
+                continue
+            data = self.data_buffer.copy()
+            pos = self.refresh_line_pos
+            if self._seq == seq:
+                return data, pos, seq
+        return None
+
+    def render(self):
+        """绘制侧：把缓冲区的最新快照绘制到曲线上，没有新数据时跳过 (只能在界面线程中调用)"""
+        if self._seq == self._rendered_seq:
+            return
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return  # 正在写入，下一帧再绘制
+        data, pos, self._rendered_seq = snapshot
+        self.refresh_line.setValue(pos / self.sample_rate)
+
+        bins = self._pixel_width()
+        if self.render_mode == "envelope" and self.buffer_size > 2 * bins:
+            index, envelope = min_max_envelope(data, bins)
+            if self._envelope_x is None or self._envelope_x[0] != bins:
+                self._envelope_x = (bins, np.repeat(self.time_buffer[index], 2))
+            self.curve.setData(self._envelope_x[1], envelope)
+        else:
+            self.curve.setData(self.time_buffer, data)
+        self.frames_rendered += 1
+
+    def _pixel_width(self):
+        """绘图区的像素宽度 (窗口未显示时按 1000 像素计算)"""
+        width = int(self.plot_widget.getViewBox().width())
+        return width if width > 0 else 1000
+
+    def stop(self):
+        """停止定时重绘"""
+        if self.render_timer is not None:
+            self.render_timer.stop()
+
 
 
 class EEGSignalProcessor:
@@ -119,40 +215,27 @@ class EEGSignalProcessor:
         self.lowcut = lowcut
         self.highcut = highcut
 
-        nyquist = 0.5 * self.sample_rate
-        
-        # 标准化截止频率
-        low_normalized = lowcut / nyquist
-        high_normalized = highcut / nyquist
-        
-        # 4阶巴特沃斯带通滤波器
+        # 4阶巴特沃斯带通滤波器 (二阶节形式，0.01Hz 这样很低的截止频率下 (b, a) 形式数值不稳定)
         # 这个滤波器会自动：
         # 1. 去除直流分量（相当于高通）
         # 2. 去除高频噪声（相当于低通）
         # 3. 保持滤波器状态确保数据连续性
-        self.band_b, self.band_a = signal.butter(4, [low_normalized, high_normalized], btype='band')
-        self.filter_zi = None
+        self.filter_bank = FilterBank(lowcut, highcut, sample_rate, order=4)
         
-    def process_realtime(self, data_chunk:list) -> np.ndarray:
+    def process_realtime(self, data_chunk) -> np.ndarray:
         """
         优化的实时处理：单个带通滤波器解决所有问题
+        丢包补齐的 NaN 用相邻有效值插值，避免污染滤波器状态
         """
-        # 转换为numpy数组            
-        data = np.array(data_chunk, dtype=np.float64)
-        
-        # 使用滤波器状态确保数据连续性
-        if self.filter_zi is None:
-            # 第一次处理：初始化滤波器状态
-            filtered, self.filter_zi = signal.lfilter(
-                self.band_b, self.band_a, data, zi=signal.lfilter_zi(self.band_b, self.band_a))
-        else:
-            # 后续处理：使用之前的状态，确保连续滤波
-            filtered, self.filter_zi = signal.lfilter(
-                self.band_b, self.band_a, data, zi=self.filter_zi)
-        
-        return filtered
+        return self.filter_bank.process(data_chunk)[0]
+
+    def save_state(self):
+        return self.filter_bank.save_state()
+
+    def restore_state(self, state):
+        self.filter_bank.restore_state(state)
     
     def reset(self):
         """重置滤波器状态（例如设备重连时）"""
-        self.filter_zi = None
-        print("滤波器状态已重置")
\ No newline at end of file
+        self.filter_bank.reset()
+        print("滤波器状态已重置")
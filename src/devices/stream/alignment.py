@@ -0,0 +1,147 @@
+from collections import deque
+
+import numpy as np
+
+
+class EarClock:
+    """
+    单耳时钟模型：
+        用 (样本索引, 到达时间) 拟合 t = offset + index * period，
+        period 由最近 history 个包的最小二乘斜率给出 (反映采样时钟的漂移)，
+        offset 取到达时间的下包络 (BLE 传输只会带来正的延迟，最早到达的包最接近真实采样时刻)
+    """
+
+    def __init__(self, sample_rate, history=300, min_points=10):
+        self.sample_rate = sample_rate
+        self.min_points = min_points
+        self.points = deque(maxlen=history)
+        self._fit = None
+
+    def observe(self, end_index, arrival):
+        """登记一个包：end_index 为包最后一个样本之后的索引，arrival 为到达时间"""
+        self.points.append((end_index, arrival))
+        self._fit = None
+
+    @property
+    def ready(self):
+        return len(self.points) >= self.min_points
+
+    def fit(self):
+        """返回 (offset, period)，数据不足时按标称采样率和最新一个包估计"""
+        if self._fit is not None:
+            return self._fit
+        points = np.array(self.points, dtype=np.float64)
+        index, arrival = points[:, 0], points[:, 1]
+
+        period = 1.0 / self.sample_rate
+        if self.ready and np.ptp(index) > 0:
+            slope = np.polyfit(index - index[0], arrival, 1)[0]
+            # 斜率偏离标称值过多说明数据异常 (如重连造成的跳变)，此时退回标称采样率
+            if abs(slope * self.sample_rate - 1) < 0.05:
+                period = slope
+        offset = np.min(arrival - index * period)
+        self._fit = (offset, period)
+        return self._fit
+
+    def time_of(self, index):
+        offset, period = self.fit()
+        return offset + np.asarray(index, dtype=np.float64) * period
+
+    def index_at(self, t):
+        offset, period = self.fit()
+        return (np.asarray(t, dtype=np.float64) - offset) / period
+
+
+class EarAligner:
+    """
+    双耳对齐：
+        左右耳各自维护 EarClock，把同一时刻换算成两只耳朵各自的样本索引，
+        并可以把两路数据重采样到同一时间网格上，得到时间对齐的双通道数据
+    """
+
+    SIDES = ("left", "right")
+
+    def __init__(self, sample_rate=500, history=300):
+        self.sample_rate = sample_rate
+        self.history = history
+        self.reset()
+
+    def reset(self):
+        """清除所有时钟观测（数据存储重新从0开始索引时调用）"""
+        self.clocks = {side: EarClock(self.sample_rate, self.history) for side in self.SIDES}
+        self.pulled_until = None  # pull() 已输出到的时间
+
+    @property
+    def ready(self):
+        return all(clock.ready for clock in self.clocks.values())
+
+    def observe(self, side, end_indices, arrivals):
+        """登记一批包的结束索引和到达时间"""
+        clock = self.clocks[side]
+        for end_index, arrival in zip(end_indices, arrivals):
+            clock.observe(end_index, arrival)
+
+    def index_at(self, side, t):
+        """时刻 t 对应的样本索引 (整数)，该耳还没有观测时返回 None"""
+        clock = self.clocks[side]
+        if not clock.points:
+            return None
+        return max(0, int(round(float(clock.index_at(t)))))
+
+    def estimates(self):
+        """各耳的时钟估计: 采样周期、相对标称采样率的漂移(ppm)、索引0对应的时间，以及右耳相对左耳的偏移"""
+        result = {}
+        for side, clock in self.clocks.items():
+            if not clock.points:
+                continue
+            offset, period = clock.fit()
+            result[side] = {
+                "period": period,
+                "drift_ppm": (period * self.sample_rate - 1) * 1e6,
+                "offset": offset,
+                "points": len(clock.points),
+            }
+        if len(result) == 2:
+            result["right_minus_left"] = result["right"]["offset"] - result["left"]["offset"]
+        return result
+
+    def aligned_window(self, left_store, right_store, t_start, n):
+        """
+        从 t_start 开始按采样率取 n 个时间点，两耳分别线性插值，返回 (2, n) 数组；
+        任一耳数据不覆盖该时间段时返回 None
+        """
+        grid = t_start + np.arange(n) / self.sample_rate
+        channels = []
+        for side, store in zip(self.SIDES, (left_store, right_store)):
+            if not self.clocks[side].points:
+                return None
+            position = self.clocks[side].index_at(grid)
+            begin = int(np.floor(position[0]))
+            end = int(np.ceil(position[-1])) + 1
+            if begin < store.start or end > store.total:
+                return None
+            data = store.window(begin, end - begin)
+            channels.append(np.interp(position, np.arange(begin, end), data))
+        return np.stack(channels)
+
+    def pull(self, left_store, right_store):
+        """
+        输出自上次 pull 以来两耳都已覆盖的对齐数据，返回 (起始时间, (2, n) 数组)，没有新数据时返回 None
+        """
+        if not self.ready:
+            return None
+        end = min(self.clocks[side].time_of(store.total - 1)
+                  for side, store in zip(self.SIDES, (left_store, right_store)))
+        if self.pulled_until is None:
+            self.pulled_until = max(self.clocks[side].time_of(store.start)
+                                    for side, store in zip(self.SIDES, (left_store, right_store)))
+        n = int((end - self.pulled_until) * self.sample_rate)
+        if n <= 0:
+            return None
+
+        t_start = self.pulled_until
+        window = self.aligned_window(left_store, right_store, t_start, n)
+        if window is None:
+            return None
+        self.pulled_until = t_start + n / self.sample_rate
+        return t_start, window
@@ -0,0 +1,113 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .sequence import interpolate_nan
+
+
+@lru_cache(maxsize=64)
+def design_sos(order, fmin, fmax, fs):
+    """
+    设计巴特沃斯带通滤波器 (二阶节形式)，相同的 (order, 频带, fs) 只设计一次
+    低截止频率很低 (例如 0.01Hz@500Hz) 时 (b, a) 形式的系数数值不稳定，二阶节形式没有这个问题
+    返回的数组被所有滤波器共享，不要原地修改 (scipy 的 sosfilt 不接受只读数组，所以没有设为只读)
+    """
+    from scipy import signal  # scipy.signal 导入较慢，第一次设计滤波器时才导入
+    return signal.butter(order, [fmin, fmax], btype='bandpass', fs=fs, output='sos')
+
+
+def zero_phase_band_pass(data, axis, fs, fmin, fmax, order=2):
+    """零相位带通滤波 (sosfiltfilt)，用于离线处理整段数据"""
+    from scipy import signal
+    return signal.sosfiltfilt(design_sos(order, fmin, fmax, fs), data, axis=axis)
+
+
+class FilterBank:
+    """
+    多通道流式带通滤波器组：
+        所有通道共享一组二阶节系数，每个通道有独立的滤波器状态，
+        一次 sosfilt 调用处理所有通道 (数据形状 (通道数, 样本数))；
+        save_state()/restore_state() 保存和恢复滤波器状态
+    """
+
+    def __init__(self, fmin, fmax, fs, order=2, channels=1):
+        self.fmin = fmin
+        self.fmax = fmax
+        self.fs = fs
+        self.order = order
+        self.channels = channels
+        self._sos = None
+        self.zi = None  # (节数, 通道数, 2)
+        self.last_value = None  # 每个通道上一块的最后一个样本，用于插值块首的 NaN
+
+    @property
+    def sos(self):
+        """二阶节系数，第一次使用时才设计 (创建滤波器时不导入 scipy.signal)"""
+        if self._sos is None:
+            self._sos = design_sos(self.order, self.fmin, self.fmax, self.fs)
+        return self._sos
+
+    def process(self, data_chunk) -> np.ndarray:
+        """
+        因果滤波一段新数据，滤波器状态在块之间连续，NaN (丢包补齐) 按插值后的值参与滤波
+        data_chunk: (通道数, 样本数)
+        """
+        data = np.array(data_chunk, dtype=np.float64, ndmin=2)
+        if data.shape[0] != self.channels:
+            raise ValueError(f"期望 {self.channels} 个通道, 收到 {data.shape[0]} 个")
+        if data.shape[1] == 0:
+            return data
+        for ch in np.flatnonzero(np.isnan(data).any(axis=1)):
+            previous = None if self.last_value is None else self.last_value[ch]
+            data[ch] = interpolate_nan(data[ch], previous=previous)
+        self.last_value = data[:, -1].copy()
+
+        from scipy import signal
+        if self.zi is None:
+            # 第一次处理：按各通道首个样本初始化为稳态，避免直流偏置造成的长时间瞬态
+            self.zi = signal.sosfilt_zi(self.sos)[:, np.newaxis, :] * data[np.newaxis, :, 0, np.newaxis]
+        filtered, self.zi = signal.sosfilt(self.sos, data, axis=-1, zi=self.zi)
+        return filtered
+
+    def save_state(self):
+        """保存滤波器状态，可以在之后用 restore_state 恢复 (例如断线重连后从断线前的状态继续)"""
+        return {
+            "zi": None if self.zi is None else self.zi.copy(),
+            "last_value": None if self.last_value is None else self.last_value.copy(),
+        }
+
+    def restore_state(self, state):
+        self.zi = None if state["zi"] is None else state["zi"].copy()
+        self.last_value = None if state["last_value"] is None else state["last_value"].copy()
+
+    def reset(self):
+        """重置滤波器状态（例如设备重连时）"""
+        self.zi = None
+        self.last_value = None
+
+
+class StreamingBandPass(FilterBank):
+    """
+    单通道流式带通滤波器：
+        用 sosfilt 逐块滤波并保存滤波器状态，数据到达时即可得到滤波结果，
+        每块的计算量只与块长有关，与已记录的会话长度无关
+    """
+
+    def __init__(self, fmin, fmax, fs, order=2):
+        super().__init__(fmin, fmax, fs, order=order, channels=1)
+
+    def process(self, data_chunk) -> np.ndarray:
+        """因果滤波一段新数据 (一维)"""
+        return super().process(data_chunk)[0]
+
+    def filtfilt_window(self, store, start, length, pad) -> np.ndarray:
+        """
+        零相位滤波一个窗口：只取 [start - pad, start + length + pad) 的原始数据做 sosfiltfilt，
+        再截出 [start, start + length)，计算量只与窗口和补边长度有关
+        store: SampleStore，start 为绝对索引
+        """
+        segment = interpolate_nan(store.window(start - pad, length + 2 * pad))
+        offset = start - max(start - pad, store.start)
+        from scipy import signal
+        filtered = signal.sosfiltfilt(self.sos, segment)
+        return filtered[offset:offset + length]
@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class SampleStore:
+    """
+    样本存储器：
+        追加写入的一维样本缓冲，均摊 O(1) 追加，读取返回零拷贝视图
+        - 增长模式 (默认): 容量不足时按倍数扩容，保存整个会话的数据
+        - 环形模式 (ring=True): 固定容量，只保留最近 capacity 个样本，适合长时间在线显示
+    样本用绝对索引访问 (从会话开始累计)，与 mark 中记录的索引一致
+    """
+
+    def __init__(self, capacity=5000, ring=False, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError(f"capacity 必须为正数，实际为 {capacity}")
+        self.capacity = int(capacity)
+        self.ring = ring
+        self.dtype = np.dtype(dtype)
+        self.total = 0  # 累计写入的样本数
+
+        # 环形模式下每个样本同时写在 i 和 i + capacity 两处，
+        # 这样任意长度不超过 capacity 的连续区间都能用切片直接得到视图
+        size = self.capacity * 2 if ring else self.capacity
+        self._buffer = np.zeros(size, dtype=self.dtype)
+
+    def __len__(self):
+        """当前可读的样本数"""
+        return min(self.total, self.capacity) if self.ring else self.total
+
+    @property
+    def start(self):
+        """最早一个可读样本的绝对索引"""
+        return self.total - len(self)
+
+    def append(self, samples):
+        """追加一段样本"""
+        samples = np.asarray(samples, dtype=self.dtype).reshape(-1)
+        n = len(samples)
+        if n == 0:
+            return
+
+        if self.ring:
+            self._append_ring(samples)
+        else:
+            self._reserve(self.total + n)
+            self._buffer[self.total:self.total + n] = samples
+        self.total += n
+
+    def _reserve(self, size):
+        """增长模式下保证容量不少于 size，容量按倍数扩展"""
+        if size <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < size:
+            capacity *= 2
+        buffer = np.zeros(capacity, dtype=self.dtype)
+        buffer[:self.total] = self._buffer[:self.total]
+        self._buffer = buffer
+        self.capacity = capacity
+
+    def _append_ring(self, samples):
+        """环形模式追加，超出容量时只保留最后 capacity 个样本"""
+        capacity = self.capacity
+        total = self.total
+        if len(samples) > capacity:
+            total += len(samples) - capacity
+            samples = samples[-capacity:]
+
+        pos = total % capacity
+        first = min(len(samples), capacity - pos)
+        for offset in (0, capacity):
+            self._buffer[offset + pos:offset + pos + first] = samples[:first]
+            self._buffer[offset:offset + len(samples) - first] = samples[first:]
+
+    def view(self):
+        """
+        返回全部可读样本的零拷贝视图
+        增长模式下已写入的数据不会再被修改，视图可以直接交给其他线程使用；
+        环形模式下视图中的数据会被后续写入覆盖
+        """
+        if not self.ring:
+            return self._buffer[:self.total]
+        return self.window(self.start, len(self))
+
+    def window(self, start, length):
+        """按绝对索引读取 [start, start + length) 的零拷贝视图，超出可读范围的部分会被截掉"""
+        begin = max(start, self.start)
+        end = min(start + length, self.total)
+        if end <= begin:
+            return self._buffer[:0]
+
+        if not self.ring:
+            return self._buffer[begin:end]
+        pos = begin % self.capacity
+        return self._buffer[pos:pos + end - begin]
+
+    def clear(self):
+        """清空数据 (保留已分配的缓冲区)"""
+        self.total = 0
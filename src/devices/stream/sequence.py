@@ -0,0 +1,108 @@
+import numpy as np
+
+
+GAP_POLICIES = ("nan", "linear", "zero")
+
+
+def interpolate_nan(data, previous=None):
+    """
+    线性插值填补一维数据中的 NaN，两端的 NaN 取最近的有效值
+    previous: 这段数据之前的最后一个有效值，开头的 NaN 会从它插值过来
+    """
+    data = np.asarray(data, dtype=np.float64)
+    mask = np.isnan(data)
+    if not mask.any():
+        return data
+
+    index = np.arange(len(data))
+    valid_index = index[~mask]
+    valid_data = data[~mask]
+    if previous is not None and not np.isnan(previous):
+        valid_index = np.concatenate(([-1], valid_index))
+        valid_data = np.concatenate(([previous], valid_data))
+    if len(valid_index) == 0:
+        return np.zeros_like(data)
+
+    filled = data.copy()
+    filled[mask] = np.interp(index[mask], valid_index, valid_data)
+    return filled
+
+
+class PacketSequenceTracker:
+    """
+    包序号跟踪器：
+        根据 packet_count (每包加1，256回绕) 检测丢包，并按 policy 补齐丢失的样本，
+        保证样本索引与时间一一对应
+        - "nan": 丢失的样本填 NaN
+        - "linear": 在丢包前后两个样本之间线性插值
+        - "zero": 丢失的样本填 0
+    序号相同的包视为重复包直接丢弃；一次丢失 256 个及以上的包无法从序号区分，会被少算
+    """
+
+    def __init__(self, samples_per_packet=50, policy="linear", modulo=256):
+        if policy not in GAP_POLICIES:
+            raise ValueError(f"未知的补齐策略: {policy}, 可选 {GAP_POLICIES}")
+        self.samples_per_packet = samples_per_packet
+        self.policy = policy
+        self.modulo = modulo
+        self.reset()
+        self.last_sample = None
+        self.gap_events = 0  # 发生丢包的次数
+        self.gap_packets = 0  # 丢失的包总数
+        self.duplicates = 0  # 重复包数
+
+    def reset(self):
+        """
+        清除序号记录（例如重连后），下一个包作为新的起点，不计入丢包；
+        保留最后一个样本，断线期间的补齐 (process 的 outage) 仍从它插值
+        """
+        self.last_count = None
+
+    def update(self, packet_count):
+        """登记一个包的序号，返回与上一个包之间丢失的包数，重复包返回 -1"""
+        last_count, self.last_count = self.last_count, packet_count
+        if last_count is None:
+            return 0
+
+        missing = (packet_count - last_count - 1) % self.modulo
+        if missing == self.modulo - 1:
+            # 序号与上一个包相同
+            self.last_count = last_count
+            self.duplicates += 1
+            return -1
+        if missing:
+            self.gap_events += 1
+            self.gap_packets += missing
+        return missing
+
+    def fill(self, missing, next_sample):
+        """生成 missing 个包的补齐样本，next_sample 为丢包后第一个样本"""
+        n = missing * self.samples_per_packet
+        if self.policy == "zero":
+            return np.zeros(n)
+        if self.policy == "nan" or self.last_sample is None:
+            return np.full(n, np.nan)
+        steps = np.arange(1, n + 1) / (n + 1)
+        return self.last_sample + (next_sample - self.last_sample) * steps
+
+    def process(self, packet, outage=0):
+        """
+        处理一个 parse_eeg_data 的解析结果：重复包返回 None，
+        否则在 samples 前补齐丢失的样本，并写入 "gap_packets" 和 "outage_packets"
+        outage: 断线期间丢失的包数 (重连后序号不连续，由调用者按时钟估计)，与丢包一样按 policy 补齐，
+                但不计入丢包统计
+        """
+        missing = self.update(packet["packet_count"])
+        if missing < 0:
+            return None
+
+        samples = packet["samples"]
+        if (missing or outage) and len(samples):
+            samples = np.concatenate((self.fill(missing + outage, samples[0]), samples))
+            packet["samples"] = samples
+            packet["sample_count"] = len(samples)
+        packet["gap_packets"] = missing
+        packet["outage_packets"] = outage
+        if len(samples):
+            self.last_sample = samples[-1]
+        return packet
@@ -0,0 +1,310 @@
+import asyncio
+import base64
+import hashlib
+import struct
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+EARS = ("left", "right")
+
+# 数据帧 (小端): 帧头 + count 个 float32 样本
+#   magic     4s   b"EEGF"
+#   version   u8
+#   ear       u8   0 左耳, 1 右耳
+#   decimation u16 降采样倍数 (1 为原始采样率)
+#   seq       u64  第一个样本的绝对索引 (按原始采样率从服务启动开始累计，降采样后仍按原始索引计)
+#   timestamp f64  服务收到这批数据的时间 (time.time)
+#   sample_rate f32 帧内样本的采样率 (原始采样率 / decimation)
+#   count     u32  样本数
+FRAME_MAGIC = b"EEGF"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<4sBBHQdfI")
+
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_MAX_PAYLOAD = 1 << 16  # 客户端发来的帧 (只处理 ping/close) 的长度上限
+
+
+def encode_frame(ear, seq, samples, sample_rate, decimation=1, timestamp=None):
+    """编码一个数据帧"""
+    samples = np.ascontiguousarray(samples, dtype="<f4")
+    header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, EARS.index(ear), decimation, seq,
+                               time.time() if timestamp is None else timestamp,
+                               sample_rate / decimation, len(samples))
+    return header + samples.tobytes()
+
+
+def decode_frame(buffer):
+    """
+    解码一个数据帧 (TCP 流中按帧头的 count 切分，WebSocket 每条二进制消息是一帧)
+    返回 {"ear", "seq", "timestamp", "sample_rate", "decimation", "samples"}
+    """
+    magic, version, ear, decimation, seq, timestamp, sample_rate, count = FRAME_HEADER.unpack_from(buffer)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("不是 EEG 数据帧 (或版本不兼容)")
+    samples = np.frombuffer(buffer, dtype="<f4", count=count, offset=FRAME_HEADER.size)
+    return {"ear": EARS[ear], "seq": seq, "timestamp": timestamp, "sample_rate": sample_rate,
+            "decimation": decimation, "samples": samples}
+
+
+def ws_frame(payload, opcode=0x2):
+    """服务端发出的 WebSocket 帧 (FIN=1，不加掩码)"""
+    n = len(payload)
+    if n < 126:
+        head = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return head + payload
+
+
+class StreamClient:
+    """一个已连接的客户端：待发送的帧队列 (及其字节数) 和当前的降采样倍数"""
+
+    def __init__(self, writer, protocol):
+        self.writer = writer
+        self.protocol = protocol  # "tcp" 或 "ws"
+        self.peer = writer.get_extra_info("peername")
+        self.queue = deque()
+        self.pending = 0  # 队列中待发送的字节数
+        self.ready = asyncio.Event()
+        self.decimation = 1
+        self.adjusted = 0.0  # 上次调整降采样倍数的时间
+        self.adjusted_pending = 0  # 上次调整时的待发送字节数
+        self.frames = 0  # 已发送的帧数
+        self.task = None
+
+    def push(self, frame):
+        self.queue.append(frame)
+        self.pending += len(frame)
+        self.ready.set()
+
+    def pop(self):
+        frame = self.queue.popleft()
+        self.pending -= len(frame)
+        return frame
+
+
+class StreamServer:
+    """
+    本机流式服务：
+        在共享的 BLE 事件循环中运行 asyncio 服务，把每批解码后的数据编码成二进制帧 (见 FRAME_HEADER)
+        发给所有客户端，TCP 连接上帧首尾相接，WebSocket 连接上每帧是一条二进制消息
+        publish 可以直接作为 BluetoothDevice 的 sink:
+            server = StreamServer(tcp_port=8764, ws_port=8765)
+            server.start()
+            device.add_sink(server.publish)
+    背压处理：每个客户端有独立的发送队列，publish 只入队不等待，采集不会被慢客户端拖住
+        - 待发送数据超过 queue_bytes 的一半、且比上次调整时还多时，降采样倍数翻倍 (最多 max_decimation，
+          两次翻倍至少间隔 0.25 秒)；低于 1/8 时减半 (距上次调整至少 2 秒，避免来回切换)
+        - 待发送数据达到 queue_bytes 时断开该客户端
+    降采样只按绝对索引等间隔抽取 (索引为倍数的样本)，不做抗混叠滤波
+    """
+
+    def __init__(self, host="127.0.0.1", tcp_port=8764, ws_port=8765, sample_rate=500,
+                 queue_bytes=1 << 18, max_decimation=8, ble_loop=None):
+        if tcp_port is None and ws_port is None:
+            raise ValueError("tcp_port 和 ws_port 至少要设置一个")
+        self.host = host
+        self.tcp_port = tcp_port
+        self.ws_port = ws_port
+        self.sample_rate = sample_rate
+        self.queue_bytes = queue_bytes
+        self.max_decimation = max_decimation
+        if ble_loop is None:
+            from ..ble.loop import get_ble_loop
+            ble_loop = get_ble_loop()
+        self.ble_loop = ble_loop
+        self.loop = ble_loop.loop
+
+        self.clients = set()
+        self.servers = []
+        self.sample_index = {ear: 0 for ear in EARS}  # 每耳累计的样本数，作为帧的 seq
+        self.dropped_clients = 0  # 因为跟不上被断开的客户端数
+
+    # ---------------- 启动/停止 (任意线程调用，返回 concurrent.futures.Future) ----------------
+
+    def start(self):
+        future = self.ble_loop.submit(self._start())
+        future.add_done_callback(self._report_error)
+        return future
+
+    def stop(self):
+        return self.ble_loop.submit(self._stop())
+
+    @staticmethod
+    def _report_error(future):
+        if not future.cancelled() and future.exception() is not None:
+            print(f"流式服务启动失败: {future.exception()}")
+
+    async def _start(self):
+        if self.tcp_port is not None:
+            self.servers.append(await asyncio.start_server(self._handle_tcp, self.host, self.tcp_port))
+        if self.ws_port is not None:
+            self.servers.append(await asyncio.start_server(self._handle_ws, self.host, self.ws_port,
+                                                           limit=WS_MAX_PAYLOAD))
+        print(f"流式服务已启动: TCP {self.tcp_port}, WebSocket {self.ws_port}")
+
+    async def _stop(self):
+        for server in self.servers:
+            server.close()
+        for client in list(self.clients):
+            self._drop(client)
+        for server in self.servers:
+            await server.wait_closed()
+        self.servers = []
+
+    # ---------------- 数据入口 ----------------
+
+    def publish(self, data):
+        """发布一批数据 (PacketCoalescer 合并后的结果)，在事件循环线程之外调用时转交给事件循环"""
+        if threading.get_ident() != self.ble_loop.ident:
+            self.loop.call_soon_threadsafe(self.publish, data)
+            return
+        ear = data["ear_side"]
+        samples = np.asarray(data["samples"], dtype=np.float32).reshape(-1)
+        seq = self.sample_index[ear]
+        self.sample_index[ear] += len(samples)
+        if not self.clients:
+            return
+
+        timestamp = time.time()
+        frames = {}  # (协议, 降采样倍数) -> 编码后的帧，同一批数据对所有客户端只编码一次
+        now = time.monotonic()
+        for client in list(self.clients):
+            if not self._adjust(client, now):
+                continue
+            key = (client.protocol, client.decimation)
+            if key not in frames:
+                k = client.decimation
+                first = -seq % k  # 绝对索引为 k 的倍数的第一个样本
+                frame = encode_frame(ear, seq + first, samples[first::k], self.sample_rate, k, timestamp)
+                frames[key] = ws_frame(frame) if client.protocol == "ws" else frame
+            client.push(frames[key])
+
+    def _adjust(self, client, now):
+        """根据待发送的数据量调整降采样倍数，积压过多时断开客户端，返回客户端是否保留"""
+        pending = client.pending
+        if pending >= self.queue_bytes:
+            print(f"流式客户端 {client.peer} 接收太慢，断开连接")
+            self.dropped_clients += 1
+            self._drop(client)
+            return False
+        elapsed = now - client.adjusted
+        if (pending > self.queue_bytes // 2 and pending > client.adjusted_pending
+                and client.decimation < self.max_decimation and elapsed >= 0.25):
+            client.decimation *= 2
+        elif pending < self.queue_bytes // 8 and client.decimation > 1 and elapsed >= 2.0:
+            client.decimation //= 2
+        else:
+            return True
+        client.adjusted = now
+        client.adjusted_pending = pending
+        return True
+
+    # ---------------- 连接处理 ----------------
+
+    async def _handle_tcp(self, reader, writer):
+        client = self._add(writer, "tcp")
+        try:
+            while await reader.read(1024):  # 客户端不需要发送数据，读到 EOF 说明已断开
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._drop(client)
+
+    async def _handle_ws(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        key = self._ws_key(request)
+        if key is None:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return
+        accept = base64.b64encode(hashlib.sha1(key + WS_GUID).digest())
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+
+        client = self._add(writer, "ws")
+        try:
+            await self._ws_receive(reader, client)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._drop(client)
+
+    @staticmethod
+    def _ws_key(request):
+        """检查 WebSocket 握手请求，返回 Sec-WebSocket-Key，不是握手请求时返回 None"""
+        lines = request.decode("latin-1").split("\r\n")
+        if not lines[0].startswith("GET "):
+            return None
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("upgrade", "").lower() != "websocket" or "sec-websocket-key" not in headers:
+            return None
+        return headers["sec-websocket-key"].encode()
+
+    async def _ws_receive(self, reader, client):
+        """处理客户端发来的帧：回应 ping，收到 close 后结束，其他数据忽略"""
+        while True:
+            b0, b1 = await reader.readexactly(2)
+            opcode, length = b0 & 0x0F, b1 & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await reader.readexactly(8))[0]
+            if length > WS_MAX_PAYLOAD:
+                return
+            mask = await reader.readexactly(4) if b1 & 0x80 else None
+            payload = await reader.readexactly(length)
+            if mask is not None:
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+            if opcode == 0x8:  # close
+                client.writer.write(ws_frame(payload[:2], 0x8))
+                return
+            if opcode == 0x9:  # ping
+                client.writer.write(ws_frame(payload, 0xA))
+
+    def _add(self, writer, protocol):
+        client = StreamClient(writer, protocol)
+        client.task = asyncio.ensure_future(self._send(client))
+        self.clients.add(client)
+        print(f"流式客户端已连接: {client.peer} ({protocol})")
+        return client
+
+    def _drop(self, client):
+        if client not in self.clients:
+            return
+        self.clients.discard(client)
+        client.queue.clear()
+        client.pending = 0
+        if client.task is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+        client.writer.close()
+
+    async def _send(self, client):
+        """发送任务：逐帧写入，等待写缓冲排空，慢客户端只会让自己的队列变长"""
+        try:
+            while True:
+                while not client.queue:
+                    client.ready.clear()
+                    await client.ready.wait()
+                client.writer.write(client.pop())
+                client.frames += 1
+                await client.writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._drop(client)
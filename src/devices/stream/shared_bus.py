@@ -0,0 +1,287 @@
+import atexit
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+EARS = ("left", "right")
+MAGIC = b"EEGBUS01"
+VERSION = 1
+
+# 共享内存布局: 文件头 | 每耳状态 | 每耳环形缓冲 (2 * capacity 个样本)
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("ears", "<u4"),
+    ("capacity", "<u8"),  # 每耳保留的样本数
+    ("sample_rate", "<f8"),
+    ("dtype", "S8"),  # 样本类型 (np.dtype.str)
+    ("closed", "<u4"),  # 写入者关闭后置 1
+    ("pad0", "V4"),
+    ("created", "<f8"),  # 当前写入者创建或接手总线的时间 (time.time)
+    ("pad1", "V8"),
+])
+EAR_DTYPE = np.dtype([
+    ("write_index", "<u8"),  # 已发布的样本数 (下一个样本的绝对索引)，数据写完后才更新
+    ("write_claim", "<u8"),  # 正在写入的批次结束后的样本数，写数据之前更新
+    ("batches", "<u8"),  # 已发布的批次数
+    ("gap_packets", "<u8"),  # 累计补齐的丢失包数
+    ("arrival_time", "<f8"),  # 最近一批最后一个包的到达时间 (time.perf_counter)
+    ("wall_time", "<f8"),  # 最近一批的发布时间 (time.time)
+    ("pad", "V16"),
+])
+DATA_OFFSET = HEADER_DTYPE.itemsize + EAR_DTYPE.itemsize * len(EARS)
+STALE_SECONDS = 5.0  # 未关闭的总线超过这么久没有发布数据，视为写入者已经退出
+
+_created = set()  # 本进程创建的总线名称
+
+
+def _layout(buf, capacity, dtype):
+    """在共享内存上建立 (文件头, 每耳状态, 每耳环形缓冲) 的 numpy 视图"""
+    header = np.ndarray((), dtype=HEADER_DTYPE, buffer=buf)
+    state = np.ndarray(len(EARS), dtype=EAR_DTYPE, buffer=buf, offset=HEADER_DTYPE.itemsize)
+    rings = np.ndarray((len(EARS), capacity * 2), dtype=dtype, buffer=buf, offset=DATA_OFFSET)
+    return header, state, rings
+
+
+def _attach(name):
+    """只读方式连接已有的共享内存，读者退出时不删除它"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    shm = shared_memory.SharedMemory(name)
+    # 3.13 之前读者进程也会登记到 resource_tracker，读者退出时会把写入者的共享内存一起删掉
+    # (同一进程中的读者与写入者共用登记，不能取消)
+    if os.name == "posix" and name not in _created:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedSampleBus:
+    """
+    共享内存样本总线 (写入端)：
+        把实时数据按耳写入 multiprocessing.shared_memory 中的环形缓冲，其他进程用 SharedSampleReader
+        按名称连接后读取，不经过 Qt 事件循环，也不占用界面进程的 GIL
+        - 样本用绝对索引 (从总线创建开始累计) 作为序号，与 SampleStore 的索引方式一致
+        - 环形缓冲与 SampleStore(ring=True) 一样每个样本写两份，任意不超过 capacity 的连续区间都是零拷贝切片
+        - 只允许一个写入者 (BLE 事件循环线程)，读者不加锁：写数据前先更新 write_claim，写完再更新 write_index，
+          读者复制后根据 write_claim 判断哪些样本在复制期间被覆盖
+    publish 的参数与 data_received_signal 的数据格式相同，可以直接作为 BluetoothDevice 的 sink:
+        bus = SharedSampleBus("ear_eeg")
+        device.add_sink(bus.publish)
+    """
+
+    def __init__(self, name, capacity=30000, sample_rate=500, dtype=np.float32):
+        if capacity <= 0:
+            raise ValueError(f"capacity 必须为正数，实际为 {capacity}")
+        self.name = name
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        size = DATA_OFFSET + len(EARS) * self.capacity * 2 * self.dtype.itemsize
+        try:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+            self.owner = True  # 自己创建的共享内存，关闭时删除
+        except FileExistsError:
+            # 同名总线已存在 (上次异常退出留下的，或仍被读者打开)：格式一致且没有其他写入者时接着使用，
+            # 样本索引从原来的位置继续，已连接的读者不受影响
+            self.shm = _attach(name)
+            self.owner = False
+            self._check_existing(size)
+        else:
+            _created.add(name)
+
+        self._header, self._state, self._rings = _layout(self.shm.buf, self.capacity, self.dtype)
+        if self.owner:
+            self._state[...] = np.zeros((), dtype=EAR_DTYPE)
+            self._header[()] = (MAGIC, VERSION, len(EARS), self.capacity, sample_rate,
+                                self.dtype.str.encode(), 0, b"\0" * 4, time.time(), b"\0" * 8)
+        else:
+            self._header["sample_rate"] = sample_rate
+            self._header["closed"] = 0
+            self._header["created"] = time.time()
+            # 上一个写入者可能在写入中途退出，未发布的部分作废
+            self._state["write_claim"] = self._state["write_index"]
+        atexit.register(self.close)
+
+    def _check_existing(self, size):
+        """
+        检查已存在的同名共享内存能否作为本总线使用，不能时关闭并抛出 ValueError:
+            - 格式 (标识、版本、容量、样本类型、大小) 必须一致
+            - 不能有仍在发布的写入者：已关闭 (closed=1)，或超过 STALE_SECONDS 没有发布 (写入者异常退出)
+              才能接手，否则两个写入者交错写入会破坏读者依赖的 write_claim/write_index 协议
+        """
+        expected = (MAGIC, VERSION, self.capacity, self.dtype.str.encode())
+        found = None
+        error = None
+        if self.shm.size >= DATA_OFFSET:
+            header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self.shm.buf)
+            state = np.ndarray(len(EARS), dtype=EAR_DTYPE, buffer=self.shm.buf, offset=HEADER_DTYPE.itemsize)
+            found = (header["magic"].item(), int(header["version"]), int(header["capacity"]), header["dtype"].item())
+            closed = bool(header["closed"])
+            # 刚创建/接手、还没有发布过数据的写入者按接手时间计算
+            idle = time.time() - max(float(header["created"]), float(state["wall_time"].max()))
+            del header, state
+        if found != expected or self.shm.size < size:
+            error = f"已被占用且格式不同 (期望 {expected}，实际 {found})"
+        elif not closed and idle < STALE_SECONDS:
+            error = f"正在被另一个写入者使用 ({idle:.1f} 秒前发布过数据)"
+        if error is not None:
+            self.shm.close()
+            self.shm = None
+            raise ValueError(f"共享内存 {self.name} {error}，请关闭使用它的程序或换一个总线名称")
+
+    def publish(self, data):
+        """写入一批数据 (PacketCoalescer 合并后的结果)，需在唯一的写入线程中调用"""
+        if self.shm is None:
+            return
+        ear = EARS.index(data["ear_side"])
+        samples = np.asarray(data["samples"], dtype=self.dtype).reshape(-1)
+        n = len(samples)
+        state = self._state[ear:ear + 1]
+        total = int(state["write_index"][0])
+        state["write_claim"] = total + n
+
+        capacity = self.capacity
+        begin = total
+        if n > capacity:
+            begin += n - capacity
+            samples = samples[-capacity:]
+        pos = begin % capacity
+        first = min(len(samples), capacity - pos)
+        ring = self._rings[ear]
+        for offset in (0, capacity):
+            ring[offset + pos:offset + pos + first] = samples[:first]
+            ring[offset:offset + len(samples) - first] = samples[first:]
+
+        arrival = data.get("arrival_time")
+        state["batches"] += 1
+        state["gap_packets"] += data.get("gap_packets", 0)
+        state["arrival_time"] = arrival[-1] if arrival is not None and len(arrival) else np.nan
+        state["wall_time"] = time.time()
+        state["write_index"] = total + n  # 最后更新：读者看到新的 write_index 时数据已经写完
+
+    def close(self, unlink=True):
+        """
+        关闭总线，读者会看到 closed 标志；unlink=True 时删除自己创建的共享内存 (已连接的读者仍可读完)，
+        沿用已存在的共享内存时不删除
+        """
+        if self.shm is None:
+            return
+        atexit.unregister(self.close)
+        self._header["closed"] = 1
+        self._header = self._state = self._rings = None
+        self.shm.close()
+        if unlink and self.owner:
+            self.shm.unlink()
+            _created.discard(self.name)
+        self.shm = None
+
+
+class SharedSampleReader:
+    """
+    共享内存样本总线 (读取端)，在任意进程中按名称连接 SharedSampleBus:
+        reader = SharedSampleReader("ear_eeg")
+        since = reader.write_index("left")
+        ...
+        start, samples = reader.read("left", since)  # 绝对索引 start 起的新样本
+        since = start + len(samples)
+    读出的起点晚于 since 说明读得太慢，中间的样本已被覆盖
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.shm = _attach(name)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self.shm.buf)
+        if header["magic"].item() != MAGIC or int(header["version"]) != VERSION:
+            del header
+            self.shm.close()
+            raise ValueError(f"{name} 不是样本总线 (或版本不兼容)")
+        self.capacity = int(header["capacity"])
+        self.sample_rate = float(header["sample_rate"])
+        self.dtype = np.dtype(header["dtype"].item().decode())
+        del header
+        self._header, self._state, self._rings = _layout(self.shm.buf, self.capacity, self.dtype)
+
+    @property
+    def closed(self):
+        """写入者是否已经关闭总线"""
+        return bool(self._header["closed"])
+
+    def write_index(self, ear):
+        """已发布的样本数，即下一个样本的绝对索引"""
+        return int(self._state["write_index"][EARS.index(ear)])
+
+    def info(self, ear):
+        """某只耳朵的发布状态 (批次数、补齐的丢包数、最近一批的到达/发布时间)"""
+        state = self._state[EARS.index(ear)]
+        return {name: state[name].item() for name in EAR_DTYPE.names if name != "pad"}
+
+    def view(self, ear, start, length):
+        """
+        按绝对索引读取 [start, start + length) 的零拷贝视图，超出可读范围的部分会被截掉
+        视图中的数据可能被后续写入覆盖，需要稳定的数据时使用 read
+        """
+        end = min(start + length, self.write_index(ear))
+        begin = max(start, end - self.capacity, 0)
+        if end <= begin:
+            return self._rings[0][:0]
+        pos = begin % self.capacity
+        return self._rings[EARS.index(ear)][pos:pos + end - begin]
+
+    def read(self, ear, since=0):
+        """复制绝对索引 since 之后已发布的样本，返回 (起点索引, 样本)；复制期间被覆盖的样本会被去掉"""
+        ear_index = EARS.index(ear)
+        end = self.write_index(ear)
+        begin = max(since, end - self.capacity, 0)
+        if end <= begin:
+            return end, self._rings[0][:0].copy()
+        pos = begin % self.capacity
+        samples = self._rings[ear_index][pos:pos + end - begin].copy()
+
+        # 复制期间写入者正在写或已写完的样本会覆盖 write_claim - capacity 之前的位置
+        lost = int(self._state["write_claim"][ear_index]) - self.capacity - begin
+        if lost > 0:
+            samples = samples[lost:]
+            begin += lost
+        return begin, samples
+
+    def latest(self, ear, count):
+        """最近 count 个样本，返回 (起点索引, 样本)"""
+        return self.read(ear, max(self.write_index(ear) - count, 0))
+
+    def follow(self, ear, since=None, interval=0.02):
+        """
+        持续读取新数据的生成器，每次产生 (起点索引, 样本)，写入者关闭后结束
+        since 为 None 时从当前位置开始
+        """
+        since = self.write_index(ear) if since is None else since
+        while True:
+            closed = self.closed
+            start, samples = self.read(ear, since)
+            if len(samples):
+                since = start + len(samples)
+                yield start, samples
+            elif closed:
+                return
+            else:
+                time.sleep(interval)
+
+    def close(self):
+        """断开连接 (不会删除共享内存)；view 返回的视图仍在使用时，映射会在视图释放后才解除"""
+        if self.shm is None:
+            return
+        self._header = self._state = self._rings = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,18 +3,16 @@ import os
 import sys
 
 import numpy as np
-from scipy.signal import butter, filtfilt
-from scipy.fft import fft
 
-import torch
-from torch.utils.data import TensorDataset, DataLoader
-from sklearn.model_selection import train_test_split
+from .stream.sequence import interpolate_nan
+from .stream.filters import zero_phase_band_pass
 
 
 def band_pass_filter(data, axis, fs, fmin, fmax):
-    b, a = butter(2, [fmin * 2 / fs, fmax * 2 / fs], 'bandpass')
-    filtered_data = filtfilt(b, a, data, axis=axis)
-    return filtered_data
+    if np.ndim(data) == 1:
+        data = interpolate_nan(data)  # 丢包补齐的 NaN 会让 filtfilt 输出全为 NaN
+    # 二阶节系数按 (阶数, 频带, fs) 缓存，不再每次调用都重新设计
+    return zero_phase_band_pass(data, axis=axis, fs=fs, fmin=fmin, fmax=fmax)
 
 def get_abs_path(relative_path):
     try:
@@ -29,6 +27,7 @@ def write_dict_to_json(data, file_path):
         json.dump(data, json_file, indent=4)
 
 def extract_fft_feature(data):
+    from scipy.fft import fft
     assert len(data.shape) == 3
     n_times = data.shape[2]
     fft_features = fft(data, axis=2)  # 对第三维时间轴进行FFT变换
@@ -36,9 +35,10 @@ def extract_fft_feature(data):
     return fft_magnitude[:, :, :n_times // 2 + 1]  # 只取前半部分频谱
 
 # 加载和预处理数据
-def load_and_preprocess_eegnet_data(left_data, right_data, info):
+def load_and_preprocess_eegnet_data(left_data, right_data, info, cache=None):
     """
     加载数据并提取特征
+    cache: 试次窗口缓存 (见 exp/epochs.py)，None 使用全局缓存，False 不使用缓存
     exp_info={
                 "action_map": self.ACTION,
                 "left_data_length": len(exp_left_data),
@@ -48,36 +48,15 @@ def load_and_preprocess_eegnet_data(left_data, right_data, info):
                 "mark": self.mark,
             }
     """
-    markers = info['mark']
-    sample_rate1 = info['left_sample_rate']
-    sample_rate2 = info['right_sample_rate']
-    twindow_sample = int(2 * sample_rate1)
-    twindow_sample2 = int(2 * sample_rate2)
-
-    left_data = band_pass_filter(left_data, axis=0, fs=sample_rate1, fmin=0.05,
-                                 fmax=100)
-    right_data = band_pass_filter(right_data, axis=0, fs=sample_rate2, fmin=0.05,
-                                 fmax=100)
-
-    X, X1, y = [], [], []
-    for m in markers:
-        start = m[0]
-        start1 = m[1]
-        end = start + twindow_sample
-        end1 = start1 + twindow_sample2
-        X.append(left_data[start:end])
-        X1.append(right_data[start1:end1])
-        y.append(m[2])
-
-
-    X = np.stack(X)
-    X1 = np.stack(X1)
-    y = np.array(y).astype(np.int64)
-    X = X.reshape(-1, twindow_sample, 1)  # (实验轮数*分类数, 1000(窗口大小), 1(通道))
-    X1 = X1.reshape(-1, twindow_sample, 1)  # (实验轮数*分类数, 1000(窗口大小), 1(通道))
-    X_train = np.concatenate((X1, X1),axis=2) # (实验轮数*分类数, 1000(窗口大小), 2(通道))
-
-    x_subject = np.rollaxis(X_train, 2, 1).astype(np.float32) # as.(40, 2, 1000)
+    # torch、sklearn 只在训练时才导入，不影响程序启动
+    import torch
+    from torch.utils.data import TensorDataset, DataLoader
+    from sklearn.model_selection import train_test_split
+
+    # 滤波和截取窗口的结果按数据内容和参数缓存在磁盘上，重复训练时直接读取
+    from .exp.epochs import extract_epochs
+    x_subject, y = extract_epochs(left_data, right_data, info, fmin=0.05, fmax=100, window_seconds=2,
+                                  channels=("right", "right"), cache=cache)  # as.(40, 2, 1000)
 
     x_train, x_val, y_train, y_val = train_test_split(x_subject, y, test_size=0.2, random_state=42)
     train_dataset = TensorDataset(torch.tensor(x_train), torch.tensor(y_train))
@@ -1,33 +1,30 @@
 import asyncio
 import numpy as np
 import random
-from scipy.signal import butter, filtfilt
 import time
-from PySide6.QtWidgets import QMessageBox, QTableWidgetItem
-from PySide6.QtCore import QThread, Signal, QObject
+from datetime import datetime
+from PySide6.QtWidgets import QInputDialog, QMessageBox, QTableWidgetItem
+from PySide6.QtCore import QThread, Signal, QObject, Qt
 
-from .devices import BluetoothDevice, BleConnectThread, BleGetMessageThread, EEGPlotter
-from .devices import ExperimentThread, TextToSpeechThread
-from .devices import SaveExpDataThread, SaveModelThread, EEGNet, TestModelThread
+from .devices import SessionManager, device_scanner
+from .devices.utils import get_abs_path, band_pass_filter
+from .devices import ExperimentThread, TextToSpeechThread, StreamRecorder, load_session
+from .devices import SampleStore, StreamingBandPass, EarAligner, SharedSampleBus
 
 
 
 
 class Signals(QObject):
-    # 绘图相关信号
-    left_plotter = Signal(list)  # 左耳数据绘图信号
-    right_plotter = Signal(list)  # 右耳数据绘图信号
-
     # 测试相关信号
     test_signal = Signal() # 测试信号
+    # 实验记录全部写入文件 (记录线程中发出)，参数为会话文件路径
+    recording_saved_signal = Signal(str)
 
 class Function:
 
     @staticmethod
     def band_pass_filter(data, axis, fs, fmin, fmax):
-        b, a = butter(2, [fmin * 2 / fs, fmax * 2 / fs], 'bandpass')
-        filtered_data = filtfilt(b, a, data, axis=axis)
-        return filtered_data
+        return band_pass_filter(data, axis=axis, fs=fs, fmin=fmin, fmax=fmax)
 
 
     def __init__(self, ui) -> None:
@@ -35,29 +32,77 @@ class Function:
         self.ble = None  # BLE 设备客户端
         self.signals = Signals()
 
-        self.connect_thread = None  # 连接线程
-        self.get_message_thread = None  # 获取数据线程
+        self.ble_controller = None  # BLE 命令接口 (所有 BLE 操作在共享事件循环线程中执行)
+        # 所有耳机共享一个 BLE 事件循环，界面上的设备是其中之一，数据由 Function 自己保存
+        self.session_manager = SessionManager()
+        self.session_stats = None  # 所有设备的汇总统计
+        self.session_manager.aggregate_stats_signal.connect(self._handle_aggregate_stats_signal)
+        # 设备地址缓存保存到文件，重启程序后也能按地址直接连接
+        device_scanner.cache_path = get_abs_path('ble_devices.json')
+        device_scanner.load(device_scanner.cache_path)
+        self.link_stats = None  # 最近一次链路统计
 
-        self.left_data = np.zeros((0))  # 左耳数据存储
+        self.SAMPLE_RATE = 500  # 采样率
+        # 内存中只保留最近10分钟数据 (实验期间也是)，完整的实验数据由 StreamRecorder 写入文件，
+        # 训练时从文件读取
+        self.LIVE_BUFFER_SECONDS = 600
+
+        # 测试窗口滤波方式:
+        #   "window" 只对标记窗口及前后补边做零相位滤波，与训练时的 filtfilt 一致 (默认)
+        #   "causal" 直接取随数据到达持续更新的因果滤波结果，计算量更小，但因果滤波有相位延迟
+        #            (低频成分延迟明显)，与零相位训练数据的波形不一致，只适用于按因果滤波训练的模型
+        self.TEST_FILTER_MODE = "window"
+        self.TEST_FILTER_PAD_SECONDS = 5  # 零相位窗口滤波的补边长度
+
+        # 环形缓冲，数据量不随在线时长和实验时长增长
+        self.left_data = self._new_store()  # 左耳数据存储
+        self.left_filtered = self._new_store()  # 左耳滤波后数据
         self.left_data_index = 0  # 左耳数据索引
-        self.right_data = np.zeros((0))  # 右耳数据存储
+        self.right_data = self._new_store()  # 右耳数据存储
+        self.right_filtered = self._new_store()  # 右耳滤波后数据
         self.right_data_index = 0  # 右耳数据索引
 
+        # 滤波器状态跨实验保持连续，与训练预处理使用相同的通带
+        self.left_filter = StreamingBandPass(fmin=0.05, fmax=100, fs=self.SAMPLE_RATE)
+        self.right_filter = StreamingBandPass(fmin=0.05, fmax=100, fs=self.SAMPLE_RATE)
+
+        self.gap_stats = self._new_gap_stats()  # 丢包统计
+        self.link_gaps = []  # 断线重连造成的数据中断
+        # 根据包到达时间估计两耳时钟，标记按同一时刻换算成各耳的样本索引
+        self.aligner = EarAligner(sample_rate=self.SAMPLE_RATE)
+
         self.left_data_plotter = None  # 左耳绘图器
         self.right_data_plotter = None  # 右耳绘图器
 
+        # 共享内存样本总线：实时数据同时发布到共享内存，其他进程 (分析、记录、其他分类器)
+        # 用 SharedSampleReader(SAMPLE_BUS_NAME) 读取；设为 None 时不发布
+        self.SAMPLE_BUS_NAME = "ear_eeg"
+        self.SAMPLE_BUS_SECONDS = 60  # 总线中每耳保留的数据时长
+        self.sample_bus = None
+
+        # 本机流式服务：设置端口后把解码后的数据以二进制帧 (StreamServer) 通过 TCP / WebSocket 发给其他程序
+        self.STREAM_TCP_PORT = None  # 例如 8764
+        self.STREAM_WS_PORT = None  # 例如 8765
+        self.stream_server = None
+
         self.exp_thread = None  # 实验线程
         self.mark = [] # 实验标记
-        self.save_expdata_thread = None # 储存实验数据
+        self.recorder = None # 实验过程中的流式记录 (实验数据只保存在记录文件中)
+        self.signals.recording_saved_signal.connect(self._handle_recording_saved)
+        self.subject = None # 被试编号，开始实验时输入，写入实验信息，供会话索引 (SessionCatalog) 筛选
+        self.RECORD_FLUSH_SECONDS = 2 # 流式记录的落盘间隔
         self.model = None # 模型
         self.train_and_save_model_thread = None # 训练模型
         self.test_model_thread = None # 测试模型线程
 
-        self.SAMPLE_RATE = 500  # 采样率
         self.ACTION = {"闭眼": 0, "咬牙": 1, "左看": 2, "右看": 3}
 
 
     def test_model(self):
+        # torch 在程序启动后由后台线程预加载 (devices.warm_up)，这里不会重复导入
+        from .devices import EEGNet, TestModelThread
+        if self.TEST_FILTER_MODE not in ("window", "causal"):
+            raise ValueError(f'TEST_FILTER_MODE 必须为 "window" 或 "causal"，实际为 {self.TEST_FILTER_MODE!r}')
         if self.model is None:
             self.model = EEGNet(final_feature_dim=len(self.ACTION))
         model_weight_path = 'E:/Desktop/Ear_EEG/exp_models/EEGNet/weight.pth'
@@ -70,6 +115,7 @@ class Function:
             print(f"Error loading model weights: {e}")
             return QMessageBox.warning(self.ui.page3, "模型加载失败", f"加载模型权重时出错：{e}")
         self.test_model_thread.model_result_signal.connect(self._handle_model_result_signal)
+        self.test_model_thread.start()  # 推理在独立线程中进行，界面线程只负责提交窗口
 
         self.ui.btn_start_exp.setEnabled(False)
         self.ui.btn_test_model.setEnabled(False)
@@ -101,22 +147,26 @@ class Function:
     def _handle_test_signal(self):
         lb, rb, label = self.mark[-1]
 
-        left_data = self.band_pass_filter(self.left_data, axis=0, fs=self.SAMPLE_RATE, fmin=0.05,
-                            fmax=100)
-        right_data = self.band_pass_filter(self.right_data, axis=0, fs=self.SAMPLE_RATE, fmin=0.05,
-                                 fmax=100)
-        left_test_data = left_data[lb: lb + self.SAMPLE_RATE * 2]
-        right_test_data = right_data[rb: rb + self.SAMPLE_RATE * 2]
+        window = self.SAMPLE_RATE * 2
+        if self.TEST_FILTER_MODE == "window":
+            pad = self.TEST_FILTER_PAD_SECONDS * self.SAMPLE_RATE
+            left_test_data = self.left_filter.filtfilt_window(self.left_data, lb, window, pad)
+            right_test_data = self.right_filter.filtfilt_window(self.right_data, rb, window, pad)
+        else:  # "causal"
+            left_test_data = self.left_filtered.window(lb, window)
+            right_test_data = self.right_filtered.window(rb, window)
 
         print(f'{lb}/{self.left_data_index}, {rb}/{self.right_data_index}')
 
-        self.test_model_thread.run(
+        self.test_model_thread.submit(
             left_test_data=left_test_data,
             right_test_data=right_test_data,
             label=label
         )
 
     def _handle_test_finished(self):
+        self.test_model_thread.stop()  # 等待队列中剩余的窗口推理完成
+        print(f"推理统计: {self.test_model_thread.stats()}")
         accurate_rate = self.test_model_thread.accurate_rate()
         QMessageBox.information(self.ui.page3, "测试结束", f"测试结束，模型准确率: {accurate_rate*100:.2f} %")
         self.ui.btn_start_exp.setEnabled(True)
@@ -133,11 +183,28 @@ class Function:
         开始实验按钮点击事件
         进行t轮实验，每轮4个动作，每个动作准备2秒，执行2秒，休息2秒
         '''
+        subject, ok = QInputDialog.getText(self.ui.page3, "开始实验", "被试编号 (可留空):", text=self.subject or "")
+        if not ok:
+            return
+        self.subject = subject.strip() or None
+
         self.ui.btn_start_exp.setText("实验进行中...")
         self.ui.btn_start_exp.setEnabled(False)
 
         self._reset_data()
 
+        # 实验数据边采集边写入文件，程序中途崩溃时可以用 read_recording 恢复
+        record_stem = get_abs_path(f"exp_data/exp_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
+        self.recorder = StreamRecorder(record_stem + ".eegrec", session_path=record_stem + ".eegs",
+                                       on_finished=self.signals.recording_saved_signal.emit, header={
+            "action_map": self.ACTION,
+            "subject": self.subject,
+            "sample_rate": self.SAMPLE_RATE,
+            "device_name": self.ble.device_name if self.ble else None,
+            "device_info": self.ble.notification_handler.device_info if self.ble else None,
+        }, flush_interval=self.RECORD_FLUSH_SECONDS)
+        self.recorder.start()
+
         TextToSpeechThread("实验即将开始，请做好准备").start()
 
         epochs = self.ui.btn_exp_cnt.value()
@@ -148,12 +215,25 @@ class Function:
         self.exp_thread.start()
 
     def _reset_data(self):
-        self.left_data = np.zeros((0))  # 左耳数据存储
+        # 存储重新从0开始，mark 中的索引即为存储和记录文件中的绝对索引
+        self.left_data = self._new_store()  # 左耳数据存储
+        self.left_filtered = self._new_store()  # 左耳滤波后数据
         self.left_data_index = 0  # 左耳数据索引
-        self.right_data = np.zeros((0))  # 右耳数据存储
+        self.right_data = self._new_store()  # 右耳数据存储
+        self.right_filtered = self._new_store()  # 右耳滤波后数据
         self.right_data_index = 0  # 右耳数据索引
+        self.gap_stats = self._new_gap_stats()  # 丢包统计
+        self.link_gaps = []  # 断线重连造成的数据中断
+        self.aligner.reset()  # 存储重新从0开始索引，时钟观测也要重新开始
         self.mark = [] # 实验标记
 
+    @staticmethod
+    def _new_gap_stats():
+        return {"left_gap_packets": 0, "left_gap_events": 0, "right_gap_packets": 0, "right_gap_events": 0}
+
+    def _new_store(self):
+        return SampleStore(self.LIVE_BUFFER_SECONDS * self.SAMPLE_RATE, ring=True)
+
     def _handle_update_label_signal(self, text, idx):
         speak = ["准备", "开始", "休息"]
         self.ui.label_exp_window.setText(text)
@@ -166,29 +246,48 @@ class Function:
             self.signals.test_signal.emit()
         TextToSpeechThread(speak[idx]).start()
 
-    def _handle_action_signal(self, action):
-        self.mark.append((self.left_data_index, self.right_data_index, self.ACTION[action]))
+    def _handle_action_signal(self, action, action_time):
+        # 时钟模型可用时按动作开始时刻换算两耳索引，否则退回信号到达时的数据长度
+        if self.aligner.ready:
+            left_index = self.aligner.index_at("left", action_time)
+            right_index = self.aligner.index_at("right", action_time)
+        else:
+            left_index, right_index = self.left_data_index, self.right_data_index
+        self.mark.append((left_index, right_index, self.ACTION[action]))
+        if self.recorder is not None:
+            self.recorder.add_marker(self.mark[-1], action=action, time=action_time)
    
     def _handle_exp_finished(self):
-        exp_left_data = self.left_data.copy()
-        exp_right_data = self.right_data.copy()
         exp_info={
                 "action_map": self.ACTION,
-                "left_data_length": len(exp_left_data),
-                "right_data_length": len(exp_right_data),
+                "subject": self.subject,
+                "left_data_length": self.left_data.total,
+                "right_data_length": self.right_data.total,
                 "left_sample_rate": 500,
                 "right_sample_rate": 500,
                 "mark": self.mark,
+                "gap_policy": self.ble.sequence["left"].policy if self.ble else None,
+                **self.gap_stats,
+                "link_gaps": self.link_gaps,
+                "clock": self.aligner.estimates(),
             }
-        # 保存实验数据(可用于后续离线数据处理)
-        self.save_expdata_thread = SaveExpDataThread()
-        self.save_expdata_thread.save_exp_data(
-            exp_left_data=exp_left_data,
-            exp_right_data=exp_right_data,
-            exp_info=exp_info
-        )
+        # 记录文件写完 (并转换为会话文件) 后再从文件读取数据训练，见 _handle_recording_saved
+        exp_info["recording"] = self.recorder.path
+        self.recorder.finalize(exp_info)
+        self.recorder = None
 
-        # 在线的训练并保存模型（weight会替换）
+        QMessageBox.information(self.ui.page3, "实验结束", "实验结束，感谢您的参与！")
+        self.ui.btn_start_exp.setText("开始实验")
+        self.ui.btn_start_exp.setEnabled(True)
+
+    def _handle_recording_saved(self, path):
+        '''
+        实验数据已全部写入文件：从文件读取两耳数据，在线训练并保存模型 (weight会替换)
+        '''
+        session_format = "eegs" if path.endswith(".eegs") else "eegrec"
+        exp_left_data, exp_right_data, exp_info = load_session({"path": path, "format": session_format})
+
+        from .devices import EEGNet, SaveModelThread
         self.model = EEGNet(final_feature_dim=len(self.ACTION))
         self.train_and_save_model_thread = SaveModelThread()
         self.train_and_save_model_thread.train_and_save_model(
@@ -200,10 +299,6 @@ class Function:
             epochs=100
         )
 
-        QMessageBox.information(self.ui.page3, "实验结束", "实验结束，感谢您的参与！")
-        self.ui.btn_start_exp.setText("开始实验")
-        self.ui.btn_start_exp.setEnabled(True)
-
 
     def connect_ble(self):
         '''
@@ -213,11 +308,24 @@ class Function:
         self.ui.btn_connect_ble.setEnabled(False)
         self.ui.btn_connect_ble.setText("连接中...")
         device_name = self.ui.btn_select_ble.currentText()
-        self.ble = BluetoothDevice(device_name)
-        self.connect_thread = BleConnectThread(self.ble)
-        self.connect_thread.finished.connect(self._handle_connect_result_signal)
+        self.session_manager.remove(device_name)  # 重新连接时使用新的设备对象，避免信号重复连接
+        session = self.session_manager.add(device_name, store_data=False)
+        self.ble = session.device
+        self.ble_controller = session.controller
+        self.ble_controller.command_finished.connect(self._handle_ble_command_finished)
         self.ble.device_info_signal.connect(self._handle_device_info_signal)
-        self.connect_thread.start()
+        self.ble_controller.connect()
+
+    def _handle_ble_command_finished(self, command, result):
+        '''
+        BLE 命令完成的回调，result 为命令返回值，出错时为异常对象
+        '''
+        if command == "connect":
+            if isinstance(result, Exception):
+                result = f"连接失败: {result}"
+            self._handle_connect_result_signal(result)
+        elif isinstance(result, Exception):
+            print(f"BLE 命令 {command} 出错: {result}")
 
 
     def _handle_connect_result_signal(self, result):
@@ -282,45 +390,139 @@ class Function:
         获取左右耳的 EEG 数据，并分别存储到left_data 和 right_data 变量中，
         终端打印出每秒的包计数, 并且把数据传给绘图器进行实时绘图
         '''
+        from .devices import EEGPlotter  # pyqtgraph 在程序启动后由后台线程预加载
         lowcut = self.ui.btn_lowcut_set.value()
         highcut = self.ui.btn_highcut_set.value()
         self.left_data_plotter = EEGPlotter(self.ui.left_plot_window, lowcut=lowcut, highcut=highcut)  # 左耳绘图器
         self.right_data_plotter = EEGPlotter(self.ui.right_plot_window, lowcut=lowcut, highcut=highcut, side="right")  # 右耳绘图器
-        self.signals.left_plotter.connect(self.left_data_plotter.update_plot)
-        self.signals.right_plotter.connect(self.right_data_plotter.update_plot)
 
-        self.get_message_thread = BleGetMessageThread(self.ble)
+        # 绘图器的滤波和写缓冲区直接在 BLE 线程中执行，界面线程只按定时器重绘
+        self.ble.data_received_signal.connect(self._feed_plotters, Qt.DirectConnection)
         self.ble.data_received_signal.connect(self._handle_data_received)
-        self.get_message_thread.start()
+        self.ble.stats_signal.connect(self._handle_stats_signal)
+        self.ble.state_signal.connect(self._handle_ble_state_signal)
+        self.ble.state_signal.connect(self._reset_plot_filters, Qt.DirectConnection)
+        self.ble.link_gap_signal.connect(self._handle_link_gap_signal)
+        # 每批数据在 BLE 线程中同时写入共享内存总线和流式服务
+        if self.SAMPLE_BUS_NAME and self.sample_bus is None:
+            try:
+                self.sample_bus = SharedSampleBus(self.SAMPLE_BUS_NAME, sample_rate=self.SAMPLE_RATE,
+                                                  capacity=self.SAMPLE_BUS_SECONDS * self.SAMPLE_RATE)
+            except (OSError, ValueError) as e:
+                # 总线只是附加的输出，创建失败时不影响数据接收
+                print(f"共享内存总线不可用，本次不发布数据: {e}")
+                self.SAMPLE_BUS_NAME = None
+        if self.sample_bus is not None:
+            self.ble.add_sink(self.sample_bus.publish)
+        if (self.STREAM_TCP_PORT or self.STREAM_WS_PORT) and self.stream_server is None:
+            from .devices import StreamServer
+            self.stream_server = StreamServer(tcp_port=self.STREAM_TCP_PORT, ws_port=self.STREAM_WS_PORT,
+                                              sample_rate=self.SAMPLE_RATE, ble_loop=self.session_manager.ble_loop)
+            self.stream_server.start()
+        if self.stream_server is not None:
+            self.ble.add_sink(self.stream_server.publish)
+        self.ble_controller.start_stream()
         self.ui.btn_get_message.setEnabled(False)
         self.ui.btn_get_message.setText("数据接收中...")
 
+    def _handle_aggregate_stats_signal(self, stats):
+        '''
+        处理多设备汇总统计 (SessionManager.aggregate_stats())
+        '''
+        self.session_stats = stats
+        if not stats["sustainable"]:
+            unhealthy = [name for name, device in stats["devices"].items() if not device["healthy"]]
+            print(f"丢包率超限的设备: {unhealthy}, 当前同时接收 {stats['streaming']} 个设备")
+
+    def _handle_ble_state_signal(self, state):
+        if state == "reconnecting":
+            # 断线前的数据已经处理完，滤波器从补齐的断线数据重新开始
+            self.left_filter.reset()
+            self.right_filter.reset()
+            self.ui.btn_get_message.setText("连接断开，重连中...")
+        elif state == "streaming":
+            self.ui.btn_get_message.setText("数据接收中...")
+        elif state == "disconnected":
+            self.ui.btn_get_message.setText("连接已断开")
+
+    def _reset_plot_filters(self, state):
+        '''
+        在 BLE 事件循环线程中调用 (与 EEGPlotter.ingest 同一线程)：断线时重置绘图器的滤波器
+        '''
+        if state == "reconnecting":
+            for plotter in (self.left_data_plotter, self.right_data_plotter):
+                if plotter is not None:
+                    plotter.signal_processor.reset()
+
+    def _handle_link_gap_signal(self, gap):
+        '''
+        断线重连成功：记录中断时的数据位置
+        断线期间的样本由 BluetoothDevice 按时钟估计补齐 (数据中的 outage_packets)，
+        样本索引仍与时间对应，时钟模型不需要重置
+        gap = {"start": 断线时刻, "end": 恢复时刻, "duration": 秒, "attempts": 重连次数}
+        '''
+        self.link_gaps.append({
+            "left_index": self.left_data.total,
+            "right_index": self.right_data.total,
+            "duration": gap["duration"],
+            "attempts": gap["attempts"],
+        })
+
+    def _handle_stats_signal(self, stats):
+        '''
+        处理链路统计信号 (LinkStatistics.snapshot())，最新结果保存在 link_stats 中
+        '''
+        self.link_stats = stats
+        left, right = stats["left"], stats["right"]
+        print(f"左耳: {left['packets_per_s']:.1f} 包/秒, 丢包 {left['dropped_packets']}, CRC失败 {left['crc_errors']} | "
+              f"右耳: {right['packets_per_s']:.1f} 包/秒, 丢包 {right['dropped_packets']}, CRC失败 {right['crc_errors']}")
+
+
+    def _feed_plotters(self, data):
+        '''
+        在 BLE 事件循环线程中调用：把数据交给对应耳朵的绘图器 (EEGPlotter.ingest)
+        '''
+        plotter = self.left_data_plotter if data["ear_side"] == "left" else self.right_data_plotter
+        if plotter is not None:
+            plotter.ingest(data["samples"])
 
     def _handle_data_received(self, data):
         '''
         处理接收到的数据，存储到对应的变量中
-        data: dict
+        data: dict，同一只耳朵若干个连续数据包合并后的结果
         {
             "ear_side": ear_side,
-            "protocol_cmd": protocol_cmd,
-            "data_length": data_length,
-            "lead_off": lead_off,
-            "packet_count": packet_count,
-            "samples": samples,
-            "sample_count": len(samples)
+            "samples": np.ndarray,
+            "sample_count": len(samples),
+            "packet_count": np.ndarray,  # 每个包的累加值
+            "lead_off": np.ndarray,  # 每个包的导联脱落位
+            "packets": 包数,
+            "gap_packets": 这批数据中补齐的丢失包数,
+            "gap_events": 这批数据中发生丢包的次数,
+            "outage_packets": 这批数据中补齐的断线期间的包数,
+            "packet_samples": np.ndarray,  # 每个包(含补齐样本)的样本数
+            "arrival_time": np.ndarray,  # 每个包的到达时间
         }
         '''
-        if data["ear_side"] == "left":
-            self.left_data = np.concatenate((self.left_data, np.array(data["samples"])))
+        side = data["ear_side"]
+        store = self.left_data if side == "left" else self.right_data
+        self.aligner.observe(side, store.total + np.cumsum(data["packet_samples"]), data["arrival_time"])
+        if self.recorder is not None:
+            self.recorder.append_samples(data, start_index=store.total)
+        if data.get("gap_packets"):
+            self.gap_stats[f"{side}_gap_packets"] += data["gap_packets"]
+            self.gap_stats[f"{side}_gap_events"] += data["gap_events"]
+        if side == "left":
+            self.left_data.append(data["samples"])
+            self.left_filtered.append(self.left_filter.process(data["samples"]))
             self.left_data_index += data["sample_count"]
-            if self.left_data_index % 5000 == 0:
+            if self.left_data_index % 5000 < data["sample_count"]:
                 print(f"左耳数据长度: {self.left_data_index}")
-            self.signals.left_plotter.emit(data["samples"])
             
-        elif data["ear_side"] == "right":
-            self.right_data = np.concatenate((self.right_data, np.array(data["samples"])))
+        elif side == "right":
+            self.right_data.append(data["samples"])
+            self.right_filtered.append(self.right_filter.process(data["samples"]))
             self.right_data_index += data["sample_count"]
-            if self.right_data_index % 5000 == 0:
+            if self.right_data_index % 5000 < data["sample_count"]:
                 print(f"右耳数据长度: {self.right_data_index}")
-            self.signals.right_plotter.emit(data["samples"])
 
@@ -1,26 +1,28 @@
-import numpy as np
-from devices import EEGNet, SaveModelThread
+from devices import EEGNet, SaveModelThread, SessionCatalog, load_session
+from devices.utils import get_abs_path
 import time
 
 
 if __name__ == "__main__":
-    import json
-
-
     model_type = "EEGNet"
-    left_data = np.load('E:/Desktop/Ear_EEG/exp_data/exp_2025_10_16_19_33_42_left.npy')
-    right_data = np.load('E:/Desktop/Ear_EEG/exp_data/exp_2025_10_16_19_33_42_right.npy')
-    with open("E:/Desktop/Ear_EEG/exp_data/exp_2025_10_16_19_33_42.json", 'r', encoding='utf-8') as load_f:
-        info = json.load(load_f)
-        model = EEGNet(final_feature_dim=len(info['action_map']))
-        save_model_thread = SaveModelThread()
-        save_model_thread.train_and_save_model(
-            exp_left_data=left_data,
-            exp_right_data=right_data,
-            exp_info=info,
-            model=model,
-            model_type=model_type,
-            epochs=100
-        )
-        while True:
-            time.sleep(1)
+    # 通过会话索引选择数据，不再写死文件路径
+    catalog = SessionCatalog(get_abs_path('exp_data'))
+    catalog.refresh()
+    sessions = catalog.query(min_trials=1, complete=True)
+    if not sessions:
+        raise SystemExit("exp_data 中没有可用的实验数据")
+    left_data, right_data, info = load_session(sessions[-1])
+    print(f"使用会话 {sessions[-1]['id']}: {sessions[-1]['action_counts']}")
+
+    model = EEGNet(final_feature_dim=len(info['action_map']))
+    save_model_thread = SaveModelThread()
+    save_model_thread.train_and_save_model(
+        exp_left_data=left_data,
+        exp_right_data=right_data,
+        exp_info=info,
+        model=model,
+        model_type=model_type,
+        epochs=100
+    )
+    while True:
+        time.sleep(1)